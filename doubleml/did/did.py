@@ -1,5 +1,4 @@
 import numpy as np
-from sklearn.utils import check_X_y
 from sklearn.utils.multiclass import type_of_target
 import warnings
 
@@ -7,7 +6,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _get_cond_smpls, _dml_tune, _trimm
+from ..utils._estimation import _dml_cv_predict_batch, _get_cond_smpls, _dml_tune, _trimm
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity
 
 
@@ -185,24 +184,36 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         return
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         # nuisance g
         # get train indices for d == 0
         smpls_d0, smpls_d1 = _get_cond_smpls(smpls, d)
 
+        # the nuisance models g0, g1 and m do not depend on each other and are fitted in one batch
+        cv_tasks = dict()
+        if external_predictions['ml_g0'] is None:
+            cv_tasks['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d0,
+                                 'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if external_predictions['ml_g1'] is None:
+            cv_tasks['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d1,
+                                 'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if (self.score == 'observational') and (external_predictions['ml_m'] is None):
+            cv_tasks['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m'],
+                                'return_models': return_models}
+        cv_res = _dml_cv_predict_batch(cv_tasks, n_jobs=n_jobs_cv)
+
         # nuisance g for d==0
         if external_predictions['ml_g0'] is not None:
             g_hat0 = {'preds': external_predictions['ml_g0'],
                       'targets': None,
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = cv_res['ml_g0']
 
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
@@ -215,9 +226,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = cv_res['ml_g1']
 
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
@@ -233,9 +242,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
                          'targets': None,
                          'models': None}
             else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                m_hat = cv_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
             m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
@@ -344,10 +351,8 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                          search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
         # get train indices for d == 0 and d == 1
         smpls_d0, smpls_d1 = _get_cond_smpls(smpls, d)
 
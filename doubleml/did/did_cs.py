@@ -1,5 +1,4 @@
 import numpy as np
-from sklearn.utils import check_X_y
 from sklearn.utils.multiclass import type_of_target
 import warnings
 
@@ -7,7 +6,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _trimm, _get_cond_smpls_2d, _dml_tune
+from ..utils._estimation import _dml_cv_predict_batch, _trimm, _get_cond_smpls_2d, _dml_tune
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity
 
 
@@ -199,12 +198,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
         return
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
-        x, t = check_X_y(x, self._dml_data.t,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        t = self._dml_data.t
 
         # THIS DIFFERS FROM THE PAPER due to stratified splitting this should be the same for each fold
         # nuisance estimates of the uncond. treatment prob.
@@ -219,15 +215,28 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
 
         # nuisance g
         smpls_d0_t0, smpls_d0_t1, smpls_d1_t0, smpls_d1_t1 = _get_cond_smpls_2d(smpls, d, t)
+
+        # the nuisance models g_d0_t0, g_d0_t1, g_d1_t0, g_d1_t1 and m do not depend on each other and are fitted in
+        # one batch
+        cv_tasks = dict()
+        for key, smpls_g in zip(['ml_g_d0_t0', 'ml_g_d0_t1', 'ml_g_d1_t0', 'ml_g_d1_t1'],
+                                [smpls_d0_t0, smpls_d0_t1, smpls_d1_t0, smpls_d1_t1]):
+            if external_predictions[key] is None:
+                cv_tasks[key] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_g,
+                                 'est_params': self._get_params(key), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if (self.score == 'observational') and (external_predictions['ml_m'] is None):
+            cv_tasks['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m'],
+                                'return_models': return_models}
+        cv_res = _dml_cv_predict_batch(cv_tasks, n_jobs=n_jobs_cv)
+
         if external_predictions['ml_g_d0_t0'] is not None:
             g_hat_d0_t0 = {'preds': external_predictions['ml_g_d0_t0'],
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d0_t0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d0_t0, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d0_t0'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
-
+            g_hat_d0_t0 = cv_res['ml_g_d0_t0']
             g_hat_d0_t0['targets'] = g_hat_d0_t0['targets'].astype(float)
             g_hat_d0_t0['targets'][np.invert((d == 0) & (t == 0))] = np.nan
         if external_predictions['ml_g_d0_t1'] is not None:
@@ -235,9 +244,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d0_t1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d0_t1, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d0_t1'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d0_t1 = cv_res['ml_g_d0_t1']
             g_hat_d0_t1['targets'] = g_hat_d0_t1['targets'].astype(float)
             g_hat_d0_t1['targets'][np.invert((d == 0) & (t == 1))] = np.nan
         if external_predictions['ml_g_d1_t0'] is not None:
@@ -245,9 +252,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d1_t0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d1_t0, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d1_t0'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d1_t0 = cv_res['ml_g_d1_t0']
             g_hat_d1_t0['targets'] = g_hat_d1_t0['targets'].astype(float)
             g_hat_d1_t0['targets'][np.invert((d == 1) & (t == 0))] = np.nan
         if external_predictions['ml_g_d1_t1'] is not None:
@@ -255,9 +260,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d1_t1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d1_t1, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d1_t1'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d1_t1 = cv_res['ml_g_d1_t1']
             g_hat_d1_t1['targets'] = g_hat_d1_t1['targets'].astype(float)
             g_hat_d1_t1['targets'][np.invert((d == 1) & (t == 1))] = np.nan
 
@@ -270,9 +273,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                          'targets': None,
                          'models': None}
             else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                m_hat = cv_res['ml_m']
                 _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
                 _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
             m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
@@ -476,12 +477,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                          search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
-        x, t = check_X_y(x, self._dml_data.t,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        t = self._dml_data.t
 
         if scoring_methods is None:
             scoring_methods = {'ml_g': None,
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import warnings
 import copy
+import time
 
 from sklearn.base import is_regressor, is_classifier
 
@@ -10,15 +11,22 @@ from scipy.stats import norm
 from statsmodels.stats.multitest import multipletests
 
 from abc import ABC, abstractmethod
-from scipy.optimize import minimize_scalar
 
 from .double_ml_data import DoubleMLBaseData, DoubleMLClusterData
 
-from .utils.resampling import DoubleMLResampling, DoubleMLClusterResampling
-from .utils._estimation import _draw_weights, _rmse, _aggregate_coefs_and_ses, _var_est, _set_external_predictions
+from .utils.resampling import DoubleMLResampling, DoubleMLClusterResampling, DoubleMLFolds, _as_folds
+from .utils._estimation import _draw_weight_chunks, _rmse, _aggregate_coefs_and_ses, _var_est, _set_external_predictions, \
+    _external_learners, _confounding_strength, _compute_boot_t_stats, _compute_gaussian_cov_boot_t_stats
+from .utils._random import _check_random_state, _spawn_seeds
 from .utils._checks import _check_in_zero_one, _check_integer, _check_float, _check_bool, _check_is_partition, \
     _check_all_smpls, _check_smpl_split, _check_smpl_split_tpl, _check_benchmarks, _check_external_predictions
 from .utils._plots import _sensitivity_contour_plot_static
+from .utils._config import _fit_config, _get_fit_config
+from .utils._shared_memory import _shared_arrays
+from .utils._checkpoint import _FitCheckpoint
+from .utils._parallel import _check_executor, _parallel_map, _check_n_jobs_budget, _split_n_jobs_budget, \
+    _thread_limits
+from .utils.fit_options import _check_fit_options
 from .utils.gain_statistics import gain_statistics
 
 _implemented_data_backends = ['DoubleMLData', 'DoubleMLClusterData']
@@ -64,6 +72,14 @@ class DoubleML(ABC):
 
         # initialize external predictions
         self._external_predictions_implemented = False
+        # treatments and learners with external predictions in the last fit (required for additional repetitions)
+        self._external_learners = dict()
+
+        # split of the CPU budget for fit and tune (only recorded if n_jobs_budget is set)
+        self._thread_budget = dict()
+
+        # convergence trace of the adaptive number of repetitions (only recorded for fit_adaptive)
+        self._adaptive_trace = None
 
         # check resampling specifications
         if not isinstance(n_folds, int):
@@ -95,6 +111,16 @@ class DoubleML(ABC):
         # default is no stratification
         self._strata = None
 
+        # storage precision of the arrays of shape (n_obs, n_rep, n_coefs)
+        self._dtype = np.dtype(np.float64)
+        self._all_coef_float64 = None
+        self._all_se_float64 = None
+
+        # in lean mode only the estimates and standard errors are stored
+        self._lean = False
+        # execution and storage options of the last fit
+        self._fit_options = None
+
         # perform sample splitting
         self._smpls = None
         self._smpls_cluster = None
@@ -234,6 +260,49 @@ class DoubleML(ABC):
         """
         return self._models
 
+    @property
+    def thread_budget(self):
+        """
+        The split of the CPU budget ``n_jobs_budget`` into parallel tasks (``n_jobs_outer``) and threads per task
+        (``n_jobs_inner``) for the last calls of :meth:`fit` and :meth:`tune`.
+        """
+        return self._thread_budget
+
+    @property
+    def fit_options(self):
+        """
+        The execution and storage options (:class:`doubleml.utils.DoubleMLFitOptions`) of the last call of :meth:`fit`.
+        """
+        return self._fit_options
+
+    @property
+    def dtype_accuracy_report(self):
+        """
+        Comparison of the estimates for the reduced storage precision (``dtype=np.float32`` in ``fit_options``) with the
+        estimates for the score elements in double precision. ``None`` if the model was fitted in double precision.
+        """
+        if self._all_coef_float64 is None:
+            return None
+        coef_float64, se_float64 = _aggregate_coefs_and_ses(self._all_coef_float64, self._all_se_float64,
+                                                            self._var_scaling_factor)
+        df_report = pd.DataFrame({'coef': self.coef,
+                                  'coef float64': coef_float64,
+                                  'abs diff coef': np.abs(self.coef - coef_float64),
+                                  'std err': self.se,
+                                  'std err float64': se_float64,
+                                  'abs diff std err': np.abs(self.se - se_float64)},
+                                 index=self._dml_data.d_cols)
+        return df_report
+
+    @property
+    def adaptive_trace(self):
+        """
+        The convergence trace of :meth:`fit_adaptive` with one row per step and treatment variable (number of
+        repetitions, elapsed time in seconds, aggregated coefficient and standard error and the change relative to
+        the previous step in units of the standard error).
+        """
+        return self._adaptive_trace
+
     def get_params(self, learner):
         """
         Get hyperparameters for the nuisance model of DoubleML models.
@@ -264,7 +333,17 @@ class DoubleML(ABC):
     @property
     def smpls(self):
         """
-        The partition used for cross-fitting.
+        The partition used for cross-fitting (a list of lists of tuples ``(train_ind, test_ind)``; one list per
+        repetition). The indices are derived from ``smpls_folds`` on every access.
+        """
+        return [list(smpl) if isinstance(smpl, DoubleMLFolds) else smpl for smpl in self.smpls_folds]
+
+    @property
+    def smpls_folds(self):
+        """
+        The partition used for cross-fitting as stored by the model: one :class:`doubleml.utils.DoubleMLFolds` object
+        (fold ids) per repetition. Sample splittings which cannot be represented by fold ids (e.g. for clustered data
+        or without cross-fitting) are stored as lists of tuples ``(train_ind, test_ind)``.
         """
         if self._smpls is None:
             if self._is_cluster_data:
@@ -425,17 +504,18 @@ class DoubleML(ABC):
 
     @property
     def __psi(self):
-        return self._psi[:, self._i_rep, self._i_treat]
+        return self._psi[:, self._i_rep, self._i_treat].astype(np.float64, copy=False)
 
     @property
     def __psi_deriv(self):
-        return self._psi_deriv[:, self._i_rep, self._i_treat]
+        return self._psi_deriv[:, self._i_rep, self._i_treat].astype(np.float64, copy=False)
 
     @property
     def __all_se(self):
         return self._all_se[self._i_treat, self._i_rep]
 
-    def fit(self, n_jobs_cv=None, store_predictions=True, external_predictions=None, store_models=False):
+    def fit(self, n_jobs_cv=None, store_predictions=True, external_predictions=None, store_models=False,
+            fit_options=None):
         """
         Estimate DoubleML models.
 
@@ -461,62 +541,465 @@ class DoubleML(ABC):
             corresponding learners.
             Default is `None`.
 
+        fit_options : None, dict or :class:`doubleml.utils.DoubleMLFitOptions`
+            The execution and storage options of the fit (parallel fit of the repetitions, executor, CPU budget,
+            shared memory, checkpoints, storage precision, lean mode and fold-contiguous data layout). A dict is
+            passed as keyword arguments to :class:`doubleml.utils.DoubleMLFitOptions`. ``None`` means the default
+            options. The options are available in ``fit_options`` after the fit.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
 
-        self._check_fit(n_jobs_cv, store_predictions, external_predictions, store_models)
+        fit_options = self._check_fit(n_jobs_cv, store_predictions, external_predictions, store_models, fit_options)
+        self._fit_options = fit_options
+        self._dtype = fit_options.dtype
+        self._lean = fit_options.lean
+        self._external_learners = _external_learners(external_predictions)
+        if self._lean:
+            store_predictions = False
+        checkpoint = None
+        if fit_options.checkpoint_dir is not None:
+            checkpoint = self._initialize_checkpoint(fit_options.checkpoint_dir, fit_options.resume, store_models)
+        self._dml_data._refresh_role_arrays()
         self._initalize_fit(store_predictions, store_models)
 
-        for i_rep in range(self.n_rep):
-            self._i_rep = i_rep
-            for i_d in range(self._dml_data.n_treat):
-                self._i_treat = i_d
+        self._fit_with_options(fit_options, n_jobs_cv, store_predictions, external_predictions, store_models,
+                               checkpoint)
 
-                # this step could be skipped for the single treatment variable case
+        # aggregated parameter estimates and standard errors from repeated cross-fitting
+        self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factor)
+
+        return self
+
+    def _fit_with_options(self, fit_options, n_jobs_cv, store_predictions, external_predictions, store_models,
+                          checkpoint=None, i_reps=None):
+        n_jobs_learner = None
+        if fit_options.n_jobs_budget is not None:
+            self._thread_budget['fit'] = _split_n_jobs_budget(fit_options.n_jobs_budget, n_tasks=self.n_folds)
+            n_jobs_cv = self._thread_budget['fit']['n_jobs_outer']
+            n_jobs_learner = self._thread_budget['fit']['n_jobs_inner']
+
+        with _shared_arrays(fit_options.shared_memory) as shared_arrays, _thread_limits(n_jobs_learner), \
+                _fit_config(shared_arrays=shared_arrays, executor=fit_options.executor, n_jobs_learner=n_jobs_learner,
+                            fold_contiguous=fit_options.fold_contiguous):
+            self._fit_nuisance_models(n_jobs_cv, store_predictions, external_predictions, store_models,
+                                      fit_options.n_jobs_models, checkpoint, i_reps)
+
+    def _fit_nuisance_models(self, n_jobs_cv, store_predictions, external_predictions, store_models, n_jobs_models,
+                             checkpoint=None, i_reps=None):
+        if i_reps is None:
+            i_reps = range(self.n_rep)
+        # the external predictions have one column per fitted repetition
+        ext_cols = {i_rep: i_col for i_col, i_rep in enumerate(i_reps)}
+        if n_jobs_models is None:
+            for i_rep in i_reps:
+                self._i_rep = i_rep
+                for i_d in range(self._dml_data.n_treat):
+                    self._i_treat = i_d
+
+                    # this step could be skipped for the single treatment variable case
+                    if self._dml_data.n_treat > 1:
+                        self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+
+                    if (checkpoint is not None) and checkpoint.is_completed(i_rep, i_d):
+                        score_elements, nuisance_predictions, coef_start_val = checkpoint.load_unit(i_rep, i_d)
+                        if self._score_type == 'nonlinear':
+                            self._coef_start_val = coef_start_val
+                    else:
+                        # predictions have to be stored in loop for sensitivity analysis
+                        score_elements, nuisance_predictions = self._fit_nuisance_and_score_elements(
+                            n_jobs_cv,
+                            self._unit_external_predictions(external_predictions, ext_cols[i_rep], i_d),
+                            store_models)
+                        if checkpoint is not None:
+                            coef_start_val = self._coef_start_val if self._score_type == 'nonlinear' else None
+                            checkpoint.save_unit(i_rep, i_d, score_elements, nuisance_predictions, coef_start_val)
+
+                    self._store_and_solve_unit(score_elements, nuisance_predictions, store_predictions, store_models)
+        else:
+            # parallel estimation of the nuisance models for all repetitions and treatment variables
+            fit_units = [(i_rep, i_d) for i_rep in i_reps for i_d in range(self._dml_data.n_treat)]
+            open_units = [(i_rep, i_d) for (i_rep, i_d) in fit_units
+                          if (checkpoint is None) or (not checkpoint.is_completed(i_rep, i_d))]
+            # the workers do not need the (large) arrays of the results
+            dml_workers = self._copy_without_results()
+            # the fit configuration is thread-local and has to be passed to the workers (the executor is only used
+            # for the outermost level of parallelism)
+            fit_config = _get_fit_config().copy()
+            fit_config['executor'] = None
+            fitted_units = _parallel_map(dml_workers._fit_nuisance_unit,
+                                         [(i_rep, i_d, n_jobs_cv,
+                                           self._unit_external_predictions(external_predictions, ext_cols[i_rep], i_d),
+                                           store_models, fit_config, checkpoint)
+                                          for (i_rep, i_d) in open_units],
+                                         n_jobs=n_jobs_models)
+            fitted_units = dict(zip(open_units, fitted_units))
+
+            # combine the results in the order of the sequential estimation
+            for (i_rep, i_d) in fit_units:
+                if (i_rep, i_d) in fitted_units:
+                    # the results are released unit by unit
+                    score_elements, preds, coef_start_val = fitted_units.pop((i_rep, i_d))
+                else:
+                    score_elements, preds, coef_start_val = checkpoint.load_unit(i_rep, i_d)
+                self._i_rep = i_rep
+                self._i_treat = i_d
                 if self._dml_data.n_treat > 1:
                     self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+                if self._score_type == 'nonlinear':
+                    self._coef_start_val = coef_start_val
 
-                # predictions have to be stored in loop for sensitivity analysis
-                nuisance_predictions = self._fit_nuisance_and_score_elements(
-                    n_jobs_cv,
-                    store_predictions,
-                    external_predictions,
-                    store_models)
+                if score_elements is None:
+                    # solved by the worker (lean mode)
+                    self._store_lean_unit(preds, store_models)
+                else:
+                    self._store_and_solve_unit(score_elements, preds, store_predictions, store_models)
+
+    def _store_lean_unit(self, unit_res, store_models):
+        self._all_coef[self._i_treat, self._i_rep] = unit_res['coef']
+        self._all_se[self._i_treat, self._i_rep] = unit_res['se']
+        self._var_scaling_factor = unit_res['var_scaling_factor']
+        for learner, rmse in unit_res['rmses'].items():
+            self._rmses[learner][self._i_rep, self._i_treat] = rmse
+        if store_models:
+            self._store_models(unit_res['models'])
 
-                self._solve_score_and_estimate_se()
+    def _store_and_solve_unit(self, score_elements, preds, store_predictions, store_models):
+        self._store_nuisance_and_score_elements(score_elements, preds, store_predictions, store_models)
+        self._solve_score_and_estimate_se(score_elements)
 
-                # sensitivity elements can depend on the estimated parameter
-                self._fit_sensitivity_elements(nuisance_predictions)
+        # sensitivity elements can depend on the estimated parameter
+        if not self._lean:
+            self._fit_sensitivity_elements(preds)
+
+    def add_repetitions(self, n_rep_add=None, all_smpls=None, n_jobs_cv=None, external_predictions=None,
+                        fit_options=None, random_state=None):
+        """
+        Add repetitions of the sample splitting to a fitted DoubleML model.
+
+        Only the nuisance models for the additional repetitions are estimated. The arrays of the fitted repetitions
+        (scores, predictions, models, estimates) are extended and the parameter estimates and standard errors are
+        aggregated over all repetitions. Bootstrap results and sensitivity parameters are reset.
+
+        Parameters
+        ----------
+        n_rep_add : None or int
+            The number of additional repetitions. The sample splits are drawn according to ``n_folds``. Cannot be
+            combined with ``all_smpls``.
+            Default is ``None``.
+
+        all_smpls : None or list
+            A nested list of lists of tuples (train_ind, test_ind) with one entry per additional repetition (see
+            :meth:`set_sample_splitting`). The number of folds has to be equal to ``n_folds``.
+            Default is ``None``.
+
+        n_jobs_cv : None or int
+            The number of CPUs to use to fit the learners (see :meth:`fit`).
+            Default is ``None``.
+
+        external_predictions : None or dict
+            The external predictions for the additional repetitions (see :meth:`fit`), with one column per additional
+            repetition. Have to be supplied for the same treatments and learners as in :meth:`fit`, such that all
+            repetitions are estimated in the same way.
+            Default is ``None``.
+
+        fit_options : None, dict or :class:`doubleml.utils.DoubleMLFitOptions`
+            The options for the additional repetitions (see :meth:`fit`). ``None`` means that the options of the last
+            call of :meth:`fit` (``fit_options``) are reused without the checkpoints. A dict replaces some of these
+            options (e.g. ``{'n_jobs_models': 2}``). The storage options ``dtype`` and ``lean`` cannot be changed and
+            checkpoints are not supported.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the sample splitting of the additional repetitions (see :meth:`draw_sample_splitting`). Cannot
+            be combined with ``all_smpls``.
+            Default is ``None``.
+
+        Returns
+        -------
+        self : object
+        """
+        if np.isnan(self.coef).all():
+            raise ValueError('Apply fit() before add_repetitions().')
+        if (n_rep_add is None) == (all_smpls is None):
+            raise ValueError('Exactly one of n_rep_add and all_smpls has to be specified.')
+        _check_random_state(random_state)
+        if (random_state is not None) and (all_smpls is not None):
+            raise ValueError('random_state cannot be combined with all_smpls.')
+        # the options of the fit are reused, where a dict only replaces some of them
+        fitted_options = self._fit_options.replace(checkpoint_dir=None, resume=False)
+        if fit_options is None:
+            fit_options = fitted_options
+        elif isinstance(fit_options, dict):
+            fit_options = fitted_options.replace(**fit_options)
+        fit_options = self._check_fit(n_jobs_cv, store_predictions=True, external_predictions=None, store_models=False,
+                                      fit_options=fit_options)
+        if fit_options.checkpoint_dir is not None:
+            raise ValueError('Checkpoints are not supported for additional repetitions.')
+        if (fit_options.dtype != fitted_options.dtype) or (fit_options.lean != fitted_options.lean):
+            raise ValueError('The storage options of the additional repetitions have to coincide with the fit. '
+                             f'Got dtype={str(fit_options.dtype)} and lean={str(fit_options.lean)} for the fit with '
+                             f'dtype={str(fitted_options.dtype)} and lean={str(fitted_options.lean)}.')
+        self._dml_data._refresh_role_arrays()
+        new_smpls, new_smpls_cluster = self._new_sample_splits(n_rep_add, all_smpls, random_state)
+        n_rep_add = len(new_smpls)
+        self._check_external_predictions_add(external_predictions, n_rep_add)
+        new_params = self._new_repetition_params(n_rep_add)
+
+        # fitted repetitions are kept, the additional repetitions are appended
+        i_reps = range(self.n_rep, self.n_rep + n_rep_add)
+        self._n_rep = self.n_rep + n_rep_add
+        self._smpls = self._smpls + new_smpls
+        if self._is_cluster_data:
+            self._smpls_cluster = self._smpls_cluster + new_smpls_cluster
+        self._params = new_params
+        self._extend_rep_axis(n_rep_add)
+
+        store_predictions = self._predictions is not None
+        store_models = self._models is not None
+        self._fit_with_options(fit_options, n_jobs_cv, store_predictions, external_predictions, store_models,
+                               i_reps=i_reps)
 
-        # aggregated parameter estimates and standard errors from repeated cross-fitting
         self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factor)
+        self._n_rep_boot, self._boot_t_stat = self._initialize_boot_arrays(n_rep_boot=500)
+        self._boot_method = None
+        self._sensitivity_params = None
+
+        return self
+
+    def fit_adaptive(self, tol=0.01, max_n_rep=50, max_time=None, n_rep_step=1, n_jobs_cv=None, store_predictions=True,
+                     store_models=False, fit_options=None, random_state=None):
+        """
+        Estimate DoubleML models with an adaptive number of repetitions for the sample splitting.
+
+        The model is fitted with the current ``n_rep`` and repetitions are added (see :meth:`add_repetitions`) until
+        the aggregated coefficients and standard errors change by less than ``tol`` standard errors between two steps
+        or a budget (``max_n_rep`` or ``max_time``) is exhausted. The trace is available in ``adaptive_trace``.
+
+        Parameters
+        ----------
+        tol : float
+            The tolerance for the maximal absolute change of the aggregated coefficients and standard errors, relative
+            to the standard errors (absolute change for standard errors of zero).
+            Default is ``0.01``.
+
+        max_n_rep : int
+            The maximal number of repetitions.
+            Default is ``50``.
+
+        max_time : None or float
+            The maximal time in seconds after which no further repetitions are added. ``None`` means no time limit.
+            Default is ``None``.
+
+        n_rep_step : int
+            The number of repetitions added per step.
+            Default is ``1``.
+
+        n_jobs_cv : None or int
+            The number of CPUs to use to fit the learners (see :meth:`fit`).
+            Default is ``None``.
+
+        store_predictions : bool
+            Indicates whether the predictions for the nuisance functions should be stored in ``predictions``.
+            Default is ``True``.
+
+        store_models : bool
+            Indicates whether the fitted models for the nuisance functions should be stored in ``models``.
+            Default is ``False``.
+
+        fit_options : None, dict or :class:`doubleml.utils.DoubleMLFitOptions`
+            The execution and storage options of the fit (see :meth:`fit`), which are reused for the added
+            repetitions. Checkpoints are not supported.
+            Default is ``None``.
 
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the sample splitting of the added repetitions. Every step draws its splits from its own child
+            random stream (spawned from ``random_state``), such that the trace only depends on the initial sample
+            splitting and ``random_state``. ``None`` means that the global random state of :mod:`numpy` is used.
+            Default is ``None``.
+
+        Returns
+        -------
+        self : object
+        """
+        _check_float(tol, 'tol', lower_bound=0.)
+        _check_integer(max_n_rep, 'max_n_rep', lower_bound=self.n_rep)
+        if max_time is not None:
+            if not isinstance(max_time, (int, float)):
+                raise TypeError('max_time must be None or a number. '
+                                f'{str(max_time)} of type {str(type(max_time))} was passed.')
+            if max_time <= 0:
+                raise ValueError(f'max_time must be positive. {str(max_time)} was passed.')
+        _check_integer(n_rep_step, 'n_rep_step', lower_bound=1)
+        fit_options = _check_fit_options(fit_options)
+        if fit_options.checkpoint_dir is not None:
+            raise ValueError('Checkpoints are not supported for fit_adaptive().')
+        _check_random_state(random_state)
+        # one child random stream per step (at most one step per n_rep_step additional repetitions)
+        n_steps = -(-(max_n_rep - self.n_rep) // n_rep_step)
+        if random_state is None:
+            step_seeds = [None] * n_steps
+        else:
+            step_seeds = _spawn_seeds(random_state, n_steps)
+
+        start_time = time.perf_counter()
+        self.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models,
+                 fit_options=fit_options)
+        trace = [self._adaptive_trace_step(time.perf_counter() - start_time, coef_prev=None, se_prev=None)]
+        converged = False
+        i_step = 0
+        while (not converged) and (self.n_rep < max_n_rep):
+            if (max_time is not None) and (time.perf_counter() - start_time >= max_time):
+                break
+            coef_prev, se_prev = self.coef.copy(), self.se.copy()
+            # the options of the fit are reused
+            self.add_repetitions(n_rep_add=min(n_rep_step, max_n_rep - self.n_rep), n_jobs_cv=n_jobs_cv,
+                                 random_state=step_seeds[i_step])
+            i_step += 1
+            trace.append(self._adaptive_trace_step(time.perf_counter() - start_time, coef_prev, se_prev))
+            converged = trace[-1]['change'].max() < tol
+
+        self._adaptive_trace = pd.concat(trace, ignore_index=True)
         return self
 
-    def bootstrap(self, method='normal', n_rep_boot=500):
+    def _adaptive_trace_step(self, elapsed_time, coef_prev, se_prev):
+        if coef_prev is None:
+            change = np.full(self._dml_data.n_coefs, np.nan)
+        else:
+            change = np.maximum(np.abs(self.coef - coef_prev), np.abs(self.se - se_prev))
+            # without a positive standard error (e.g. constant scores) the absolute change is used
+            positive_se = se_prev > 0
+            change[positive_se] = change[positive_se] / se_prev[positive_se]
+        return pd.DataFrame({'n_rep': self.n_rep,
+                             'time': elapsed_time,
+                             'treatment': self._dml_data.d_cols,
+                             'coef': self.coef,
+                             'std err': self.se,
+                             'change': change})
+
+    def _new_sample_splits(self, n_rep_add, all_smpls, random_state=None):
+        if all_smpls is None:
+            _check_integer(n_rep_add, 'The number of additional repetitions', lower_bound=1)
+            if self._is_cluster_data:
+                obj_dml_resampling = DoubleMLClusterResampling(n_folds=self._n_folds_per_cluster,
+                                                               n_rep=n_rep_add,
+                                                               n_obs=self._dml_data.n_obs,
+                                                               n_cluster_vars=self._dml_data.n_cluster_vars,
+                                                               cluster_vars=self._dml_data.cluster_vars,
+                                                               random_state=random_state)
+                return obj_dml_resampling.split_samples()
+            obj_dml_resampling = DoubleMLResampling(n_folds=self.n_folds,
+                                                    n_rep=n_rep_add,
+                                                    n_obs=self._dml_data.n_obs,
+                                                    stratify=self._strata,
+                                                    random_state=random_state)
+            return obj_dml_resampling.split_samples(), None
+
+        if self._is_cluster_data:
+            raise NotImplementedError('Externally setting the sample splitting for DoubleML is '
+                                      'not yet implemented with clustering.')
+        if (not isinstance(all_smpls, list)) or \
+                (not all([isinstance(smpl, DoubleMLFolds) or
+                          (isinstance(smpl, list) and all([isinstance(tpl, tuple) and len(tpl) == 2 for tpl in smpl]))
+                          for smpl in all_smpls])):
+            raise TypeError('all_smpls must be a list of lists of tuples (train_ind, test_ind).')
+        if not all([len(smpl) == self.n_folds for smpl in all_smpls]):
+            raise ValueError('Invalid partition provided. '
+                             f'The number of folds of all additional repetitions has to be {self.n_folds}.')
+        all_smpls = _check_all_smpls(all_smpls, self._dml_data.n_obs)
+        if not all([_check_is_partition(smpl, self._dml_data.n_obs) for smpl in all_smpls]):
+            raise ValueError('Invalid partition provided. '
+                             'At least one inner list does not form a partition.')
+        return [_as_folds(smpl, self._dml_data.n_obs) for smpl in
+                _check_all_smpls(all_smpls, self._dml_data.n_obs, check_intersect=True)], None
+
+    def _new_repetition_params(self, n_rep_add):
+        # hyperparameters can only be transferred to new sample splits if they do not depend on the repetition
+        new_params = dict()
+        for learner, learner_params in self._params.items():
+            new_params[learner] = dict()
+            for treat_var, params in learner_params.items():
+                if not all([rep_params == params[0] for rep_params in params]):
+                    raise ValueError(f'The hyperparameters of learner {learner} for treatment variable {treat_var} '
+                                     'differ between repetitions (e.g. tuned on folds) and cannot be used for '
+                                     'additional repetitions. Set the hyperparameters via set_ml_nuisance_params().')
+                new_params[learner][treat_var] = list(params) + [params[0]] * n_rep_add
+        return new_params
+
+    def _extend_rep_axis(self, n_rep_add):
+        def extend(arr, axis):
+            shape = list(arr.shape)
+            shape[axis] = n_rep_add
+            return np.concatenate((arr, np.full(shape, np.nan, dtype=arr.dtype)), axis=axis)
+
+        if not self._lean:
+            self._psi = extend(self._psi, axis=1)
+            self._psi_deriv = extend(self._psi_deriv, axis=1)
+            self._psi_elements = {key: extend(value, axis=1) for key, value in self._psi_elements.items()}
+        self._all_coef = extend(self._all_coef, axis=1)
+        self._all_se = extend(self._all_se, axis=1)
+        if self._all_coef_float64 is not None:
+            self._all_coef_float64 = extend(self._all_coef_float64, axis=1)
+            self._all_se_float64 = extend(self._all_se_float64, axis=1)
+        self._rmses = {learner: extend(value, axis=0) for learner, value in self._rmses.items()}
+        if self._predictions is not None:
+            self._predictions = {learner: extend(value, axis=1) for learner, value in self._predictions.items()}
+            self._nuisance_targets = {learner: extend(value, axis=1)
+                                      for learner, value in self._nuisance_targets.items()}
+        if self._models is not None:
+            self._models = {learner: {treat_var: models + [None] * n_rep_add
+                                      for treat_var, models in learner_models.items()}
+                            for learner, learner_models in self._models.items()}
+        if self._sensitivity_elements is not None:
+            self._sensitivity_elements = {key: extend(value, axis=1)
+                                          for key, value in self._sensitivity_elements.items()}
+
+    def bootstrap(self, method='normal', n_rep_boot=500, executor=None, chunk_size=None, random_state=None):
         """
         Multiplier bootstrap for DoubleML models.
 
         Parameters
         ----------
         method : str
-            A str (``'Bayes'``, ``'normal'`` or ``'wild'``) specifying the multiplier bootstrap method.
+            A str (``'Bayes'``, ``'normal'``, ``'wild'`` or ``'gaussian-cov'``) specifying the multiplier bootstrap
+            method. For ``'gaussian-cov'`` the bootstrapped t-statistics of the ``'normal'`` method are drawn directly
+            from their Gaussian distribution, whose covariance is estimated once from the scores. This avoids drawing
+            weights for all observations.
             Default is ``'normal'``
 
         n_rep_boot : int
             The number of bootstrap replications.
 
+        executor : None, str or executor
+            The executor for the bootstrap tasks, where a task is one block of (at most ``chunk_size``) bootstrap
+            replications of one repetition (see :meth:`fit`). The weights are always drawn in the calling process.
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of bootstrap replications for which the multiplier weights are drawn at once, i.e., the
+            weights are held in memory as blocks of shape ``(chunk_size, n_obs)``. The bootstrap results do not depend
+            on ``chunk_size``. ``None`` means that the weights of all ``n_rep_boot`` replications are drawn at once.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the bootstrap weights. The weights of every repetition are drawn from its own child random
+            stream (spawned from ``random_state``). ``None`` means that the weights are drawn from the global random
+            state of :mod:`numpy`.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
         if np.isnan(self.coef).all():
             raise ValueError('Apply fit() before bootstrap().')
+        self._check_not_lean('bootstrap()')
 
-        if (not isinstance(method, str)) | (method not in ['Bayes', 'normal', 'wild']):
-            raise ValueError('Method must be "Bayes", "normal" or "wild". '
+        if (not isinstance(method, str)) | (method not in ['Bayes', 'normal', 'wild', 'gaussian-cov']):
+            raise ValueError('Method must be "Bayes", "normal", "wild" or "gaussian-cov". '
                              f'Got {str(method)}.')
 
         if not isinstance(n_rep_boot, int):
@@ -525,21 +1008,33 @@ class DoubleML(ABC):
         if n_rep_boot < 1:
             raise ValueError('The number of bootstrap replications must be positive. '
                              f'{str(n_rep_boot)} was passed.')
+        if chunk_size is not None:
+            _check_integer(chunk_size, 'chunk_size', lower_bound=1)
+        _check_random_state(random_state)
         if self._is_cluster_data:
             raise NotImplementedError('bootstrap not yet implemented with clustering.')
+        _check_executor(executor)
 
         self._n_rep_boot, self._boot_t_stat = self._initialize_boot_arrays(n_rep_boot)
 
-        for i_rep in range(self.n_rep):
-            self._i_rep = i_rep
-            weights = _draw_weights(method, n_rep_boot, n_obs=self._dml_data.n_obs)
+        if method == 'gaussian-cov':
+            # standard normal draws per coefficient (instead of weights per observation)
+            boot_func, weight_method, n_weights = _compute_gaussian_cov_boot_t_stats, 'normal', self._dml_data.n_coefs
+        else:
+            boot_func, weight_method, n_weights = _compute_boot_t_stats, method, self._dml_data.n_obs
 
-            for i_d in range(self._dml_data.n_treat):
-                self._i_treat = i_d
-                i_start = self._i_rep * self.n_rep_boot
-                i_end = (self._i_rep + 1) * self.n_rep_boot
-                self._boot_t_stat[self._i_treat, i_start:i_end] =\
-                    self._compute_bootstrap(weights)
+        # one task per block of at most chunk_size bootstrap replications of one repetition; the weights are drawn
+        # lazily in the calling process (from the global random state or from the random stream of the repetition),
+        # such that the results neither depend on the executor nor on chunk_size
+        rep_seeds = [None] * self.n_rep if random_state is None else _spawn_seeds(random_state, self.n_rep)
+        boot_args = ((weights, self._psi[:, i_rep, :], self._psi_deriv[:, i_rep, :], self._all_se[:, i_rep],
+                      self._dml_data.n_obs)
+                     for i_rep, rep_seed in enumerate(rep_seeds)
+                     for weights in _draw_weight_chunks(weight_method, n_rep_boot, n_weights, chunk_size, rep_seed))
+        with _fit_config(executor=executor):
+            boot_t_stats = _parallel_map(boot_func, boot_args)
+
+        self._boot_t_stat[:] = np.concatenate(boot_t_stats, axis=1)
 
         self._boot_method = method
         return self
@@ -664,7 +1159,10 @@ class DoubleML(ABC):
              n_iter_randomized_search=100,
              n_jobs_cv=None,
              set_as_params=True,
-             return_tune_res=False):
+             return_tune_res=False,
+             executor=None,
+             n_jobs_budget=None,
+             random_state=None):
         """
         Hyperparameter-tuning for DoubleML models.
 
@@ -712,6 +1210,22 @@ class DoubleML(ABC):
             Indicates whether detailed tuning results should be returned.
             Default is ``False``.
 
+        executor : None, str or executor
+            The executor for the fold-wise searches (see :meth:`fit`). With a custom executor, the folds for tuning
+            are drawn before the searches are dispatched.
+            Default is ``None``.
+
+        n_jobs_budget : None or int
+            The total number of CPUs (``-1`` means all CPUs), which is split between the parallel searches (replaces
+            ``n_jobs_cv``) and the threads of the learners (see :meth:`fit`).
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the folds for tuning and the randomized search. Every treatment variable (and repetition if
+            ``tune_on_folds=True``) and every fold uses its own child random stream (spawned from ``random_state``).
+            ``None`` means that the global random state of :mod:`numpy` is used.
+            Default is ``None``.
+
         Returns
         -------
         self : object
@@ -773,51 +1287,73 @@ class DoubleML(ABC):
             raise TypeError('return_tune_res must be True or False. '
                             f'Got {str(return_tune_res)}.')
 
+        _check_executor(executor)
+        _check_n_jobs_budget(n_jobs_budget)
+        _check_random_state(random_state)
+        n_jobs_learner = None
+        if n_jobs_budget is not None:
+            if n_jobs_cv is not None:
+                raise ValueError('n_jobs_budget cannot be combined with n_jobs_cv.')
+            self._thread_budget['tune'] = _split_n_jobs_budget(n_jobs_budget, n_tasks=n_folds_tune)
+            n_jobs_cv = self._thread_budget['tune']['n_jobs_outer']
+            n_jobs_learner = self._thread_budget['tune']['n_jobs_inner']
+
+        self._dml_data._refresh_role_arrays()
         if tune_on_folds:
             tuning_res = [[None] * self.n_rep] * self._dml_data.n_treat
         else:
             tuning_res = [None] * self._dml_data.n_treat
 
-        for i_d in range(self._dml_data.n_treat):
-            self._i_treat = i_d
-            # this step could be skipped for the single treatment variable case
-            if self._dml_data.n_treat > 1:
-                self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+        # one child random stream per treatment variable and repetition
+        if random_state is None:
+            unit_seeds = [[None] * self.n_rep] * self._dml_data.n_treat
+        else:
+            unit_seeds = [treat_seed.spawn(self.n_rep)
+                          for treat_seed in _spawn_seeds(random_state, self._dml_data.n_treat)]
+
+        with _thread_limits(n_jobs_learner), _fit_config(executor=executor, n_jobs_learner=n_jobs_learner):
+            for i_d in range(self._dml_data.n_treat):
+                self._i_treat = i_d
+                # this step could be skipped for the single treatment variable case
+                if self._dml_data.n_treat > 1:
+                    self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
 
-            if tune_on_folds:
-                nuisance_params = list()
-                for i_rep in range(self.n_rep):
-                    self._i_rep = i_rep
+                if tune_on_folds:
+                    nuisance_params = list()
+                    for i_rep in range(self.n_rep):
+                        self._i_rep = i_rep
 
-                    # tune hyperparameters
-                    res = self._nuisance_tuning(self.__smpls,
-                                                param_grids, scoring_methods,
-                                                n_folds_tune,
-                                                n_jobs_cv,
-                                                search_mode, n_iter_randomized_search)
+                        # tune hyperparameters
+                        with _fit_config(random_state=unit_seeds[i_d][i_rep]):
+                            res = self._nuisance_tuning(self.__smpls,
+                                                        param_grids, scoring_methods,
+                                                        n_folds_tune,
+                                                        n_jobs_cv,
+                                                        search_mode, n_iter_randomized_search)
 
-                    tuning_res[i_rep][i_d] = res
-                    nuisance_params.append(res['params'])
+                        tuning_res[i_rep][i_d] = res
+                        nuisance_params.append(res['params'])
 
-                if set_as_params:
-                    for nuisance_model in nuisance_params[0].keys():
-                        params = [x[nuisance_model] for x in nuisance_params]
-                        self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params)
+                    if set_as_params:
+                        for nuisance_model in nuisance_params[0].keys():
+                            params = [x[nuisance_model] for x in nuisance_params]
+                            self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params)
 
-            else:
-                smpls = [(np.arange(self._dml_data.n_obs), np.arange(self._dml_data.n_obs))]
-                # tune hyperparameters
-                res = self._nuisance_tuning(smpls,
-                                            param_grids, scoring_methods,
-                                            n_folds_tune,
-                                            n_jobs_cv,
-                                            search_mode, n_iter_randomized_search)
-                tuning_res[i_d] = res
-
-                if set_as_params:
-                    for nuisance_model in res['params'].keys():
-                        params = res['params'][nuisance_model]
-                        self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params[0])
+                else:
+                    smpls = [(np.arange(self._dml_data.n_obs), np.arange(self._dml_data.n_obs))]
+                    # tune hyperparameters
+                    with _fit_config(random_state=unit_seeds[i_d][0]):
+                        res = self._nuisance_tuning(smpls,
+                                                    param_grids, scoring_methods,
+                                                    n_folds_tune,
+                                                    n_jobs_cv,
+                                                    search_mode, n_iter_randomized_search)
+                    tuning_res[i_d] = res
+
+                    if set_as_params:
+                        for nuisance_model in res['params'].keys():
+                            params = res['params'][nuisance_model]
+                            self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params[0])
 
         if return_tune_res:
             return tuning_res
@@ -925,7 +1461,7 @@ class DoubleML(ABC):
 
         return learner_is_classifier
 
-    def _check_fit(self, n_jobs_cv, store_predictions, external_predictions, store_models):
+    def _check_fit(self, n_jobs_cv, store_predictions, external_predictions, store_models, fit_options=None):
         if n_jobs_cv is not None:
             if not isinstance(n_jobs_cv, int):
                 raise TypeError('The number of CPUs used to fit the learners must be of int type. '
@@ -939,6 +1475,10 @@ class DoubleML(ABC):
             raise TypeError('store_models must be True or False. '
                             f'Got {str(store_models)}.')
 
+        fit_options = _check_fit_options(fit_options)
+        if (fit_options.n_jobs_budget is not None) and (n_jobs_cv is not None):
+            raise ValueError('n_jobs_budget cannot be combined with n_jobs_cv or n_jobs_models.')
+
         # check if external predictions are implemented
         if self._external_predictions_implemented:
             _check_external_predictions(external_predictions=external_predictions,
@@ -949,10 +1489,73 @@ class DoubleML(ABC):
         elif not self._external_predictions_implemented and external_predictions is not None:
             raise NotImplementedError(f"External predictions not implemented for {self.__class__.__name__}.")
 
+        return fit_options
+
+    def _check_external_predictions_add(self, external_predictions, n_rep_add):
+        if self._external_predictions_implemented:
+            _check_external_predictions(external_predictions=external_predictions,
+                                        valid_treatments=self._dml_data.d_cols,
+                                        valid_learners=self.params_names,
+                                        n_obs=self._dml_data.n_obs,
+                                        n_rep=n_rep_add)
+        elif external_predictions is not None:
+            raise NotImplementedError(f"External predictions not implemented for {self.__class__.__name__}.")
+
+        ext_learners = _external_learners(external_predictions)
+        if ext_learners != self._external_learners:
+            raise ValueError('Invalid external_predictions. The additional repetitions require external predictions '
+                             f'for the same treatments and learners as the fit ({str(self._external_learners)}). '
+                             f'External predictions for {str(ext_learners)} were passed.')
+
+    def _initialize_checkpoint(self, checkpoint_dir, resume, store_models):
+        score = self.score if isinstance(self.score, str) else getattr(self.score, '__name__', 'callable')
+        metadata = {'model': self.__class__.__name__,
+                    'n_obs': self._dml_data.n_obs,
+                    'd_cols': list(self._dml_data.d_cols),
+                    'n_folds': self.n_folds,
+                    'n_rep': self.n_rep,
+                    'score': score,
+                    'learners': sorted(self.params_names),
+                    'store_models': store_models,
+                    'smpls': self._smpls,
+                    'smpls_cluster': self._smpls_cluster}
+        checkpoint = _FitCheckpoint(checkpoint_dir, metadata, resume)
+        # the completed units are only valid for the sample splitting of the checkpoint
+        self._smpls = checkpoint.metadata['smpls']
+        self._smpls_cluster = checkpoint.metadata['smpls_cluster']
+        return checkpoint
+
+    def _check_not_lean(self, method):
+        if self._lean:
+            raise ValueError(f'{method} is not available for models fitted with lean=True, as the scores and '
+                             'predictions are not stored. Apply fit() with lean=False.')
+
     def _initalize_fit(self, store_predictions, store_models):
         # initialize rmse arrays for nuisance functions evaluation
         self._initialize_rmses()
 
+        if self._lean:
+            # only the estimates and standard errors are stored
+            self._psi, self._psi_deriv, self._psi_elements = None, None, None
+            self._predictions, self._nuisance_targets, self._sensitivity_elements = None, None, None
+            self._all_coef_float64, self._all_se_float64 = None, None
+            self._all_coef = np.full((self._dml_data.n_coefs, self.n_rep), np.nan)
+            self._all_se = np.full((self._dml_data.n_coefs, self.n_rep), np.nan)
+            if store_models:
+                self._initialize_models()
+            return
+
+        if (self._psi is None) or (self._psi.dtype != self._dtype):
+            self._psi, self._psi_deriv, self._psi_elements, \
+                self._coef, self._se, self._all_coef, self._all_se = self._initialize_arrays()
+
+        # estimates for the score elements in double precision to assess the accuracy of the reduced precision
+        if self._dtype != np.float64:
+            self._all_coef_float64 = np.full((self._dml_data.n_coefs, self.n_rep), np.nan)
+            self._all_se_float64 = np.full((self._dml_data.n_coefs, self.n_rep), np.nan)
+        else:
+            self._all_coef_float64, self._all_se_float64 = None, None
+
         if store_predictions:
             self._initialize_predictions_and_targets()
 
@@ -964,17 +1567,78 @@ class DoubleML(ABC):
                                                                                 self.n_rep,
                                                                                 self._dml_data.n_coefs))
 
-    def _fit_nuisance_and_score_elements(self, n_jobs_cv, store_predictions, external_predictions, store_models):
-        ext_prediction_dict = _set_external_predictions(external_predictions,
-                                                        learners=self.params_names,
-                                                        treatment=self._dml_data.d_cols[self._i_treat],
-                                                        i_rep=self._i_rep)
+    def _unit_external_predictions(self, external_predictions, i_col, i_treat):
+        return _set_external_predictions(external_predictions,
+                                         learners=self.params_names,
+                                         treatment=self._dml_data.d_cols[i_treat],
+                                         i_rep=i_col)
 
+    def _fit_nuisance_and_score_elements(self, n_jobs_cv, ext_prediction_dict, store_models):
         # ml estimation of nuisance models and computation of score elements
         score_elements, preds = self._nuisance_est(self.__smpls, n_jobs_cv,
                                                    external_predictions=ext_prediction_dict,
                                                    return_models=store_models)
 
+        return score_elements, preds
+
+    def _fit_nuisance_unit(self, i_rep, i_treat, n_jobs_cv, ext_prediction_dict, store_models, fit_config=None,
+                           checkpoint=None):
+        # the nuisance models are estimated on a shallow copy with its own treatment view of the data, such that
+        # several repetitions and treatment variables can be fitted in parallel without altering the shared objects
+        dml_unit = copy.copy(self)
+        dml_unit._dml_data = copy.copy(self._dml_data)
+        dml_unit._i_rep = i_rep
+        dml_unit._i_treat = i_treat
+        if self._dml_data.n_treat > 1:
+            dml_unit._dml_data.set_x_d(self._dml_data.d_cols[i_treat])
+
+        if fit_config is None:
+            fit_config = dict()
+        with _fit_config(**fit_config):
+            score_elements, preds = dml_unit._nuisance_est(self._smpls[i_rep], n_jobs_cv,
+                                                           external_predictions=ext_prediction_dict,
+                                                           return_models=store_models)
+
+        # models with nonlinear scores update the starting value for the root search during the nuisance estimation
+        coef_start_val = dml_unit._coef_start_val if self._score_type == 'nonlinear' else None
+
+        # the unit is written by the worker, such that it is kept if another unit fails
+        if checkpoint is not None:
+            checkpoint.save_unit(i_rep, i_treat, score_elements, preds, coef_start_val)
+
+        if self._lean:
+            # the score is solved by the worker and only the estimates are returned, such that the score elements and
+            # predictions of the units are not held at the same time
+            coef, se, _, _ = dml_unit._est_coef_and_se({key: np.asarray(value, dtype=np.float64)
+                                                        for key, value in score_elements.items()})
+            unit_res = {'coef': coef,
+                        'se': se,
+                        'var_scaling_factor': dml_unit._var_scaling_factor,
+                        'rmses': dml_unit._nuisance_rmses(preds['predictions'], preds['targets']),
+                        'models': preds['models']}
+            return None, unit_res, coef_start_val
+
+        return score_elements, preds, coef_start_val
+
+    def _copy_without_results(self):
+        dml_copy = copy.copy(self)
+        dml_copy._psi, dml_copy._psi_deriv, dml_copy._psi_elements = None, None, None
+        dml_copy._predictions, dml_copy._nuisance_targets, dml_copy._models = None, None, None
+        dml_copy._sensitivity_elements, dml_copy._boot_t_stat = None, None
+        return dml_copy
+
+    def _store_nuisance_and_score_elements(self, score_elements, preds, store_predictions, store_models):
+        if self._lean:
+            self._calc_rmses(preds['predictions'], preds['targets'])
+            if store_models:
+                self._store_models(preds['models'])
+            return
+
+        if self._all_coef_float64 is not None:
+            coef, se, _, _ = self._est_coef_and_se({key: np.asarray(value, dtype=np.float64)
+                                                    for key, value in score_elements.items()})
+            self._all_coef_float64[self._i_treat, self._i_rep] = coef
+            self._all_se_float64[self._i_treat, self._i_rep] = se
         self._set_score_elements(score_elements, self._i_rep, self._i_treat)
 
         # calculate rmses and store predictions and targets of the nuisance models
@@ -984,25 +1648,33 @@ class DoubleML(ABC):
         if store_models:
             self._store_models(preds['models'])
 
-        return preds
-
-    def _solve_score_and_estimate_se(self):
+    def _solve_score_and_estimate_se(self, score_elements=None):
+        if self._lean:
+            # the score elements are not stored in lean mode
+            psi_elements = {key: np.asarray(value, dtype=np.float64) for key, value in score_elements.items()}
+        else:
+            psi_elements = self._get_score_elements(self._i_rep, self._i_treat)
+        coef, se, psi, psi_deriv = self._est_coef_and_se(psi_elements)
+        self._all_coef[self._i_treat, self._i_rep] = coef
+        self._all_se[self._i_treat, self._i_rep] = se
+        if not self._lean:
+            self._psi[:, self._i_rep, self._i_treat] = psi
+            self._psi_deriv[:, self._i_rep, self._i_treat] = psi_deriv
+
+    def _est_coef_and_se(self, psi_elements):
         # estimate the causal parameter
-        self._all_coef[self._i_treat, self._i_rep] = \
-            self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_treat))
+        coef = self._est_causal_pars(psi_elements)
 
         # compute score (depends on the estimated causal parameter)
-        self._psi[:, self._i_rep, self._i_treat] = self._compute_score(
-            self._get_score_elements(self._i_rep, self._i_treat),
-            self._all_coef[self._i_treat, self._i_rep])
+        psi = self._compute_score(psi_elements, coef)
 
         # compute score derivative (can depend on the estimated causal parameter)
-        self._psi_deriv[:, self._i_rep, self._i_treat] = self._compute_score_deriv(
-            self._get_score_elements(self._i_rep, self._i_treat),
-            self._all_coef[self._i_treat, self._i_rep])
+        psi_deriv = self._compute_score_deriv(psi_elements, coef)
 
         # compute standard errors for causal parameter
-        self._all_se[self._i_treat, self._i_rep] = self._se_causal_pars()
+        se = self._se_causal_pars(psi, psi_deriv)
+
+        return coef, se, psi, psi_deriv
 
     def _fit_sensitivity_elements(self, nuisance_predictions):
         if self._sensitivity_implemented:
@@ -1015,8 +1687,8 @@ class DoubleML(ABC):
 
     def _initialize_arrays(self):
         # scores
-        psi = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
-        psi_deriv = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
+        psi = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan, dtype=self._dtype)
+        psi_deriv = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan, dtype=self._dtype)
         psi_elements = self._initialize_score_elements((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs))
 
         # coefficients and ses
@@ -1033,9 +1705,10 @@ class DoubleML(ABC):
         return n_rep_boot, boot_t_stat
 
     def _initialize_predictions_and_targets(self):
-        self._predictions = {learner: np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
+        shape = (self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs)
+        self._predictions = {learner: np.full(shape, np.nan, dtype=self._dtype)
                              for learner in self.params_names}
-        self._nuisance_targets = {learner: np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
+        self._nuisance_targets = {learner: np.full(shape, np.nan, dtype=self._dtype)
                                   for learner in self.params_names}
 
     def _initialize_rmses(self):
@@ -1052,12 +1725,18 @@ class DoubleML(ABC):
             self._nuisance_targets[learner][:, self._i_rep, self._i_treat] = targets[learner]
 
     def _calc_rmses(self, preds, targets):
+        for learner, rmse in self._nuisance_rmses(preds, targets).items():
+            self._rmses[learner][self._i_rep, self._i_treat] = rmse
+
+    def _nuisance_rmses(self, preds, targets):
+        rmses = dict()
         for learner in self.params_names:
             if targets[learner] is None:
-                self._rmses[learner][self._i_rep, self._i_treat] = np.nan
+                rmses[learner] = np.nan
             else:
                 sq_error = np.power(targets[learner] - preds[learner], 2)
-                self._rmses[learner][self._i_rep, self._i_treat] = np.sqrt(np.nanmean(sq_error, axis=0))
+                rmses[learner] = np.sqrt(np.nanmean(sq_error, axis=0))
+        return rmses
 
     def _store_models(self, models):
         for learner in self.params_names:
@@ -1116,6 +1795,7 @@ class DoubleML(ABC):
                             '%r was passed.' % metric)
 
         if all(learner in self.params_names for learner in learners):
+            self._check_not_lean('evaluate_learners()')
             if self.nuisance_targets is None:
                 raise ValueError('Apply fit() before evaluate_learners().')
             else:
@@ -1134,29 +1814,40 @@ class DoubleML(ABC):
             raise ValueError(f'The learners have to be a subset of {str(self.params_names)}. '
                              f'Learners {str(learners)} provided.')
 
-    def draw_sample_splitting(self):
+    def draw_sample_splitting(self, random_state=None):
         """
         Draw sample splitting for DoubleML models.
 
         The samples are drawn according to the attributes
         ``n_folds`` and ``n_rep``.
 
+        Parameters
+        ----------
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the sample splitting. Every repetition is split with its own child random stream (spawned
+            from ``random_state``), i.e., the splits of a repetition do not depend on the other repetitions. ``None``
+            means that the global random state of :mod:`numpy` is used.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
+        _check_random_state(random_state)
         if self._is_cluster_data:
             obj_dml_resampling = DoubleMLClusterResampling(n_folds=self._n_folds_per_cluster,
                                                            n_rep=self.n_rep,
                                                            n_obs=self._dml_data.n_obs,
                                                            n_cluster_vars=self._dml_data.n_cluster_vars,
-                                                           cluster_vars=self._dml_data.cluster_vars)
+                                                           cluster_vars=self._dml_data.cluster_vars,
+                                                           random_state=random_state)
             self._smpls, self._smpls_cluster = obj_dml_resampling.split_samples()
         else:
             obj_dml_resampling = DoubleMLResampling(n_folds=self.n_folds,
                                                     n_rep=self.n_rep,
                                                     n_obs=self._dml_data.n_obs,
-                                                    stratify=self._strata)
+                                                    stratify=self._strata,
+                                                    random_state=random_state)
             self._smpls = obj_dml_resampling.split_samples()
 
         return self
@@ -1169,12 +1860,16 @@ class DoubleML(ABC):
 
         Parameters
         ----------
-        all_smpls : list or tuple
+        all_smpls : list, tuple or :class:`doubleml.utils.DoubleMLFolds`
             If nested list of lists of tuples:
                 The outer list needs to provide an entry per repeated sample splitting (length of list is set as
                 ``n_rep``).
                 The inner list needs to provide a tuple (train_ind, test_ind) per fold (length of list is set as
-                ``n_folds``). test_ind must form a partition for each inner list.
+                ``n_folds``). test_ind must form a partition for each inner list. Instead of a list of tuples, an
+                entry can also be a :class:`doubleml.utils.DoubleMLFolds` object (fold ids), which is used without
+                further validation.
+            If :class:`doubleml.utils.DoubleMLFolds`:
+                The fold ids of a single sample splitting. ``n_rep=1`` is always set.
             If list of tuples:
                 The list needs to provide a tuple (train_ind, test_ind) per fold (length of list is set as
                 ``n_folds``). test_ind must form a partition. ``n_rep=1`` is always set.
@@ -1217,6 +1912,9 @@ class DoubleML(ABC):
         if self._is_cluster_data:
             raise NotImplementedError('Externally setting the sample splitting for DoubleML is '
                                       'not yet implemented with clustering.')
+        if isinstance(all_smpls, DoubleMLFolds):
+            # a single repetition given by fold ids
+            all_smpls = [all_smpls]
         if isinstance(all_smpls, tuple):
             if not len(all_smpls) == 2:
                 raise ValueError('Invalid partition provided. '
@@ -1248,20 +1946,24 @@ class DoubleML(ABC):
                         self._smpls = [all_smpls]
                     else:
                         self._n_folds = len(all_smpls)
-                        self._smpls = _check_all_smpls([all_smpls], self._dml_data.n_obs, check_intersect=True)
+                        self._smpls = [_as_folds(smpl, self._dml_data.n_obs) for smpl in
+                                       _check_all_smpls([all_smpls], self._dml_data.n_obs, check_intersect=True)]
                 else:
                     raise ValueError('Invalid partition provided. '
                                      'Tuples provided that don\'t form a partition.')
             else:
-                all_list = all([isinstance(smpl, list) for smpl in all_smpls])
+                all_list = all([isinstance(smpl, (list, DoubleMLFolds)) for smpl in all_smpls])
                 if not all_list:
                     raise ValueError('Invalid partition provided. '
                                      'all_smpls is a list where neither all elements are tuples '
                                      'nor all elements are lists.')
-                all_tuple = all([all([isinstance(tpl, tuple) for tpl in smpl]) for smpl in all_smpls])
+                # the repetitions given by fold ids are validated during their construction
+                all_tuple = all([isinstance(smpl, DoubleMLFolds) or all([isinstance(tpl, tuple) for tpl in smpl])
+                                 for smpl in all_smpls])
                 if not all_tuple:
                     raise TypeError('For repeated sample splitting all_smpls must be list of lists of tuples.')
-                all_pairs = all([all([len(tpl) == 2 for tpl in smpl]) for smpl in all_smpls])
+                all_pairs = all([isinstance(smpl, DoubleMLFolds) or all([len(tpl) == 2 for tpl in smpl])
+                                 for smpl in all_smpls])
                 if not all_pairs:
                     raise ValueError('Invalid partition provided. '
                                      'All tuples for train_ind and test_ind must consist of exactly two elements.')
@@ -1275,7 +1977,8 @@ class DoubleML(ABC):
                 if all(smpls_are_partitions):
                     self._n_rep = len(all_smpls)
                     self._n_folds = n_folds_each_smpl[0]
-                    self._smpls = _check_all_smpls(all_smpls, self._dml_data.n_obs, check_intersect=True)
+                    self._smpls = [_as_folds(smpl, self._dml_data.n_obs) for smpl in
+                                   _check_all_smpls(all_smpls, self._dml_data.n_obs, check_intersect=True)]
                 else:
                     raise ValueError('Invalid partition provided. '
                                      'At least one inner list does not form a partition.')
@@ -1300,7 +2003,10 @@ class DoubleML(ABC):
 
         return coef
 
-    def _se_causal_pars(self):
+    def _se_causal_pars(self, psi=None, psi_deriv=None):
+        if psi is None:
+            psi, psi_deriv = self.__psi, self.__psi_deriv
+
         if not self._is_cluster_data:
             cluster_vars = None
             smpls_cluster = None
@@ -1311,8 +2017,8 @@ class DoubleML(ABC):
             smpls_cluster = self.__smpls_cluster
             n_folds_per_cluster = self._n_folds_per_cluster
 
-        sigma2_hat, var_scaling_factor = _var_est(psi=self.__psi,
-                                                  psi_deriv=self.__psi_deriv,
+        sigma2_hat, var_scaling_factor = _var_est(psi=psi,
+                                                  psi_deriv=psi_deriv,
                                                   smpls=self.__smpls,
                                                   is_cluster_data=self._is_cluster_data,
                                                   cluster_vars=cluster_vars,
@@ -1329,33 +2035,11 @@ class DoubleML(ABC):
             self._i_rep = i_rep
             for i_d in range(self._dml_data.n_treat):
                 self._i_treat = i_d
-
-                # estimate the causal parameter
-                self._all_coef[self._i_treat, self._i_rep] = \
-                    self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_treat))
-
-                # compute score (depends on the estimated causal parameter)
-                self._psi[:, self._i_rep, self._i_treat] = self._compute_score(
-                    self._get_score_elements(self._i_rep, self._i_treat),
-                    self._all_coef[self._i_treat, self._i_rep])
-
-                # compute score (can depend on the estimated causal parameter)
-                self._psi_deriv[:, self._i_rep, self._i_treat] = self._compute_score_deriv(
-                    self._get_score_elements(self._i_rep, self._i_treat),
-                    self._all_coef[self._i_treat, self._i_rep])
-
-                # compute standard errors for causal parameter
-                self._all_se[self._i_treat, self._i_rep] = self._se_causal_pars()
+                self._solve_score_and_estimate_se()
 
         # aggregated parameter estimates and standard errors from repeated cross-fitting
         self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factor)
 
-    def _compute_bootstrap(self, weights):
-        J = np.mean(self.__psi_deriv)
-        boot_t_stat = np.matmul(weights, self.__psi) / (self._dml_data.n_obs * self.__all_se * J)
-
-        return boot_t_stat
-
     # Score estimation and elements
     @abstractmethod
     def _est_coef(self, psi_elements, smpls=None, scaling_factor=None, inds=None):
@@ -1375,7 +2059,9 @@ class DoubleML(ABC):
         pass
 
     def _get_score_elements(self, i_rep, i_treat):
-        psi_elements = {key: value[:, i_rep, i_treat] for key, value in self.psi_elements.items()}
+        # the elements are stored in the precision of the fit, but the estimation is always in double precision
+        psi_elements = {key: value[:, i_rep, i_treat].astype(np.float64, copy=False)
+                        for key, value in self.psi_elements.items()}
         return psi_elements
 
     def _set_score_elements(self, psi_elements, i_rep, i_treat):
@@ -1391,7 +2077,7 @@ class DoubleML(ABC):
         return
 
     def _initialize_score_elements(self, score_dim):
-        psi_elements = {key: np.full(score_dim, np.nan) for key in self._score_element_names}
+        psi_elements = {key: np.full(score_dim, np.nan, dtype=self._dtype) for key in self._score_element_names}
         return psi_elements
 
     # Sensitivity estimation and elements
@@ -1407,12 +2093,13 @@ class DoubleML(ABC):
     def _initialize_sensitivity_elements(self, score_dim):
         sensitivity_elements = {'sigma2': np.full((1, score_dim[1], score_dim[2]), np.nan),
                                 'nu2': np.full((1, score_dim[1], score_dim[2]), np.nan),
-                                'psi_sigma2': np.full(score_dim, np.nan),
-                                'psi_nu2': np.full(score_dim, np.nan)}
+                                'psi_sigma2': np.full(score_dim, np.nan, dtype=self._dtype),
+                                'psi_nu2': np.full(score_dim, np.nan, dtype=self._dtype)}
         return sensitivity_elements
 
     def _get_sensitivity_elements(self, i_rep, i_treat):
-        sensitivity_elements = {key: value[:, i_rep, i_treat] for key, value in self.sensitivity_elements.items()}
+        sensitivity_elements = {key: value[:, i_rep, i_treat].astype(np.float64, copy=False)
+                                for key, value in self.sensitivity_elements.items()}
         return sensitivity_elements
 
     def _set_sensitivity_elements(self, sensitivity_elements, i_rep, i_treat):
@@ -1427,11 +2114,11 @@ class DoubleML(ABC):
             self.sensitivity_elements[key][:, i_rep, i_treat] = sensitivity_elements[key]
         return
 
-    def _calc_sensitivity_analysis(self, cf_y, cf_d, rho, level):
+    def _check_sensitivity_input(self, cf_y, cf_d, rho, level):
+        self._check_not_lean('The sensitivity analysis')
         if self._sensitivity_elements is None:
             raise NotImplementedError(f'Sensitivity analysis not yet implemented for {self.__class__.__name__}.')
 
-        # checks
         _check_in_zero_one(cf_y, 'cf_y', include_one=False)
         _check_in_zero_one(cf_d, 'cf_d', include_one=False)
         if not isinstance(rho, float):
@@ -1440,65 +2127,76 @@ class DoubleML(ABC):
         _check_in_zero_one(abs(rho), 'The absolute value of rho')
         _check_in_zero_one(level, 'The confidence level', include_zero=False, include_one=False)
 
-        # set elements for readability
+    def _sensitivity_moments(self):
+        # the bounds are linear in the confounding strength and the variances of the bias-adjusted scores
+        # psi_scaled -/+ confounding_strength * psi_bias are quadratic in it, such that three moments per repetition
+        # and treatment variable suffice to evaluate the sensitivity analysis for any confounding strength
         sigma2 = self.sensitivity_elements['sigma2']
         nu2 = self.sensitivity_elements['nu2']
         psi_sigma = self.sensitivity_elements['psi_sigma2']
         psi_nu = self.sensitivity_elements['psi_nu2']
-        psi_scaled = np.divide(self.psi, np.mean(self.psi_deriv, axis=0))
 
         if (np.any(sigma2 < 0)) | (np.any(nu2 < 0)):
             raise ValueError('sensitivity_elements sigma2 and nu2 have to be positive. '
                              f"Got sigma2 {str(sigma2)} and nu2 {str(nu2)}. "
                              'Most likely this is due to low quality learners (especially propensity scores).')
 
-        # elementwise operations
-        confounding_strength = np.multiply(np.abs(rho), np.sqrt(np.multiply(cf_y, np.divide(cf_d, 1.0-cf_d))))
+        psi_scaled = np.divide(self.psi, np.mean(self.psi_deriv, axis=0, dtype=np.float64))
         S = np.sqrt(np.multiply(sigma2, nu2))
-
-        # sigma2 and nu2 are of shape (1, n_rep, n_coefs), whereas the all_coefs is of shape (n_coefs, n_reps)
-        all_theta_lower = self.all_coef - np.multiply(np.transpose(np.squeeze(S, axis=0)), confounding_strength)
-        all_theta_upper = self.all_coef + np.multiply(np.transpose(np.squeeze(S, axis=0)), confounding_strength)
-
+        # bias of the score per unit of confounding strength
         psi_S2 = np.multiply(sigma2, psi_nu) + np.multiply(nu2, psi_sigma)
-        psi_bias = np.multiply(np.divide(confounding_strength, np.multiply(2.0, S)), psi_S2)
-        psi_lower = psi_scaled - psi_bias
-        psi_upper = psi_scaled + psi_bias
+        psi_bias = np.divide(psi_S2, np.multiply(2.0, S))
 
-        # transpose to obtain shape (n_coefs, n_reps); includes scaling with n^{-1/2}
-        all_sigma_lower = np.full_like(all_theta_lower, fill_value=np.nan)
-        all_sigma_upper = np.full_like(all_theta_upper, fill_value=np.nan)
+        if not self._is_cluster_data:
+            cluster_vars = None
+            smpls_cluster = None
+            n_folds_per_cluster = None
+        else:
+            cluster_vars = self._dml_data.cluster_vars
+            smpls_cluster = self.__smpls_cluster
+            n_folds_per_cluster = self._n_folds_per_cluster
+
+        def var_est(psi):
+            sigma2_hat, _ = _var_est(psi=psi,
+                                     psi_deriv=np.ones_like(psi),
+                                     smpls=self.__smpls,
+                                     is_cluster_data=self._is_cluster_data,
+                                     cluster_vars=cluster_vars,
+                                     smpls_cluster=smpls_cluster,
+                                     n_folds_per_cluster=n_folds_per_cluster)
+            return sigma2_hat
+
+        # all moments are of shape (n_coefs, n_rep); _var_est is a quadratic form in the score, such that the mixed
+        # moment follows from the polarization identity
+        var_scaled = np.full_like(self.all_coef, fill_value=np.nan)
+        var_bias = np.full_like(self.all_coef, fill_value=np.nan)
+        cov_scaled_bias = np.full_like(self.all_coef, fill_value=np.nan)
         for i_rep in range(self.n_rep):
             self._i_rep = i_rep
             for i_d in range(self._dml_data.n_treat):
                 self._i_treat = i_d
-
-                if not self._is_cluster_data:
-                    cluster_vars = None
-                    smpls_cluster = None
-                    n_folds_per_cluster = None
-                else:
-                    cluster_vars = self._dml_data.cluster_vars
-                    smpls_cluster = self.__smpls_cluster
-                    n_folds_per_cluster = self._n_folds_per_cluster
-
-                sigma2_lower_hat, _ = _var_est(psi=psi_lower[:, i_rep, i_d],
-                                               psi_deriv=np.ones_like(psi_lower[:, i_rep, i_d]),
-                                               smpls=self.__smpls,
-                                               is_cluster_data=self._is_cluster_data,
-                                               cluster_vars=cluster_vars,
-                                               smpls_cluster=smpls_cluster,
-                                               n_folds_per_cluster=n_folds_per_cluster)
-                sigma2_upper_hat, _ = _var_est(psi=psi_upper[:, i_rep, i_d],
-                                               psi_deriv=np.ones_like(psi_upper[:, i_rep, i_d]),
-                                               smpls=self.__smpls,
-                                               is_cluster_data=self._is_cluster_data,
-                                               cluster_vars=cluster_vars,
-                                               smpls_cluster=smpls_cluster,
-                                               n_folds_per_cluster=n_folds_per_cluster)
-
-                all_sigma_lower[self._i_treat, self._i_rep] = np.sqrt(sigma2_lower_hat)
-                all_sigma_upper[self._i_treat, self._i_rep] = np.sqrt(sigma2_upper_hat)
+                var_scaled[i_d, i_rep] = var_est(psi_scaled[:, i_rep, i_d])
+                var_bias[i_d, i_rep] = var_est(psi_bias[:, i_rep, i_d])
+                cov_scaled_bias[i_d, i_rep] = (var_est(psi_scaled[:, i_rep, i_d] + psi_bias[:, i_rep, i_d]) -
+                                               var_scaled[i_d, i_rep] - var_bias[i_d, i_rep]) / 2.0
+
+        moments = {'S': np.transpose(np.squeeze(S, axis=0)),
+                   'var_scaled': var_scaled,
+                   'var_bias': var_bias,
+                   'cov_scaled_bias': cov_scaled_bias}
+        return moments
+
+    def _sensitivity_bounds(self, moments, confounding_strength, level):
+        # confounding_strength has to be broadcastable to the shape (..., n_coefs, n_rep) of the moments, e.g., a float,
+        # an array of shape (n_coefs, 1) or an array of shape (..., 1, 1); the results are of shape (..., n_coefs)
+        all_theta_lower = self.all_coef - np.multiply(moments['S'], confounding_strength)
+        all_theta_upper = self.all_coef + np.multiply(moments['S'], confounding_strength)
+
+        # includes scaling with n^{-1/2}; rounding errors are not allowed to result in negative variances
+        var_quadratic = moments['var_scaled'] + np.multiply(np.square(confounding_strength), moments['var_bias'])
+        var_linear = np.multiply(2.0 * confounding_strength, moments['cov_scaled_bias'])
+        all_sigma_lower = np.sqrt(np.clip(var_quadratic - var_linear, 0.0, None))
+        all_sigma_upper = np.sqrt(np.clip(var_quadratic + var_linear, 0.0, None))
 
         # aggregate coefs and ses over n_rep
         theta_lower, sigma_lower = _aggregate_coefs_and_ses(all_theta_lower, all_sigma_lower, self._var_scaling_factor)
@@ -1523,25 +2221,59 @@ class DoubleML(ABC):
 
         return res_dict
 
+    def _calc_sensitivity_analysis(self, cf_y, cf_d, rho, level):
+        self._check_sensitivity_input(cf_y, cf_d, rho, level)
+
+        res_dict = self._sensitivity_bounds(self._sensitivity_moments(), _confounding_strength(cf_y, cf_d, rho), level)
+
+        return res_dict
+
+    def _calc_robustness_values(self, null_hypothesis, level, rho, moments=None):
+        # robustness values of all treatments, i.e., the value of cf_y = cf_d at which the relevant bound (without and
+        # with statistical uncertainty) equals the null hypothesis; null_hypothesis has to be of shape (n_coefs,)
+        self._check_sensitivity_input(0.0, 0.0, rho, level)
+        if moments is None:
+            moments = self._sensitivity_moments()
+
+        # check which side is relevant
+        is_upper = null_hypothesis > self.coef
+
+        def rv_fct(values, param):
+            confounding_strength = _confounding_strength(values, values, rho)
+            res = self._sensitivity_bounds(moments, confounding_strength[:, np.newaxis], level)[param]
+            return np.where(is_upper, res['upper'], res['lower']) - null_hypothesis
+
+        # the bounds are monotone in the sensitivity parameters such that the roots of all treatments are found by a
+        # joint bisection on [0, 0.9999]; without a sign change the boundary with the smaller deviation is used
+        value_bounds = (0.0, 0.9999)
+        robustness_values = []
+        for param in ['theta', 'ci']:
+            lower = np.full(self._dml_data.n_treat, value_bounds[0])
+            upper = np.full(self._dml_data.n_treat, value_bounds[1])
+            res_lower = rv_fct(lower, param)
+            res_upper = rv_fct(upper, param)
+            has_root = np.multiply(res_lower, res_upper) <= 0
+            boundary = np.where(np.abs(res_lower) <= np.abs(res_upper), value_bounds[0], value_bounds[1])
+            for _ in range(50):
+                mid = (lower + upper) / 2.0
+                res_mid = rv_fct(mid, param)
+                move_lower = np.multiply(res_mid, res_lower) > 0
+                lower = np.where(move_lower, mid, lower)
+                res_lower = np.where(move_lower, res_mid, res_lower)
+                upper = np.where(move_lower, upper, mid)
+            robustness_values.append(np.where(has_root, (lower + upper) / 2.0, boundary))
+
+        rv, rva = robustness_values
+        return rv, rva
+
     def _calc_robustness_value(self, null_hypothesis, level, rho, idx_treatment):
         _check_float(null_hypothesis, "null_hypothesis")
         _check_integer(idx_treatment, "idx_treatment", lower_bound=0, upper_bound=self._dml_data.n_treat-1)
 
-        # check which side is relvant
-        bound = 'upper' if (null_hypothesis > self.coef[idx_treatment]) else 'lower'
-
-        # minimize the square to find boundary solutions
-        def rv_fct(value, param):
-            res = self._calc_sensitivity_analysis(cf_y=value,
-                                                  cf_d=value,
-                                                  rho=rho,
-                                                  level=level)[param][bound][idx_treatment] - null_hypothesis
-            return np.square(res)
+        null_hypothesis_vec = np.full(shape=self._dml_data.n_treat, fill_value=null_hypothesis)
+        rv, rva = self._calc_robustness_values(null_hypothesis_vec, level=level, rho=rho)
 
-        rv = minimize_scalar(rv_fct, bounds=(0, 0.9999), method='bounded', args=('theta', )).x
-        rva = minimize_scalar(rv_fct, bounds=(0, 0.9999), method='bounded', args=('ci', )).x
-
-        return rv, rva
+        return rv[idx_treatment], rva[idx_treatment]
 
     def sensitivity_analysis(self, cf_y=0.03, cf_d=0.03, rho=1.0, level=0.95, null_hypothesis=0.0):
         """
@@ -1579,8 +2311,10 @@ class DoubleML(ABC):
         -------
         self : object
         """
-        # compute sensitivity analysis
-        sensitivity_dict = self._calc_sensitivity_analysis(cf_y=cf_y, cf_d=cf_d, rho=rho, level=level)
+        # compute sensitivity analysis; the moments are shared with the robustness values
+        self._check_sensitivity_input(cf_y, cf_d, rho, level)
+        moments = self._sensitivity_moments()
+        sensitivity_dict = self._sensitivity_bounds(moments, _confounding_strength(cf_y, cf_d, rho), level)
 
         if isinstance(null_hypothesis, float):
             null_hypothesis_vec = np.full(shape=self._dml_data.n_treat, fill_value=null_hypothesis)
@@ -1596,12 +2330,7 @@ class DoubleML(ABC):
                             f"{str(null_hypothesis)} of type {str(type(null_hypothesis))} was passed.")
 
         # compute robustess values with respect to null_hypothesis
-        rv = np.full(shape=self._dml_data.n_treat, fill_value=np.nan)
-        rva = np.full(shape=self._dml_data.n_treat, fill_value=np.nan)
-
-        for i_treat in range(self._dml_data.n_treat):
-            rv[i_treat], rva[i_treat] = self._calc_robustness_value(null_hypothesis=null_hypothesis_vec[i_treat],
-                                                                    level=level, rho=rho, idx_treatment=i_treat)
+        rv, rva = self._calc_robustness_values(null_hypothesis_vec, level=level, rho=rho, moments=moments)
 
         sensitivity_dict['rv'] = rv
         sensitivity_dict['rva'] = rva
@@ -1734,15 +2463,14 @@ class DoubleML(ABC):
         cf_d_vec = np.linspace(0, grid_bounds[0], grid_size)
         cf_y_vec = np.linspace(0, grid_bounds[1], grid_size)
 
-        # compute contour values
-        contour_values = np.full(shape=(grid_size, grid_size), fill_value=np.nan)
-        for i_cf_d_grid, cf_d_grid in enumerate(cf_d_vec):
-            for i_cf_y_grid, cf_y_grid in enumerate(cf_y_vec):
-                sens_dict = self._calc_sensitivity_analysis(cf_y=cf_y_grid,
-                                                            cf_d=cf_d_grid,
-                                                            rho=self.sensitivity_params['input']['rho'],
-                                                            level=self.sensitivity_params['input']['level'])
-                contour_values[i_cf_d_grid, i_cf_y_grid] = sens_dict[value][bound][idx_treatment]
+        # compute contour values; the moments are computed once and the bounds are evaluated on the whole grid
+        rho = self.sensitivity_params['input']['rho']
+        level = self.sensitivity_params['input']['level']
+        moments = self._sensitivity_moments()
+        cf_d_grid, cf_y_grid = np.meshgrid(cf_d_vec, cf_y_vec, indexing='ij')
+        confounding_strength = _confounding_strength(cf_y_grid, cf_d_grid, rho)
+        sens_dict = self._sensitivity_bounds(moments, confounding_strength[:, :, np.newaxis, np.newaxis], level)
+        contour_values = sens_dict[value][bound][:, :, idx_treatment]
 
         # get the correct unadjusted value for confidence bands
         if value == 'theta':
@@ -1758,14 +2486,14 @@ class DoubleML(ABC):
         # compute the values for the benchmarks
         benchmark_dict = copy.deepcopy(benchmarks)
         if benchmarks is not None:
-            n_benchmarks = len(benchmarks['name'])
-            benchmark_values = np.full(shape=(n_benchmarks,), fill_value=np.nan)
-            for benchmark_idx in range(len(benchmarks['name'])):
-                sens_dict_bench = self._calc_sensitivity_analysis(cf_y=benchmarks['cf_y'][benchmark_idx],
-                                                                  cf_d=benchmarks['cf_y'][benchmark_idx],
-                                                                  rho=self.sensitivity_params['input']['rho'],
-                                                                  level=self.sensitivity_params['input']['level'])
-                benchmark_values[benchmark_idx] = sens_dict_bench[value][bound][idx_treatment]
+            cf_y_bench = np.asarray(benchmarks['cf_y'], dtype=np.float64)
+            cf_d_bench = np.asarray(benchmarks['cf_d'], dtype=np.float64)
+            for cf_y_value, cf_d_value in zip(cf_y_bench, cf_d_bench):
+                self._check_sensitivity_input(cf_y_value, cf_d_value, rho, level)
+            confounding_strength_bench = _confounding_strength(cf_y_bench, cf_d_bench, rho)
+            sens_dict_bench = self._sensitivity_bounds(moments, confounding_strength_bench[:, np.newaxis, np.newaxis],
+                                                       level)
+            benchmark_values = sens_dict_bench[value][bound][:, idx_treatment]
             benchmark_dict['value'] = benchmark_values
         fig = _sensitivity_contour_plot_static(x=cf_d_vec,
                                         y=cf_y_vec,
@@ -1779,35 +2507,124 @@ class DoubleML(ABC):
                                         fill=fill)
         return fig
 
+    def _check_benchmarking_set(self, benchmarking_set):
+        if not isinstance(benchmarking_set, list):
+            raise TypeError('benchmarking_set must be a list. '
+                            f'{str(benchmarking_set)} of type {type(benchmarking_set)} was passed.')
+        if len(benchmarking_set) == 0:
+            raise ValueError('benchmarking_set must not be empty.')
+        if not set(benchmarking_set) <= set(self._dml_data.x_cols):
+            raise ValueError(f"benchmarking_set must be a subset of features {str(self._dml_data.x_cols)}. "
+                             f'{str(benchmarking_set)} was passed.')
+
+    def _fit_benchmark_model(self, benchmarking_set):
+        # the short model is a shallow copy of the long model without its results and with its own view of the data,
+        # i.e., the sample splitting, the learners and their parameters are reused and no large arrays are copied
+        dml_short = self._copy_without_results()
+        dml_short._dml_data = copy.copy(self._dml_data)
+        dml_short._dml_data.x_cols = [x for x in self._dml_data.x_cols if x not in benchmarking_set]
+        dml_short._sensitivity_params = None
+        dml_short._thread_budget = dict()
+        dml_short.fit(store_predictions=False)
+
+        # only the estimates and the sensitivity elements needed for the gain statistics are kept
+        sensitivity_elements = {key: dml_short.sensitivity_elements[key] for key in ['sigma2', 'nu2']}
+        dml_short = dml_short._copy_without_results()
+        dml_short._sensitivity_elements = sensitivity_elements
+        return dml_short
+
     def sensitivity_benchmark(self, benchmarking_set):
         """
         Computes a benchmark for a given set of features.
         Returns a DataFrame containing the corresponding values for cf_y, cf_d, rho and the change in estimates.
+
+        The short model without the benchmarking set reuses the sample splitting and the learners of the model.
+
+        Parameters
+        ----------
+        benchmarking_set : list
+            The features (a subset of ``x_cols``) which are omitted in the short model.
+
         Returns
         -------
         benchmark_results : pandas.DataFrame
             Benchmark results.
         """
-        x_list_long = self._dml_data.x_cols
-
         # input checks
+        self._check_not_lean('sensitivity_benchmark()')
         if self._sensitivity_elements is None:
             raise NotImplementedError(f'Sensitivity analysis not yet implemented for {self.__class__.__name__}.')
-        if not isinstance(benchmarking_set, list):
-            raise TypeError('benchmarking_set must be a list. '
-                            f'{str(benchmarking_set)} of type {type(benchmarking_set)} was passed.')
-        if len(benchmarking_set) == 0:
-            raise ValueError('benchmarking_set must not be empty.')
-        if not set(benchmarking_set) <= set(x_list_long):
-            raise ValueError(f"benchmarking_set must be a subset of features {str(self._dml_data.x_cols)}. "
-                             f'{str(benchmarking_set)} was passed.')
+        self._check_benchmarking_set(benchmarking_set)
 
         # refit short form of the model
-        x_list_short = [x for x in x_list_long if x not in benchmarking_set]
-        dml_short = copy.deepcopy(self)
-        dml_short._dml_data.x_cols = x_list_short
-        dml_short.fit()
+        dml_short = self._fit_benchmark_model(benchmarking_set)
 
         benchmark_dict = gain_statistics(dml_long=self, dml_short=dml_short)
         df_benchmark = pd.DataFrame(benchmark_dict, index=self._dml_data.d_cols)
         return df_benchmark
+
+    def sensitivity_benchmarks(self, benchmarking_sets, n_jobs=None, executor=None):
+        """
+        Computes benchmarks for several sets of features.
+
+        Every short model omits one benchmarking set and reuses the sample splitting and the learners of the model
+        (see :meth:`sensitivity_benchmark`). The short models can be fitted in parallel.
+
+        Parameters
+        ----------
+        benchmarking_sets : list or dict
+            A list of benchmarking sets (lists of features, each a subset of ``x_cols``) or a dictionary with the
+            names of the benchmarking sets as keys and the benchmarking sets as values. For a list, the name of a
+            benchmarking set consists of its comma-separated features.
+
+        n_jobs : None or int
+            The number of CPUs to use to fit the short models in parallel. ``None`` means ``1`` unless in a
+            :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+            Default is ``None``.
+
+        executor : None, str or executor
+            The executor for the parallel fits of the short models (see :meth:`fit`).
+            Default is ``None``.
+
+        Returns
+        -------
+        benchmark_results : pandas.DataFrame
+            Benchmark results with one row per benchmarking set and treatment variable (index levels
+            ``benchmarking_set`` and ``treatment``).
+        """
+        # input checks
+        self._check_not_lean('sensitivity_benchmarks()')
+        if self._sensitivity_elements is None:
+            raise NotImplementedError(f'Sensitivity analysis not yet implemented for {self.__class__.__name__}.')
+        if isinstance(benchmarking_sets, dict):
+            names = list(benchmarking_sets.keys())
+            benchmarking_sets = list(benchmarking_sets.values())
+        elif isinstance(benchmarking_sets, list):
+            names = None
+        else:
+            raise TypeError('benchmarking_sets must be a list or a dictionary. '
+                            f'{str(benchmarking_sets)} of type {type(benchmarking_sets)} was passed.')
+        if len(benchmarking_sets) == 0:
+            raise ValueError('benchmarking_sets must not be empty.')
+        for benchmarking_set in benchmarking_sets:
+            self._check_benchmarking_set(benchmarking_set)
+        if names is None:
+            names = [', '.join(benchmarking_set) for benchmarking_set in benchmarking_sets]
+        if n_jobs is not None:
+            if not isinstance(n_jobs, int):
+                raise TypeError('The number of CPUs used to fit the short models must be of int type. '
+                                f'{str(n_jobs)} of type {str(type(n_jobs))} was passed.')
+        _check_executor(executor)
+
+        # refit the short forms of the model; the workers do not need the (large) arrays of the results
+        dml_workers = self._copy_without_results()
+        with _fit_config(executor=executor):
+            all_dml_short = _parallel_map(dml_workers._fit_benchmark_model,
+                                          [(benchmarking_set, ) for benchmarking_set in benchmarking_sets],
+                                          n_jobs=n_jobs)
+
+        df_benchmarks = pd.concat([pd.DataFrame(gain_statistics(dml_long=self, dml_short=dml_short),
+                                                index=self._dml_data.d_cols)
+                                   for dml_short in all_dml_short],
+                                  keys=names, names=['benchmarking_set', 'treatment'])
+        return df_benchmarks
@@ -157,6 +157,15 @@ class DoubleMLData(DoubleMLBaseData):
         # by default, we initialize to the first treatment variable
         self.set_x_d(self.d_cols[0])
 
+    def __copy__(self):
+        # shallow copies share the data and the cached role arrays, but can change their roles (e.g. the active
+        # treatment or the covariates) without altering the cache of the original object
+        data_copy = self.__class__.__new__(self.__class__)
+        data_copy.__dict__.update(self.__dict__)
+        if hasattr(self, '_role_arrays'):
+            data_copy._role_arrays = dict(self._role_arrays)
+        return data_copy
+
     def __str__(self):
         data_summary = self._data_summary_str()
         buf = io.StringIO()
@@ -288,8 +297,10 @@ class DoubleMLData(DoubleMLBaseData):
         Dynamic! May depend on the currently set treatment variable;
         To get an array of all covariates (independent of the currently set treatment variable)
         call ``obj.data[obj.x_cols].values``.
+        The array is cached (without the other treatment variables it is shared by all treatment variables) and
+        read-only. It is rebuilt from ``data`` if the roles of the variables change and at the beginning of every fit.
         """
-        return self._X.values
+        return self._x_array
 
     @property
     def y(self):
@@ -582,19 +593,69 @@ class DoubleMLData(DoubleMLBaseData):
         if treatment_var not in self.d_cols:
             raise ValueError('Invalid treatment_var. '
                              f'{treatment_var} is not in d_cols.')
-        if self.use_other_treat_as_covariate:
+        x_array, x_finite = self._get_role_array('x', self.x_cols)
+        d_array, d_finite = self._get_role_array('d', self.d_cols)
+        i_treat = self.d_cols.index(treatment_var)
+        other_treats = self.use_other_treat_as_covariate & (self.n_treat > 1)
+        if other_treats:
             # note that the following line needs to be adapted in case an intersection of x_cols and d_cols as allowed
             # (see https://github.com/DoubleML/doubleml-for-py/issues/83)
             xd_list = self.x_cols + self.d_cols
             xd_list.remove(treatment_var)
+            xd_finite = np.concatenate((x_finite, np.delete(d_finite, i_treat)))
         else:
             xd_list = self.x_cols
-        assert_all_finite(self.data.loc[:, treatment_var])
-        if self.force_all_x_finite:
-            assert_all_finite(self.data.loc[:, xd_list],
+            xd_finite = x_finite
+        if not d_finite[i_treat]:
+            assert_all_finite(self.data.loc[:, treatment_var])
+        if self.force_all_x_finite and not np.all(xd_finite):
+            # only the columns with missings or infinite values are checked again (and raise the error)
+            assert_all_finite(self.data.loc[:, [col for col, finite in zip(xd_list, xd_finite) if not finite]],
                               allow_nan=self.force_all_x_finite == 'allow-nan')
         self._d = self.data.loc[:, treatment_var]
-        self._X = self.data.loc[:, xd_list]
+        if other_treats:
+            # the other treatment variables follow the covariates, i.e., the covariates of a treatment variable are no
+            # view of one common array; they are stacked once per treatment variable and reused by all repetitions
+            key = ('x_' + treatment_var, self.x_cols + self.d_cols)
+            role_arrays = self._role_arrays
+            if key not in role_arrays:
+                x_treat = np.hstack((x_array, np.delete(d_array, i_treat, axis=1)))
+                x_treat.flags.writeable = False
+                role_arrays[key] = x_treat
+            self._x_array = role_arrays[key]
+        else:
+            # no copy of the covariates
+            self._x_array = x_array
+
+    def _get_role_array(self, role, cols):
+        # one C-contiguous, read-only array per role, which is shared by all treatment variables; the finiteness of
+        # every column is only checked once (until the roles change or the arrays are refreshed)
+        if not hasattr(self, '_role_arrays'):
+            self._role_arrays = dict()
+        role_arrays = self._role_arrays
+        if (role not in role_arrays) or (role_arrays[role][0] != cols):
+            role_array = np.ascontiguousarray(self.data.loc[:, cols].to_numpy())
+            if role_array.dtype == object:
+                # as in check_array(dtype='numeric'), such that the models can use the arrays without further checks
+                try:
+                    role_array = role_array.astype(np.float64)
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f'Invalid data. The columns {str(list(cols))} cannot be converted to float: '
+                                     f'{str(e)}') from e
+            if np.issubdtype(role_array.dtype, np.number):
+                role_finite = np.isfinite(role_array).all(axis=0)
+            else:
+                # columns of other types are always checked with assert_all_finite
+                role_finite = np.zeros(len(cols), dtype=bool)
+            role_array.flags.writeable = False
+            role_arrays[role] = (list(cols), role_array, role_finite)
+        return role_arrays[role][1], role_arrays[role][2]
+
+    def _refresh_role_arrays(self):
+        # the data frame can be changed in place; the cached arrays are rebuilt (and validated) from the current data,
+        # e.g. at the beginning of every fit
+        self._role_arrays = dict()
+        self.set_x_d(self._d.name)
 
     def _check_binary_treats(self):
         is_binary = pd.Series(dtype=bool, index=self.d_cols)
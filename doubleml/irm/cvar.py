@@ -1,13 +1,15 @@
 import numpy as np
 from sklearn.base import clone
-from sklearn.utils import check_X_y
 from sklearn.model_selection import StratifiedKFold, train_test_split
 
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import LinearScoreMixin
 from ..utils._estimation import _dml_cv_predict, _trimm, _predict_zero_one_propensity, \
-    _normalize_ipw, _dml_tune, _get_bracket_guess, _solve_ipw_score, _cond_targets
+    _normalize_ipw, _dml_tune, _get_bracket_guess, _solve_ipw_score, _cond_targets, \
+    _cached_nuisance
 from ..double_ml_data import DoubleMLData
+from ..utils._config import _fit_config, _get_fit_config
+from ..utils._parallel import _parallel_map, _set_n_jobs, _thread_limits
 from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, \
     _check_contains_iv, _check_quantile
 
@@ -120,6 +122,9 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         y_treat = self._dml_data.y[self._dml_data.d == self.treatment]
         self._coef_start_val = np.mean(y_treat[y_treat >= np.quantile(y_treat, self.quantile)])
 
+        # propensity scores shared with other models (set by DoubleMLQTE for its quantile models)
+        self._nuisance_cache = None
+
         # set stratication for resampling
         self._strata = self._dml_data.d
         if draw_sample_splitting:
@@ -191,10 +196,8 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
                         for learner in ['ml_g', 'ml_m']}
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         # initialize nuisance predictions, targets and models
         g_hat = {'models': None,
@@ -218,11 +221,74 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
                 fitted_models[learner] = [clone(self._learner[learner]) for i_fold in range(self.n_folds)]
 
         ipw_vec = np.full(shape=self.n_folds, fill_value=np.nan)
-        # caculate nuisance functions over different folds
-        for i_fold in range(self.n_folds):
-            train_inds = smpls[i_fold][0]
+        # caculate nuisance functions over different folds (in parallel for n_jobs_cv); the fold results are combined in
+        # the order of the folds
+        fold_workers = self._copy_without_results()
+        # the fit configuration is thread-local and has to be passed to the workers
+        fit_config = _get_fit_config().copy()
+        fit_config['executor'] = None
+        fold_res = _parallel_map(fold_workers._nuisance_est_fold,
+                                 [(i_fold, smpls, x, y, d, {learner: fitted_models[learner][i_fold]
+                                                            for learner in fitted_models}, fit_config)
+                                  for i_fold in range(self.n_folds)],
+                                 n_jobs=n_jobs_cv)
+        for i_fold, res_fold in enumerate(fold_res):
             test_inds = smpls[i_fold][1]
+            ipw_vec[i_fold] = res_fold['ipw_est']
+            for learner, model in res_fold['models'].items():
+                fitted_models[learner][i_fold] = model
+            g_hat['preds'][test_inds] = res_fold['g_preds']
+            g_hat['targets'][test_inds] = res_fold['g_targets']
+            m_hat['preds'][test_inds] = res_fold['m_preds']
+            if self._nuisance_cache is not None:
+                self._nuisance_cache.update(res_fold['cache'])
+
+        # set target for propensity score
+        m_hat['targets'] = d
+
+        # set the target for g to be a float and only relevant values
+        g_hat['targets'] = _cond_targets(g_hat['targets'], cond_sample=(d == self.treatment))
+
+        if return_models:
+            g_hat['models'] = fitted_models['ml_g']
+            m_hat['models'] = fitted_models['ml_m']
+
+        # clip propensities and normalize ipw weights
+        m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
+
+        # this is not done in the score to be equivalent to PQ models
+        if self._normalize_ipw:
+            m_hat_adj = _normalize_ipw(m_hat['preds'], d)
+        else:
+            m_hat_adj = m_hat['preds']
+
+        if self.treatment == 0:
+            m_hat_adj = 1 - m_hat_adj
+
+        # use the average of the ipw estimates to approximate the potential quantile for U (p.4 Kallus et. al)
+        pq_est = np.mean(ipw_vec)
+        psi_a, psi_b = self._score_elements(y, d, g_hat['preds'], m_hat_adj, pq_est)
+        psi_elements = {'psi_a': psi_a,
+                        'psi_b': psi_b}
+        preds = {'predictions': {'ml_g': g_hat['preds'],
+                                 'ml_m': m_hat['preds']},
+                 'targets': {'ml_g': g_hat['targets'],
+                             'ml_m': m_hat['targets']},
+                 'models': {'ml_g': g_hat['models'],
+                            'ml_m': m_hat['models']}
+                 }
+        return psi_elements, preds
 
+    def _nuisance_est_fold(self, i_fold, smpls, x, y, d, models, fit_config):
+        # nuisance estimation for one fold (preliminary ipw estimate on the first half of the training set); the fitted
+        # models are returned, such that the folds can be estimated in parallel workers
+        train_inds = smpls[i_fold][0]
+        test_inds = smpls[i_fold][1]
+        # the threads of learners with built-in parallelism are limited to the CPUs per fold
+        models = {learner: _set_n_jobs(model, fit_config['n_jobs_learner']) for learner, model in models.items()}
+        res_fold = {'models': models, 'cache': {}}
+
+        with _fit_config(**fit_config), _thread_limits(fit_config['n_jobs_learner']):
             # start nested crossfitting
             train_inds_1, train_inds_2 = train_test_split(train_inds, test_size=0.5,
                                                           random_state=42, stratify=d[train_inds])
@@ -234,9 +300,14 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
             x_train_1 = x[train_inds_1, :]
 
             # get a copy of ml_m as a preliminary learner
-            ml_m_prelim = clone(fitted_models['ml_m'][i_fold])
-            m_hat_prelim = _dml_cv_predict(ml_m_prelim, x_train_1, d_train_1,
-                                           method='predict_proba', smpls=smpls_prelim)['preds']
+            def fit_m_prelim():
+                ml_m_prelim = clone(models['ml_m'])
+                return _dml_cv_predict(ml_m_prelim, x_train_1, d_train_1,
+                                       method='predict_proba', smpls=smpls_prelim)['preds']
+
+            cache_key = ('ml_m_prelim', self._i_rep, i_fold)
+            res_fold['cache'][cache_key] = _cached_nuisance(self._nuisance_cache, cache_key, fit_m_prelim)
+            m_hat_prelim = np.copy(res_fold['cache'][cache_key])
 
             m_hat_prelim = _trimm(m_hat_prelim, self.trimming_rule, self.trimming_threshold)
 
@@ -252,7 +323,7 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
 
             _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
             ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
-            ipw_vec[i_fold] = ipw_est
+            res_fold['ipw_est'] = ipw_est
 
             # use the preliminary estimates to fit the nuisance parameters on train_2
             d_train_2 = d[train_inds_2]
@@ -268,58 +339,27 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
             # only consider values with the right treatment status and fit the model
             dx_treat_train_2 = x_train_2[d_train_2 == self.treatment, :]
             g_target_train_2_d = g_target_train_2[d_train_2 == self.treatment]
-            fitted_models['ml_g'][i_fold].fit(dx_treat_train_2, g_target_train_2_d)
+            models['ml_g'].fit(dx_treat_train_2, g_target_train_2_d)
 
             # predict nuisance values on the test data and the corresponding targets
-            g_hat['preds'][test_inds] = fitted_models['ml_g'][i_fold].predict(x_test)
-            g_hat['targets'][test_inds] = g_target[test_inds]
+            res_fold['g_preds'] = models['ml_g'].predict(x_test)
+            res_fold['g_targets'] = g_target[test_inds]
 
             # refit the propensity score on the whole training set
-            fitted_models['ml_m'][i_fold].fit(x[train_inds, :], d[train_inds])
-            m_hat['preds'][test_inds] = _predict_zero_one_propensity(fitted_models['ml_m'][i_fold], x_test)
-
-        # set target for propensity score
-        m_hat['targets'] = d
-
-        # set the target for g to be a float and only relevant values
-        g_hat['targets'] = _cond_targets(g_hat['targets'], cond_sample=(d == self.treatment))
-
-        if return_models:
-            g_hat['models'] = fitted_models['ml_g']
-            m_hat['models'] = fitted_models['ml_m']
-
-        # clip propensities and normalize ipw weights
-        m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
-
-        # this is not done in the score to be equivalent to PQ models
-        if self._normalize_ipw:
-            m_hat_adj = _normalize_ipw(m_hat['preds'], d)
-        else:
-            m_hat_adj = m_hat['preds']
+            def fit_m():
+                ml_m = models['ml_m'].fit(x[train_inds, :], d[train_inds])
+                return ml_m, _predict_zero_one_propensity(ml_m, x_test)
 
-        if self.treatment == 0:
-            m_hat_adj = 1 - m_hat_adj
+            cache_key = ('ml_m', self._i_rep, i_fold)
+            res_fold['cache'][cache_key] = _cached_nuisance(self._nuisance_cache, cache_key, fit_m)
+            models['ml_m'], res_fold['m_preds'] = res_fold['cache'][cache_key]
 
-        # use the average of the ipw estimates to approximate the potential quantile for U (p.4 Kallus et. al)
-        pq_est = np.mean(ipw_vec)
-        psi_a, psi_b = self._score_elements(y, d, g_hat['preds'], m_hat_adj, pq_est)
-        psi_elements = {'psi_a': psi_a,
-                        'psi_b': psi_b}
-        preds = {'predictions': {'ml_g': g_hat['preds'],
-                                 'ml_m': m_hat['preds']},
-                 'targets': {'ml_g': g_hat['targets'],
-                             'ml_m': m_hat['targets']},
-                 'models': {'ml_g': g_hat['models'],
-                            'ml_m': m_hat['models']}
-                 }
-        return psi_elements, preds
+        return res_fold
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                          search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         if scoring_methods is None:
             scoring_methods = {'ml_g': None,
@@ -1,12 +1,11 @@
 import numpy as np
-from sklearn.utils import check_X_y
 from sklearn.utils.multiclass import type_of_target
 
 from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw
+from ..utils._estimation import _dml_cv_predict_batch, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity
 
 
@@ -239,25 +238,44 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         return
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        z = np.ravel(self._dml_data.z)
+        d = self._dml_data.d
 
         # get train indices for z == 0 and z == 1
         smpls_z0, smpls_z1 = _get_cond_smpls(smpls, z)
 
+        # the nuisance models g0, g1, m, r0 and r1 do not depend on each other and are fitted in one batch
+        cv_tasks = dict()
+        if external_predictions['ml_g0'] is None:
+            cv_tasks['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_z0,
+                                 'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if external_predictions['ml_g1'] is None:
+            cv_tasks['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_z1,
+                                 'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if external_predictions['ml_m'] is None:
+            cv_tasks['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': z, 'smpls': smpls,
+                                'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m'],
+                                'return_models': return_models}
+        if self.subgroups['always_takers'] and (external_predictions['ml_r0'] is None):
+            cv_tasks['ml_r0'] = {'estimator': self._learner['ml_r'], 'x': x, 'y': d, 'smpls': smpls_z0,
+                                 'est_params': self._get_params('ml_r0'), 'method': self._predict_method['ml_r'],
+                                 'return_models': return_models}
+        if self.subgroups['never_takers'] and (external_predictions['ml_r1'] is None):
+            cv_tasks['ml_r1'] = {'estimator': self._learner['ml_r'], 'x': x, 'y': d, 'smpls': smpls_z1,
+                                 'est_params': self._get_params('ml_r1'), 'method': self._predict_method['ml_r'],
+                                 'return_models': return_models}
+        cv_res = _dml_cv_predict_batch(cv_tasks, n_jobs=n_jobs_cv)
+
         # nuisance g
         if external_predictions['ml_g0'] is not None:
             g_hat0 = {'preds': external_predictions['ml_g0'],
                       'targets': None,
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_z0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = cv_res['ml_g0']
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat0['targets'] = g_hat0['targets'].astype(float)
@@ -278,9 +296,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_z1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = cv_res['ml_g1']
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = g_hat1['targets'].astype(float)
@@ -303,9 +319,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = cv_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
         # also trimm external predictions
@@ -319,9 +333,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                           'targets': None,
                           'models': None}
             else:
-                r_hat0 = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls_z0, n_jobs=n_jobs_cv,
-                                         est_params=self._get_params('ml_r0'), method=self._predict_method['ml_r'],
-                                         return_models=return_models)
+                r_hat0 = cv_res['ml_r0']
         else:
             r_hat0 = {'preds': np.zeros_like(d), 'targets': np.zeros_like(d), 'models': None}
         if not r0:
@@ -337,9 +349,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                           'targets': None,
                           'models': None}
             else:
-                r_hat1 = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls_z1, n_jobs=n_jobs_cv,
-                                         est_params=self._get_params('ml_r1'), method=self._predict_method['ml_r'],
-                                         return_models=return_models)
+                r_hat1 = cv_res['ml_r1']
         else:
             r_hat1 = {'preds': np.ones_like(d), 'targets': np.ones_like(d), 'models': None}
         if not r1:
@@ -402,12 +412,9 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                          search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        z = np.ravel(self._dml_data.z)
+        d = self._dml_data.d
 
         # get train indices for z == 0 and z == 1
         smpls_z0, smpls_z1 = _get_cond_smpls(smpls, z)
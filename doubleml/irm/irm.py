@@ -1,7 +1,6 @@
 import numpy as np
 import pandas as pd
 import warnings
-from sklearn.utils import check_X_y
 from sklearn.utils.multiclass import type_of_target
 
 from ..double_ml import DoubleML
@@ -11,7 +10,7 @@ from ..utils.policytree import DoubleMLPolicyTree
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw, _cond_targets
+from ..utils._estimation import _dml_cv_predict_batch, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw, _cond_targets
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity, _check_integer, \
     _check_weights
 
@@ -209,6 +208,15 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             assert isinstance(weights, dict)
             self._weights = weights
 
+    def add_repetitions(self, n_rep_add=None, all_smpls=None, n_jobs_cv=None, external_predictions=None,
+                        fit_options=None, random_state=None):
+        if 'weights_bar' in self._weights.keys():
+            raise NotImplementedError('Additional repetitions are not implemented for weights_bar of shape '
+                                      '(n_obs, n_rep).')
+        return super().add_repetitions(n_rep_add=n_rep_add, all_smpls=all_smpls, n_jobs_cv=n_jobs_cv,
+                                       external_predictions=external_predictions, fit_options=fit_options,
+                                       random_state=random_state)
+
     def _get_weights(self, m_hat=None):
         # standard case for ATE
         if self.score == 'ATE':
@@ -251,16 +259,30 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         return
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
         # get train indices for d == 0 and d == 1
         smpls_d0, smpls_d1 = _get_cond_smpls(smpls, d)
         g0_external = external_predictions['ml_g0'] is not None
         g1_external = external_predictions['ml_g1'] is not None
         m_external = external_predictions['ml_m'] is not None
 
+        # the nuisance models g0, g1 and m do not depend on each other and are fitted in one batch
+        cv_tasks = dict()
+        if not g0_external:
+            cv_tasks['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d0,
+                                 'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if (self.score != 'ATTE') and (not g1_external):
+            cv_tasks['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d1,
+                                 'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g'],
+                                 'return_models': return_models}
+        if not m_external:
+            cv_tasks['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m'],
+                                'return_models': return_models}
+        cv_res = _dml_cv_predict_batch(cv_tasks, n_jobs=n_jobs_cv)
+
         # nuisance g
         if g0_external:
             # use external predictions
@@ -268,9 +290,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = cv_res['ml_g0']
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             g_hat0['targets'] = _cond_targets(g_hat0['targets'], cond_sample=(d == 0))
 
@@ -294,9 +314,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = cv_res['ml_g1']
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = _cond_targets(g_hat1['targets'], cond_sample=(d == 1))
@@ -317,9 +335,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = cv_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
         # also trimm external predictions
@@ -412,10 +428,8 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                          search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
         # get train indices for d == 0 and d == 1
         smpls_d0, smpls_d1 = _get_cond_smpls(smpls, d)
 
@@ -480,6 +494,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         if self.n_rep != 1:
             raise NotImplementedError('Only implemented for one repetition. ' +
                                       f'Number of repetitions is {str(self.n_rep)}.')
+        self._check_not_lean('cate()')
 
         # define the orthogonal signal
         orth_signal = self.psi_elements['psi_b'].reshape(-1)
@@ -555,6 +570,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             raise NotImplementedError('Only implemented for one repetition. ' +
                                       f'Number of repetitions is {str(self.n_rep)}.')
 
+        self._check_not_lean('policy_tree()')
         _check_integer(depth, "Depth", 0)
 
         if not isinstance(features, pd.DataFrame):
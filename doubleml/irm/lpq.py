@@ -1,12 +1,13 @@
 import numpy as np
 from sklearn.utils.multiclass import type_of_target
 from sklearn.base import clone
-from sklearn.utils import check_X_y
 from sklearn.model_selection import StratifiedKFold, train_test_split
 
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import NonLinearScoreMixin
 from ..double_ml_data import DoubleMLData
+from ..utils._config import _fit_config, _get_fit_config
+from ..utils._parallel import _parallel_map, _set_n_jobs, _thread_limits
 
 from ..utils._estimation import (
     _dml_cv_predict,
@@ -18,6 +19,7 @@ from ..utils._estimation import (
     _normalize_ipw,
     _dml_tune,
     _solve_ipw_score,
+    _cached_nuisance,
 )
 from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, _check_quantile
 
@@ -66,8 +68,9 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
     kde : callable or None
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
-        Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        Default is ``'None'``, which evaluates a weighted kernel density estimate with a gaussian kernel and
+        silverman for bandwidth determination directly in ``0`` (equal to
+        :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with these settings).
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -145,6 +148,9 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         self._coef_bounds = (self._dml_data.y.min(), self._dml_data.y.max())
         self._coef_start_val = np.quantile(self._dml_data.y[self._dml_data.d == self.treatment], self.quantile)
 
+        # propensity scores shared with other models (set by DoubleMLQTE for its quantile models)
+        self._nuisance_cache = None
+
         # set stratication for resampling
         self._strata = self._dml_data.d.reshape(-1, 1) + 2 * self._dml_data.z.reshape(-1, 1)
         if draw_sample_splitting:
@@ -281,9 +287,9 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         }
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
-        x, z = check_X_y(x, np.ravel(self._dml_data.z), force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        z = np.ravel(self._dml_data.z)
 
         m_z = external_predictions["ml_m_z"] is not None
         m_d_d0 = external_predictions["ml_m_d_z0"] is not None
@@ -364,129 +370,36 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                 "preds": external_predictions["ml_g_du_z1"],
             }
 
-        # calculate nuisance functions over different folds
+        # calculate nuisance functions over different folds (in parallel for n_jobs_cv); the fold results are combined
+        # in the order of the folds
         if not all(ext_preds):
-            for i_fold in range(self.n_folds):
-                train_inds = smpls[i_fold][0]
+            fold_workers = self._copy_without_results()
+            # the fit configuration is thread-local and has to be passed to the workers
+            fit_config = _get_fit_config().copy()
+            fit_config["executor"] = None
+            fold_res = _parallel_map(
+                fold_workers._nuisance_est_fold,
+                [
+                    (i_fold, smpls, x, y, d, z, strata,
+                     {learner: fitted_models[learner][i_fold] for learner in fitted_models}, fit_config)
+                    for i_fold in range(self.n_folds)
+                ],
+                n_jobs=n_jobs_cv,
+            )
+            for i_fold, res_fold in enumerate(fold_res):
                 test_inds = smpls[i_fold][1]
-
-                # start nested crossfitting
-                train_inds_1, train_inds_2 = train_test_split(
-                    train_inds, test_size=0.5, random_state=42, stratify=strata[train_inds]
-                )
-                smpls_prelim = [
-                    (train, test)
-                    for train, test in StratifiedKFold(n_splits=self.n_folds).split(X=train_inds_1, y=strata[train_inds_1])
-                ]
-
-                d_train_1 = d[train_inds_1]
-                y_train_1 = y[train_inds_1]
-                x_train_1 = x[train_inds_1, :]
-                z_train_1 = z[train_inds_1]
-
-                # preliminary propensity for z
-                ml_m_z_prelim = clone(fitted_models["ml_m_z"][i_fold])
-                m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1,
-                                                 method="predict_proba", smpls=smpls_prelim)[
-                    "preds"
+                ipw_vec[i_fold] = res_fold["ipw_est"]
+                for learner, model in res_fold["models"].items():
+                    fitted_models[learner][i_fold] = model
+                g_du_z0_hat["preds"][test_inds] = res_fold["g_du_z0_preds"]
+                g_du_z1_hat["preds"][test_inds] = res_fold["g_du_z1_preds"]
+                g_du_z0_hat["targets"][test_inds] = res_fold["g_du_targets"]
+                g_du_z1_hat["targets"][test_inds] = res_fold["g_du_targets"]
+                m_z_hat["preds"][test_inds], m_d_z0_hat["preds"][test_inds], m_d_z1_hat["preds"][test_inds] = res_fold[
+                    "m_preds"
                 ]
-
-                m_z_hat_prelim = _trimm(m_z_hat_prelim, self.trimming_rule, self.trimming_threshold)
-                if self._normalize_ipw:
-                    m_z_hat_prelim = _normalize_ipw(m_z_hat_prelim, z_train_1)
-
-                # propensity for d == 1 cond. on z == 0 (training set 1)
-                z0_train_1 = z_train_1 == 0
-                x_z0_train_1 = x_train_1[z0_train_1, :]
-                d_z0_train_1 = d_train_1[z0_train_1]
-                ml_m_d_z0_prelim = clone(fitted_models["ml_m_d_z0"][i_fold])
-                ml_m_d_z0_prelim.fit(x_z0_train_1, d_z0_train_1)
-                m_d_z0_hat_prelim = _predict_zero_one_propensity(ml_m_d_z0_prelim, x_train_1)
-
-                # propensity for d == 1 cond. on z == 1 (training set 1)
-                z1_train_1 = z_train_1 == 1
-                x_z1_train_1 = x_train_1[z1_train_1, :]
-                d_z1_train_1 = d_train_1[z1_train_1]
-                ml_m_d_z1_prelim = clone(fitted_models["ml_m_d_z1"][i_fold])
-                ml_m_d_z1_prelim.fit(x_z1_train_1, d_z1_train_1)
-                m_d_z1_hat_prelim = _predict_zero_one_propensity(ml_m_d_z1_prelim, x_train_1)
-
-                # preliminary estimate of theta_2_aux
-                comp_prob_prelim = np.mean(
-                    m_d_z1_hat_prelim
-                    - m_d_z0_hat_prelim
-                    + z_train_1 / m_z_hat_prelim * (d_train_1 - m_d_z1_hat_prelim)
-                    - (1 - z_train_1) / (1 - m_z_hat_prelim) * (d_train_1 - m_d_z0_hat_prelim)
-                )
-
-                # preliminary ipw estimate
-                def ipw_score(theta):
-                    res = np.mean(
-                        self._compute_ipw_score(theta, d_train_1, y_train_1, m_z_hat_prelim, z_train_1, comp_prob_prelim)
-                    )
-                    return res
-
-                _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-                ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
-                ipw_vec[i_fold] = ipw_est
-
-                # use the preliminary estimates to fit the nuisance parameters on train_2
-                d_train_2 = d[train_inds_2]
-                y_train_2 = y[train_inds_2]
-                x_train_2 = x[train_inds_2, :]
-                z_train_2 = z[train_inds_2]
-
-                # define test observations
-                d_test = d[test_inds]
-                y_test = y[test_inds]
-                x_test = x[test_inds, :]
-                z_test = z[test_inds]
-
-                # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 0
-                z0_train_2 = z_train_2 == 0
-                x_z0_train_2 = x_train_2[z0_train_2, :]
-                du_z0_train_2 = (d_train_2[z0_train_2] == self._treatment) * (y_train_2[z0_train_2] <= ipw_est)
-                fitted_models["ml_g_du_z0"][i_fold].fit(x_z0_train_2, du_z0_train_2)
-                g_du_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z0"][i_fold], x_test)
-
-                # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 1
-                z1_train_2 = z_train_2 == 1
-                x_z1_train_2 = x_train_2[z1_train_2, :]
-                du_z1_train_2 = (d_train_2[z1_train_2] == self._treatment) * (y_train_2[z1_train_2] <= ipw_est)
-                fitted_models["ml_g_du_z1"][i_fold].fit(x_z1_train_2, du_z1_train_2)
-                g_du_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z1"][i_fold], x_test)
-
-                # the predictions of both should only be evaluated conditional on z == 0 or z == 1
-                test_inds_z0 = test_inds[z_test == 0]
-                test_inds_z1 = test_inds[z_test == 1]
-                g_du_z0_hat["targets"][test_inds_z0] = (
-                    1.0 * (d_test[z_test == 0] == self._treatment) * (y_test[z_test == 0] <= ipw_est)
-                )
-                g_du_z1_hat["targets"][test_inds_z1] = (
-                    1.0 * (d_test[z_test == 1] == self._treatment) * (y_test[z_test == 1] <= ipw_est)
-                )
-
-                # refit nuisance elements for the local potential quantile
-                z_train = z[train_inds]
-                x_train = x[train_inds]
-                d_train = d[train_inds]
-
-                # refit propensity for z (whole training set)
-                fitted_models["ml_m_z"][i_fold].fit(x_train, z_train)
-                m_z_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_z"][i_fold], x_test)
-
-                # refit propensity for d == 1 cond. on z == 0 (whole training set)
-                z0_train = z_train == 0
-                x_z0_train = x_train[z0_train, :]
-                d_z0_train = d_train[z0_train]
-                fitted_models["ml_m_d_z0"][i_fold].fit(x_z0_train, d_z0_train)
-                m_d_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_d_z0"][i_fold], x_test)
-
-                # propensity for d == 1 cond. on z == 1 (whole training set)
-                x_z1_train = x_train[z_train == 1, :]
-                d_z1_train = d_train[z_train == 1]
-                fitted_models["ml_m_d_z1"][i_fold].fit(x_z1_train, d_z1_train)
-                m_d_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_d_z1"][i_fold], x_test)
+                if self._nuisance_cache is not None:
+                    self._nuisance_cache.update(res_fold["cache"])
 
         # save targets and models
         m_z_hat["targets"] = z
@@ -558,12 +471,147 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         }
         return psi_elements, preds
 
+    def _nuisance_est_fold(self, i_fold, smpls, x, y, d, z, strata, models, fit_config):
+        # nuisance estimation for one fold (preliminary ipw estimate on the first half of the training set); the fitted
+        # models are returned, such that the folds can be estimated in parallel workers
+        # the threads of learners with built-in parallelism are limited to the CPUs per fold
+        models = {learner: _set_n_jobs(model, fit_config["n_jobs_learner"]) for learner, model in models.items()}
+        res_fold = {"models": models, "cache": {}}
+
+        with _fit_config(**fit_config), _thread_limits(fit_config["n_jobs_learner"]):
+            train_inds = smpls[i_fold][0]
+            test_inds = smpls[i_fold][1]
+
+            # start nested crossfitting
+            train_inds_1, train_inds_2 = train_test_split(
+                train_inds, test_size=0.5, random_state=42, stratify=strata[train_inds]
+            )
+            smpls_prelim = [
+                (train, test)
+                for train, test in StratifiedKFold(n_splits=self.n_folds).split(X=train_inds_1, y=strata[train_inds_1])
+            ]
+
+            d_train_1 = d[train_inds_1]
+            y_train_1 = y[train_inds_1]
+            x_train_1 = x[train_inds_1, :]
+            z_train_1 = z[train_inds_1]
+
+            def fit_m_prelim():
+                # preliminary propensity for z
+                ml_m_z_prelim = clone(models["ml_m_z"])
+                m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1,
+                                                 method="predict_proba", smpls=smpls_prelim)[
+                    "preds"
+                ]
+
+                # propensity for d == 1 cond. on z == 0 (training set 1)
+                z0_train_1 = z_train_1 == 0
+                x_z0_train_1 = x_train_1[z0_train_1, :]
+                d_z0_train_1 = d_train_1[z0_train_1]
+                ml_m_d_z0_prelim = clone(models["ml_m_d_z0"])
+                ml_m_d_z0_prelim.fit(x_z0_train_1, d_z0_train_1)
+                m_d_z0_hat_prelim = _predict_zero_one_propensity(ml_m_d_z0_prelim, x_train_1)
+
+                # propensity for d == 1 cond. on z == 1 (training set 1)
+                z1_train_1 = z_train_1 == 1
+                x_z1_train_1 = x_train_1[z1_train_1, :]
+                d_z1_train_1 = d_train_1[z1_train_1]
+                ml_m_d_z1_prelim = clone(models["ml_m_d_z1"])
+                ml_m_d_z1_prelim.fit(x_z1_train_1, d_z1_train_1)
+                m_d_z1_hat_prelim = _predict_zero_one_propensity(ml_m_d_z1_prelim, x_train_1)
+                return m_z_hat_prelim, m_d_z0_hat_prelim, m_d_z1_hat_prelim
+
+            cache_key = ("ml_m_prelim", self._i_rep, i_fold)
+            res_fold["cache"][cache_key] = _cached_nuisance(self._nuisance_cache, cache_key, fit_m_prelim)
+            m_z_hat_prelim, m_d_z0_hat_prelim, m_d_z1_hat_prelim = res_fold["cache"][cache_key]
+
+            m_z_hat_prelim = _trimm(np.copy(m_z_hat_prelim), self.trimming_rule, self.trimming_threshold)
+            if self._normalize_ipw:
+                m_z_hat_prelim = _normalize_ipw(m_z_hat_prelim, z_train_1)
+
+            # preliminary estimate of theta_2_aux
+            comp_prob_prelim = np.mean(
+                m_d_z1_hat_prelim
+                - m_d_z0_hat_prelim
+                + z_train_1 / m_z_hat_prelim * (d_train_1 - m_d_z1_hat_prelim)
+                - (1 - z_train_1) / (1 - m_z_hat_prelim) * (d_train_1 - m_d_z0_hat_prelim)
+            )
+
+            # preliminary ipw estimate
+            def ipw_score(theta):
+                res = np.mean(
+                    self._compute_ipw_score(theta, d_train_1, y_train_1, m_z_hat_prelim, z_train_1, comp_prob_prelim)
+                )
+                return res
+
+            _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
+            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+            res_fold["ipw_est"] = ipw_est
+
+            # use the preliminary estimates to fit the nuisance parameters on train_2
+            d_train_2 = d[train_inds_2]
+            y_train_2 = y[train_inds_2]
+            x_train_2 = x[train_inds_2, :]
+            z_train_2 = z[train_inds_2]
+
+            # define test observations
+            d_test = d[test_inds]
+            y_test = y[test_inds]
+            x_test = x[test_inds, :]
+
+            # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 0
+            z0_train_2 = z_train_2 == 0
+            x_z0_train_2 = x_train_2[z0_train_2, :]
+            du_z0_train_2 = (d_train_2[z0_train_2] == self._treatment) * (y_train_2[z0_train_2] <= ipw_est)
+            models["ml_g_du_z0"].fit(x_z0_train_2, du_z0_train_2)
+            res_fold["g_du_z0_preds"] = _predict_zero_one_propensity(models["ml_g_du_z0"], x_test)
+
+            # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 1
+            z1_train_2 = z_train_2 == 1
+            x_z1_train_2 = x_train_2[z1_train_2, :]
+            du_z1_train_2 = (d_train_2[z1_train_2] == self._treatment) * (y_train_2[z1_train_2] <= ipw_est)
+            models["ml_g_du_z1"].fit(x_z1_train_2, du_z1_train_2)
+            res_fold["g_du_z1_preds"] = _predict_zero_one_propensity(models["ml_g_du_z1"], x_test)
+
+            # the targets of both are restricted to z == 0 or z == 1 after the cross-fitting
+            res_fold["g_du_targets"] = 1.0 * (d_test == self._treatment) * (y_test <= ipw_est)
+
+            # refit nuisance elements for the local potential quantile
+            def fit_m():
+                z_train = z[train_inds]
+                x_train = x[train_inds]
+                d_train = d[train_inds]
+
+                # refit propensity for z (whole training set)
+                ml_m_z = models["ml_m_z"].fit(x_train, z_train)
+
+                # refit propensity for d == 1 cond. on z == 0 (whole training set)
+                z0_train = z_train == 0
+                x_z0_train = x_train[z0_train, :]
+                d_z0_train = d_train[z0_train]
+                ml_m_d_z0 = models["ml_m_d_z0"].fit(x_z0_train, d_z0_train)
+
+                # propensity for d == 1 cond. on z == 1 (whole training set)
+                x_z1_train = x_train[z_train == 1, :]
+                d_z1_train = d_train[z_train == 1]
+                ml_m_d_z1 = models["ml_m_d_z1"].fit(x_z1_train, d_z1_train)
+
+                ml_m = (ml_m_z, ml_m_d_z0, ml_m_d_z1)
+                return ml_m, tuple(_predict_zero_one_propensity(model, x_test) for model in ml_m)
+
+            cache_key = ("ml_m", self._i_rep, i_fold)
+            res_fold["cache"][cache_key] = _cached_nuisance(self._nuisance_cache, cache_key, fit_m)
+            ml_m, res_fold["m_preds"] = res_fold["cache"][cache_key]
+            models["ml_m_z"], models["ml_m_d_z0"], models["ml_m_d_z1"] = ml_m
+
+        return res_fold
+
     def _nuisance_tuning(
         self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search
     ):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
-        x, z = check_X_y(x, np.ravel(self._dml_data.z), force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        z = np.ravel(self._dml_data.z)
 
         if scoring_methods is None:
             scoring_methods = {"ml_m_z": None, "ml_m_d_z0": None, "ml_m_d_z1": None, "ml_g_du_z0": None, "ml_g_du_z1": None}
@@ -1,6 +1,5 @@
 import numpy as np
 from sklearn.base import clone
-from sklearn.utils import check_X_y
 from sklearn.model_selection import StratifiedKFold, train_test_split
 
 from ..double_ml import DoubleML
@@ -17,7 +16,10 @@ from ..utils._estimation import (
     _dml_tune,
     _solve_ipw_score,
     _cond_targets,
+    _cached_nuisance,
 )
+from ..utils._config import _fit_config, _get_fit_config
+from ..utils._parallel import _parallel_map, _set_n_jobs, _thread_limits
 from ..utils._checks import (
     _check_score,
     _check_trimming,
@@ -73,8 +75,9 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
     kde : callable or None
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
-        Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        Default is ``'None'``, which evaluates a weighted kernel density estimate with a gaussian kernel and
+        silverman for bandwidth determination directly in ``0`` (equal to
+        :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with these settings).
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -152,6 +155,9 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         self._coef_bounds = (self._dml_data.y.min(), self._dml_data.y.max())
         self._coef_start_val = np.quantile(self._dml_data.y[self._dml_data.d == self.treatment], self.quantile)
 
+        # propensity scores shared with other models (set by DoubleMLQTE for its quantile models)
+        self._nuisance_cache = None
+
         # set stratication for resampling
         self._strata = self._dml_data.d
         if draw_sample_splitting:
@@ -257,8 +263,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         self._params = {learner: {key: [None] * self.n_rep for key in self._dml_data.d_cols} for learner in ["ml_g", "ml_m"]}
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         g_external = external_predictions["ml_g"] is not None
         m_external = external_predictions["ml_m"] is not None
@@ -303,66 +309,34 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                 "preds": external_predictions["ml_m"],
             }
 
-        # caculate nuisance functions over different folds
+        # caculate nuisance functions over different folds (in parallel for n_jobs_cv); the fold results are combined
+        # in the order of the folds
         if not all([g_external, m_external]):
-            for i_fold in range(self.n_folds):
-                train_inds = smpls[i_fold][0]
+            fold_workers = self._copy_without_results()
+            # the fit configuration is thread-local and has to be passed to the workers
+            fit_config = _get_fit_config().copy()
+            fit_config["executor"] = None
+            fold_res = _parallel_map(
+                fold_workers._nuisance_est_fold,
+                [
+                    (i_fold, smpls, x, y, d, {learner: fitted_models[learner][i_fold] for learner in fitted_models},
+                     m_hat["preds"] if m_external else None, fit_config)
+                    for i_fold in range(self.n_folds)
+                ],
+                n_jobs=n_jobs_cv,
+            )
+            for i_fold, res_fold in enumerate(fold_res):
                 test_inds = smpls[i_fold][1]
-
-                # start nested crossfitting
-                train_inds_1, train_inds_2 = train_test_split(
-                    train_inds, test_size=0.5, random_state=42, stratify=d[train_inds]
-                )
-                smpls_prelim = [
-                    (train, test)
-                    for train, test in StratifiedKFold(n_splits=self.n_folds).split(X=train_inds_1, y=d[train_inds_1])
-                ]
-
-                d_train_1 = d[train_inds_1]
-                y_train_1 = y[train_inds_1]
-                x_train_1 = x[train_inds_1, :]
-
-                if not m_external:
-                    # get a copy of ml_m as a preliminary learner
-                    ml_m_prelim = clone(fitted_models["ml_m"][i_fold])
-                    m_hat_prelim = _dml_cv_predict(
-                        ml_m_prelim, x_train_1, d_train_1, method="predict_proba", smpls=smpls_prelim
-                    )["preds"]
-                else:
-                    m_hat_prelim = m_hat["preds"][np.concatenate([test for _, test in smpls_prelim])]
-                m_hat_prelim = _trimm(m_hat_prelim, self.trimming_rule, self.trimming_threshold)
-                if self._normalize_ipw:
-                    m_hat_prelim = _normalize_ipw(m_hat_prelim, d_train_1)
-                if self.treatment == 0:
-                    m_hat_prelim = 1 - m_hat_prelim
-
-                # preliminary ipw estimate
-                def ipw_score(theta):
-                    res = np.mean(self._compute_ipw_score(theta, d_train_1, y_train_1, m_hat_prelim))
-                    return res
-
-                _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-                ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
-                ipw_vec[i_fold] = ipw_est
-
-                # use the preliminary estimates to fit the nuisance parameters on train_2
-                d_train_2 = d[train_inds_2]
-                y_train_2 = y[train_inds_2]
-                x_train_2 = x[train_inds_2, :]
-
-                dx_treat_train_2 = x_train_2[d_train_2 == self.treatment, :]
-                y_treat_train_2 = y_train_2[d_train_2 == self.treatment]
-
+                ipw_vec[i_fold] = res_fold["ipw_est"]
+                for learner, model in res_fold["models"].items():
+                    fitted_models[learner][i_fold] = model
                 if not g_external:
-                    fitted_models["ml_g"][i_fold].fit(dx_treat_train_2, y_treat_train_2 <= ipw_est)
-
-                    # predict nuisance values on the test data and the corresponding targets
-                    g_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g"][i_fold], x[test_inds, :])
-                    g_hat["targets"][test_inds] = y[test_inds] <= ipw_est
+                    g_hat["preds"][test_inds] = res_fold["g_preds"]
+                    g_hat["targets"][test_inds] = res_fold["g_targets"]
                 if not m_external:
-                    # refit the propensity score on the whole training set
-                    fitted_models["ml_m"][i_fold].fit(x[train_inds, :], d[train_inds])
-                    m_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m"][i_fold], x[test_inds, :])
+                    m_hat["preds"][test_inds] = res_fold["m_preds"]
+                if self._nuisance_cache is not None:
+                    self._nuisance_cache.update(res_fold["cache"])
 
         # set target for propensity score
         m_hat["targets"] = d
@@ -399,11 +373,87 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         }
         return psi_elements, preds
 
+    def _nuisance_est_fold(self, i_fold, smpls, x, y, d, models, m_hat_external, fit_config):
+        # nuisance estimation for one fold (preliminary ipw estimate on the first half of the training set); the fitted
+        # models are returned, such that the folds can be estimated in parallel workers
+        train_inds = smpls[i_fold][0]
+        test_inds = smpls[i_fold][1]
+        m_external = m_hat_external is not None
+        # the threads of learners with built-in parallelism are limited to the CPUs per fold
+        models = {learner: _set_n_jobs(model, fit_config["n_jobs_learner"]) for learner, model in models.items()}
+        res_fold = {"models": models, "cache": {}}
+
+        with _fit_config(**fit_config), _thread_limits(fit_config["n_jobs_learner"]):
+            # start nested crossfitting
+            train_inds_1, train_inds_2 = train_test_split(train_inds, test_size=0.5, random_state=42, stratify=d[train_inds])
+            smpls_prelim = [
+                (train, test)
+                for train, test in StratifiedKFold(n_splits=self.n_folds).split(X=train_inds_1, y=d[train_inds_1])
+            ]
+
+            d_train_1 = d[train_inds_1]
+            y_train_1 = y[train_inds_1]
+            x_train_1 = x[train_inds_1, :]
+
+            if not m_external:
+                # get a copy of ml_m as a preliminary learner
+                def fit_m_prelim():
+                    ml_m_prelim = clone(models["ml_m"])
+                    return _dml_cv_predict(ml_m_prelim, x_train_1, d_train_1, method="predict_proba", smpls=smpls_prelim)[
+                        "preds"
+                    ]
+
+                cache_key = ("ml_m_prelim", self._i_rep, i_fold)
+                res_fold["cache"][cache_key] = _cached_nuisance(self._nuisance_cache, cache_key, fit_m_prelim)
+                m_hat_prelim = np.copy(res_fold["cache"][cache_key])
+            else:
+                m_hat_prelim = m_hat_external[np.concatenate([test for _, test in smpls_prelim])]
+            m_hat_prelim = _trimm(m_hat_prelim, self.trimming_rule, self.trimming_threshold)
+            if self._normalize_ipw:
+                m_hat_prelim = _normalize_ipw(m_hat_prelim, d_train_1)
+            if self.treatment == 0:
+                m_hat_prelim = 1 - m_hat_prelim
+
+            # preliminary ipw estimate
+            def ipw_score(theta):
+                res = np.mean(self._compute_ipw_score(theta, d_train_1, y_train_1, m_hat_prelim))
+                return res
+
+            _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
+            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+            res_fold["ipw_est"] = ipw_est
+
+            # use the preliminary estimates to fit the nuisance parameters on train_2
+            d_train_2 = d[train_inds_2]
+            y_train_2 = y[train_inds_2]
+            x_train_2 = x[train_inds_2, :]
+
+            dx_treat_train_2 = x_train_2[d_train_2 == self.treatment, :]
+            y_treat_train_2 = y_train_2[d_train_2 == self.treatment]
+
+            if "ml_g" in models:
+                models["ml_g"].fit(dx_treat_train_2, y_treat_train_2 <= ipw_est)
+
+                # predict nuisance values on the test data and the corresponding targets
+                res_fold["g_preds"] = _predict_zero_one_propensity(models["ml_g"], x[test_inds, :])
+                res_fold["g_targets"] = y[test_inds] <= ipw_est
+            if not m_external:
+                # refit the propensity score on the whole training set
+                def fit_m():
+                    ml_m = models["ml_m"].fit(x[train_inds, :], d[train_inds])
+                    return ml_m, _predict_zero_one_propensity(ml_m, x[test_inds, :])
+
+                cache_key = ("ml_m", self._i_rep, i_fold)
+                res_fold["cache"][cache_key] = _cached_nuisance(self._nuisance_cache, cache_key, fit_m)
+                models["ml_m"], res_fold["m_preds"] = res_fold["cache"][cache_key]
+
+        return res_fold
+
     def _nuisance_tuning(
         self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search
     ):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         if scoring_methods is None:
             scoring_methods = {"ml_g": None, "ml_m": None}
@@ -4,16 +4,18 @@ from scipy.stats import norm
 
 from sklearn.base import clone
 
-from joblib import Parallel, delayed
-
 from ..double_ml_data import DoubleMLData, DoubleMLClusterData
 from .pq import DoubleMLPQ
 from .lpq import DoubleMLLPQ
 from .cvar import DoubleMLCVAR
 
-from ..utils._estimation import _draw_weights, _default_kde
-from ..utils.resampling import DoubleMLResampling
-from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment
+from ..utils._estimation import _draw_weight_chunks, _default_kde, _compute_qte_boot, _compute_qte_gaussian_cov_boot
+from ..utils._random import _check_random_state, _spawn_seeds
+from ..utils._config import _fit_config
+from ..utils._parallel import _check_executor, _parallel_map, _split_n_jobs_budget
+from ..utils.fit_options import DoubleMLFitOptions, _check_fit_options
+from ..utils.resampling import DoubleMLResampling, DoubleMLFolds
+from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_integer
 
 
 class DoubleMLQTE:
@@ -55,8 +57,9 @@ class DoubleMLQTE:
     kde : callable or None
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
-        Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        Default is ``'None'``, which evaluates a weighted kernel density estimate with a gaussian kernel and
+        silverman for bandwidth determination directly in ``0`` (equal to
+        :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with these settings).
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -142,6 +145,7 @@ class DoubleMLQTE:
 
         # perform sample splitting
         self._smpls = None
+        self._modellist_0, self._modellist_1 = [], []
         if draw_sample_splitting:
             self.draw_sample_splitting()
 
@@ -158,6 +162,9 @@ class DoubleMLQTE:
         # also initialize bootstrap arrays with the default number of bootstrap replications
         self._n_rep_boot, self._boot_coef, self._boot_t_stat = self._initialize_boot_arrays(n_rep_boot=500)
 
+        # split of the CPU budget for fit (only recorded if n_jobs_budget is set)
+        self._thread_budget = dict()
+
     def __str__(self):
         class_name = self.__class__.__name__
         header = f'================== {class_name} Object ==================\n'
@@ -183,7 +190,16 @@ class DoubleMLQTE:
     @property
     def smpls(self):
         """
-        The partition used for cross-fitting.
+        The partition used for cross-fitting (a list of lists of tuples ``(train_ind, test_ind)``; one list per
+        repetition). The indices are derived from ``smpls_folds`` on every access.
+        """
+        return [list(smpl) for smpl in self.smpls_folds]
+
+    @property
+    def smpls_folds(self):
+        """
+        The partition used for cross-fitting as stored by the model: one :class:`doubleml.utils.DoubleMLFolds` object
+        (fold ids) per repetition.
         """
         if self._smpls is None:
             err_msg = ('Sample splitting not specified. Draw samples via .draw_sample splitting(). ' +
@@ -320,6 +336,14 @@ class DoubleMLQTE:
         """
         return self._modellist_1
 
+    @property
+    def thread_budget(self):
+        """
+        The split of the CPU budget ``n_jobs_budget`` into quantiles fitted in parallel (``n_jobs_outer``) and CPUs per
+        quantile (``n_jobs_inner``) for the last call of :meth:`fit`.
+        """
+        return self._thread_budget
+
     @property
     def summary(self):
         """
@@ -363,7 +387,8 @@ class DoubleMLQTE:
     def __all_se(self):
         return self._all_se[self._i_quant, self._i_rep]
 
-    def fit(self, n_jobs_models=None, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions=None):
+    def fit(self, n_jobs_models=None, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions=None,
+            fit_options=None):
         """
         Estimate DoubleMLQTE models.
 
@@ -374,8 +399,8 @@ class DoubleMLQTE:
             Default is ``None``.
 
         n_jobs_cv : None or int
-            The number of CPUs to use to fit the learners. ``None`` means ``1``.
-            Does not speed up computation for quantile models.
+            The number of CPUs to use to estimate the folds of the quantile models (incl. the preliminary estimates on
+            the folds). ``None`` means ``1``.
             Default is ``None``.
 
         store_predictions : bool
@@ -384,9 +409,19 @@ class DoubleMLQTE:
 
         store_models : bool
             Indicates whether the fitted models for the nuisance functions should be stored in ``models``. This allows
-            to analyze the fitted models or extract information like variable importance.
+            to analyze the fitted models or extract information like variable importance. The propensity scores are
+            estimated once for all quantile models with the same sample splitting and propensity learners, i.e., the
+            stored propensity models of these quantile models are the same (shared) objects.
             Default is ``False``.
 
+        fit_options : None, dict or :class:`doubleml.utils.DoubleMLFitOptions`
+            The execution options of the fit. Only ``executor`` and ``n_jobs_budget`` are implemented. The executor is
+            used for the parallel estimation of the quantiles. The CPU budget is split between the quantiles fitted in
+            parallel (replaces ``n_jobs_models``) and the CPUs per quantile, which are again split between the folds
+            and the threads of the learners (see :meth:`doubleml.DoubleML.fit`). The chosen split is available in
+            ``thread_budget``. The CPU budget cannot be combined with ``n_jobs_models`` or ``n_jobs_cv``.
+            Default is ``None``.
+
         Returns
         -------
         self : object
@@ -394,11 +429,38 @@ class DoubleMLQTE:
 
         if external_predictions is not None:
             raise NotImplementedError(f"External predictions not implemented for {self.__class__.__name__}.")
-
-        # parallel estimation of the quantiles
-        parallel = Parallel(n_jobs=n_jobs_models, verbose=0, pre_dispatch='2*n_jobs')
-        fitted_models = parallel(delayed(self._fit_quantile)(i_quant, n_jobs_cv, store_predictions, store_models)
-                                 for i_quant in range(self.n_quantiles))
+        fit_options = _check_fit_options(fit_options)
+        if fit_options != DoubleMLFitOptions(executor=fit_options.executor, n_jobs_budget=fit_options.n_jobs_budget):
+            raise NotImplementedError('Only the fit options executor and n_jobs_budget are implemented for '
+                                      f'{self.__class__.__name__}.')
+        executor, n_jobs_budget = fit_options.executor, fit_options.n_jobs_budget
+
+        n_jobs_quantile = None
+        if n_jobs_budget is not None:
+            if (n_jobs_models is not None) or (n_jobs_cv is not None):
+                raise ValueError('n_jobs_budget cannot be combined with n_jobs_cv or n_jobs_models.')
+            self._thread_budget['fit'] = _split_n_jobs_budget(n_jobs_budget, n_tasks=self.n_quantiles)
+            n_jobs_models = self._thread_budget['fit']['n_jobs_outer']
+            n_jobs_quantile = self._thread_budget['fit']['n_jobs_inner']
+
+        # the propensity scores (incl. the preliminary ones) do not depend on the quantile and the treatment level; they
+        # are estimated once and shared between all quantile models with the same sample splitting and the same
+        # propensity learners (e.g. not if the learners or splits of a single quantile model were changed)
+        nuisance_caches = {}
+        for model in self.modellist_0 + self.modellist_1:
+            model._nuisance_cache = nuisance_caches.setdefault(self._nuisance_cache_signature(model), {})
+        fit_args = [(i_quant, n_jobs_cv, store_predictions, store_models, n_jobs_quantile)
+                    for i_quant in range(self.n_quantiles)]
+        fitted_models = []
+        try:
+            with _fit_config(executor=executor):
+                fitted_models = [self._fit_quantile(*fit_args[0])]
+                # parallel estimation of the remaining quantiles
+                fitted_models += _parallel_map(self._fit_quantile, fit_args[1:], n_jobs=n_jobs_models)
+        finally:
+            # the cache is only valid within this fit (also if the estimation of a quantile fails)
+            for model in self.modellist_0 + self.modellist_1 + [model for models in fitted_models for model in models]:
+                model._nuisance_cache = None
 
         # combine the estimates and scores
         for i_quant in range(self.n_quantiles):
@@ -429,19 +491,36 @@ class DoubleMLQTE:
 
         return self
 
-    def bootstrap(self, method='normal', n_rep_boot=500):
+    def bootstrap(self, method='normal', n_rep_boot=500, executor=None, chunk_size=None, random_state=None):
         """
         Multiplier bootstrap for DoubleML models.
 
         Parameters
         ----------
         method : str
-            A str (``'Bayes'``, ``'normal'`` or ``'wild'``) specifying the multiplier bootstrap method.
+            A str (``'Bayes'``, ``'normal'``, ``'wild'`` or ``'gaussian-cov'``) specifying the multiplier bootstrap
+            method. For ``'gaussian-cov'`` the bootstrapped t-statistics of the ``'normal'`` method are drawn directly
+            from their Gaussian distribution, whose covariance is estimated once from the scores. This avoids drawing
+            weights for all observations.
             Default is ``'normal'``
 
         n_rep_boot : int
             The number of bootstrap replications.
 
+        executor : None, str or executor
+            The executor for the bootstrap tasks (see :meth:`DoubleML.bootstrap`). The weights are always drawn in
+            the calling process.
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of bootstrap replications for which the multiplier weights are drawn at once (see
+            :meth:`DoubleML.bootstrap`).
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the bootstrap weights (see :meth:`DoubleML.bootstrap`).
+            Default is ``None``.
+
         Returns
         -------
         self : object
@@ -449,8 +528,8 @@ class DoubleMLQTE:
         if np.isnan(self.coef).all():
             raise ValueError('Apply fit() before bootstrap().')
 
-        if (not isinstance(method, str)) | (method not in ['Bayes', 'normal', 'wild']):
-            raise ValueError('Method must be "Bayes", "normal" or "wild". '
+        if (not isinstance(method, str)) | (method not in ['Bayes', 'normal', 'wild', 'gaussian-cov']):
+            raise ValueError('Method must be "Bayes", "normal", "wild" or "gaussian-cov". '
                              f'Got {str(method)}.')
 
         if not isinstance(n_rep_boot, int):
@@ -460,49 +539,64 @@ class DoubleMLQTE:
             raise ValueError('The number of bootstrap replications must be positive. '
                              f'{str(n_rep_boot)} was passed.')
 
+        if chunk_size is not None:
+            _check_integer(chunk_size, 'chunk_size', lower_bound=1)
+        _check_random_state(random_state)
+        _check_executor(executor)
+
         self._n_rep_boot, self._boot_coef, self._boot_t_stat = self._initialize_boot_arrays(n_rep_boot)
 
-        for i_rep in range(self.n_rep):
-            self._i_rep = i_rep
-
-            n_obs = self._dml_data.n_obs
-            weights = _draw_weights(method, n_rep_boot, n_obs)
-            for i_quant in range(self.n_quantiles):
-                self._i_quant = i_quant
-                i_start = self._i_rep * self.n_rep_boot
-                i_end = (self._i_rep + 1) * self.n_rep_boot
-                self._boot_coef[self._i_quant, i_start:i_end], self._boot_t_stat[self._i_quant, i_start:i_end] =\
-                    self._compute_bootstrap(weights)
+        n_obs = self._dml_data.n_obs
+        if method == 'gaussian-cov':
+            # standard normal draws per quantile (instead of weights per observation)
+            boot_func, weight_method, n_weights = _compute_qte_gaussian_cov_boot, 'normal', self.n_quantiles
+        else:
+            boot_func, weight_method, n_weights = _compute_qte_boot, method, n_obs
+
+        # one task per block of bootstrap replications of one repetition (see DoubleML.bootstrap)
+        rep_seeds = [None] * self.n_rep if random_state is None else _spawn_seeds(random_state, self.n_rep)
+        boot_args = ((weights,
+                      self._psi0[:, i_rep, :], self._psi1[:, i_rep, :],
+                      self._psi0_deriv[:, i_rep, :], self._psi1_deriv[:, i_rep, :],
+                      self._all_se[:, i_rep], n_obs)
+                     for i_rep, rep_seed in enumerate(rep_seeds)
+                     for weights in _draw_weight_chunks(weight_method, n_rep_boot, n_weights, chunk_size, rep_seed))
+        with _fit_config(executor=executor):
+            boot_res = _parallel_map(boot_func, boot_args)
+
+        self._boot_coef[:] = np.concatenate([boot_coef for boot_coef, _ in boot_res], axis=1)
+        self._boot_t_stat[:] = np.concatenate([boot_t_stat for _, boot_t_stat in boot_res], axis=1)
         return self
 
-    def draw_sample_splitting(self):
+    def draw_sample_splitting(self, random_state=None):
         """
         Draw sample splitting for DoubleML models.
 
         The samples are drawn according to the attributes
         ``n_folds`` and ``n_rep``.
 
+        Parameters
+        ----------
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            The seed for the sample splitting (see :meth:`DoubleML.draw_sample_splitting`).
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
+        _check_random_state(random_state)
         obj_dml_resampling = DoubleMLResampling(n_folds=self.n_folds,
                                                 n_rep=self.n_rep,
                                                 n_obs=self._dml_data.n_obs,
-                                                stratify=self._dml_data.d)
+                                                stratify=self._dml_data.d,
+                                                random_state=random_state)
         self._smpls = obj_dml_resampling.split_samples()
+        # the models of the potential quantiles use the same sample splitting
+        self._synchronize_sample_splitting(self._modellist_0, self._modellist_1)
 
         return self
 
-    def _compute_bootstrap(self, weights):
-        J0 = np.mean(self.__psi0_deriv)
-        J1 = np.mean(self.__psi1_deriv)
-        scaled_score = self.__psi1 / J1 - self.__psi0 / J0
-
-        boot_coef = np.matmul(weights, scaled_score) / self._dml_data.n_obs
-        boot_t_stat = np.matmul(weights, scaled_score) / (self._dml_data.n_obs * self.__all_se)
-        return boot_coef, boot_t_stat
-
     def confint(self, joint=False, level=0.95):
         """
         Confidence intervals for DoubleML models.
@@ -553,13 +647,16 @@ class DoubleMLQTE:
                              index=self._quantiles)
         return df_ci
 
-    def _fit_quantile(self, i_quant, n_jobs_cv=None, store_predictions=True, store_models=False):
+    def _fit_quantile(self, i_quant, n_jobs_cv=None, store_predictions=True, store_models=False, n_jobs_budget=None):
 
         model_0 = self.modellist_0[i_quant]
         model_1 = self.modellist_1[i_quant]
 
-        model_0.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
-        model_1.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
+        fit_options = DoubleMLFitOptions(n_jobs_budget=n_jobs_budget)
+        model_0.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models,
+                    fit_options=fit_options)
+        model_1.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models,
+                    fit_options=fit_options)
 
         return model_0, model_1
 
@@ -708,11 +805,28 @@ class DoubleMLQTE:
                                        normalize_ipw=self.normalize_ipw,
                                        draw_sample_splitting=False)
 
-            # synchronize the sample splitting
-            model_0.set_sample_splitting(all_smpls=self.smpls)
-            model_1.set_sample_splitting(all_smpls=self.smpls)
-
             modellist_0[i_quant] = model_0
             modellist_1[i_quant] = model_1
 
+        # synchronize the sample splitting
+        if self._smpls is not None:
+            self._synchronize_sample_splitting(modellist_0, modellist_1)
+
         return modellist_0, modellist_1
+
+    @staticmethod
+    def _nuisance_cache_signature(model):
+        # the propensity scores of a quantile model depend on its sample splitting and on its propensity learners (incl.
+        # their hyperparameters)
+        learner_signature = tuple((learner, type(model.learner[learner]).__name__,
+                                   repr(model.learner[learner].get_params(deep=True)), repr(model.params[learner]))
+                                  for learner in model.params_names if learner.startswith('ml_m'))
+        smpls_signature = tuple(smpl.fold_ids.tobytes() if isinstance(smpl, DoubleMLFolds) else
+                                tuple((np.asarray(train).tobytes(), np.asarray(test).tobytes()) for train, test in smpl)
+                                for smpl in model.smpls_folds)
+        return learner_signature, smpls_signature
+
+    def _synchronize_sample_splitting(self, modellist_0, modellist_1):
+        for model_0, model_1 in zip(modellist_0, modellist_1):
+            model_0.set_sample_splitting(all_smpls=self.smpls_folds)
+            model_1.set_sample_splitting(all_smpls=self.smpls_folds)
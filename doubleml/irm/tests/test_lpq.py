@@ -20,6 +20,20 @@ def custom_kde(u, weights):
     return dens.evaluate(0)
 
 
+@pytest.mark.ci
+@pytest.mark.parametrize('n_obs', [50, 1000])
+def test_default_kde(n_obs):
+    np.random.seed(3141)
+    u = np.random.standard_t(3, size=(n_obs, 1)) + 0.3
+    weights = np.random.uniform(0, 3, size=n_obs) * (np.random.uniform(size=n_obs) > 0.4)
+
+    dens = KDEUnivariate(u)
+    dens.fit(kernel='gau', bw='silverman', weights=weights.copy(), fft=False)
+    deriv = _default_kde(u, weights)
+    assert deriv.shape == (1,)
+    assert math.isclose(deriv[0], dens.evaluate(0)[0], rel_tol=1e-9, abs_tol=1e-12)
+
+
 @pytest.fixture(scope='module',
                 params=[0, 1])
 def treatment(request):
@@ -6,7 +6,7 @@ import copy
 import doubleml as dml
 
 from sklearn.base import clone
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.ensemble import RandomForestClassifier
 
 from ...tests._utils import draw_smpls
@@ -166,3 +166,92 @@ def test_doubleml_qte_return_types(dml_qte_fixture):
 
     assert dml_qte_fixture['qte_model'].all_coef.shape == (n_quantiles, n_rep)
     assert isinstance(dml_qte_fixture['unfitted_qte_model'].summary, pd.DataFrame)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('score', ['PQ', 'LPQ', 'CVaR'])
+def test_dml_qte_shared_propensity(score):
+    np.random.seed(3141)
+    n_obs = 300
+    x = np.random.normal(size=(n_obs, 3))
+    z = (np.random.normal(size=n_obs) > 0) * 1.0
+    d = (x[:, 0] + z + np.random.normal(size=n_obs) > 0.5) * 1.0
+    y = d + x[:, 1] + np.random.normal(size=n_obs)
+    if score == 'LPQ':
+        obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d, z)
+    else:
+        obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    ml_g = LinearRegression() if score == 'CVaR' else LogisticRegression()
+
+    dml_qte_obj = dml.DoubleMLQTE(obj_dml_data, ml_g, LogisticRegression(), quantiles=[0.25, 0.5, 0.75],
+                                  score=score, n_folds=2, n_rep=2)
+    dml_qte_obj.fit(store_models=True)
+
+    # the propensity models are only fitted once per fold and repetition
+    learners_m = ['ml_m_z', 'ml_m_d_z0', 'ml_m_d_z1'] if score == 'LPQ' else ['ml_m']
+    models_0 = dml_qte_obj.modellist_0[0].models
+    for model in dml_qte_obj.modellist_0[1:] + dml_qte_obj.modellist_1:
+        assert model._nuisance_cache is None
+        for learner in learners_m:
+            for i_rep in range(2):
+                for i_fold in range(2):
+                    assert model.models[learner]['d'][i_rep][i_fold] is models_0[learner]['d'][i_rep][i_fold]
+
+    # the estimates are equal to the ones of separately fitted models
+    model_class = {'PQ': dml.DoubleMLPQ, 'LPQ': dml.DoubleMLLPQ, 'CVaR': dml.DoubleMLCVAR}[score]
+    for i_quant, quantile in enumerate(dml_qte_obj.quantiles):
+        for treatment, modellist in [(0, dml_qte_obj.modellist_0), (1, dml_qte_obj.modellist_1)]:
+            dml_obj = model_class(obj_dml_data, ml_g, LogisticRegression(), treatment=treatment, quantile=quantile,
+                                  n_folds=2, n_rep=2, draw_sample_splitting=False)
+            dml_obj.set_sample_splitting(dml_qte_obj.smpls)
+            dml_obj.fit()
+            assert np.allclose(dml_obj.all_coef, modellist[i_quant].all_coef, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.ci
+def test_dml_qte_shared_propensity_changed_models():
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(theta=0.5, n_obs=200, dim_x=3)
+    dml_qte_obj = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(),
+                                  quantiles=[0.25, 0.5, 0.75], n_folds=2)
+    # the propensity scores are not shared with quantile models with other hyperparameters or splits
+    dml_qte_obj.modellist_0[1].set_ml_nuisance_params('ml_m', 'd', {'C': 0.1})
+    other_smpls = draw_smpls(200, 2)
+    dml_qte_obj.modellist_1[2].set_sample_splitting(other_smpls)
+    dml_qte_obj.fit(store_models=True)
+
+    models_0 = dml_qte_obj.modellist_0[0].models['ml_m']['d'][0]
+    assert dml_qte_obj.modellist_1[1].models['ml_m']['d'][0][0] is models_0[0]
+    assert dml_qte_obj.modellist_0[1].models['ml_m']['d'][0][0] is not models_0[0]
+    assert dml_qte_obj.modellist_1[2].models['ml_m']['d'][0][0] is not models_0[0]
+
+    for treatment, i_quant, params, smpls in [(0, 1, {'C': 0.1}, dml_qte_obj.smpls), (1, 2, None, other_smpls)]:
+        dml_obj = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), treatment=treatment,
+                                 quantile=dml_qte_obj.quantiles[i_quant], n_folds=2, draw_sample_splitting=False)
+        dml_obj.set_sample_splitting(smpls)
+        if params is not None:
+            dml_obj.set_ml_nuisance_params('ml_m', 'd', params)
+        dml_obj.fit()
+        modellist = dml_qte_obj.modellist_0 if treatment == 0 else dml_qte_obj.modellist_1
+        assert np.allclose(dml_obj.all_coef, modellist[i_quant].all_coef, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.ci
+def test_dml_qte_shared_propensity_failed_fit():
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(theta=0.5, n_obs=200, dim_x=3)
+    dml_qte_obj = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(),
+                                  quantiles=[0.25, 0.5, 0.75], n_folds=2)
+    fit_quantile = dml_qte_obj._fit_quantile
+
+    def fit_quantile_failing(i_quant, *args):
+        if i_quant == 2:
+            raise RuntimeError('Failed quantile fit.')
+        return fit_quantile(i_quant, *args)
+
+    dml_qte_obj._fit_quantile = fit_quantile_failing
+    with pytest.raises(RuntimeError, match='Failed quantile fit.'):
+        dml_qte_obj.fit()
+    # the propensity scores of the failed fit are not reused by later fits of the quantile models
+    for model in dml_qte_obj.modellist_0 + dml_qte_obj.modellist_1:
+        assert model._nuisance_cache is None
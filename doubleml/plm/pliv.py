@@ -1,5 +1,4 @@
 import numpy as np
-from sklearn.utils import check_X_y
 from sklearn.model_selection import KFold
 from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
 from sklearn.linear_model import LinearRegression
@@ -11,7 +10,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune
+from ..utils._estimation import _dml_cv_predict, _dml_cv_predict_batch, _dml_tune
 from ..utils._checks import _check_finite_predictions
 
 
@@ -287,10 +286,33 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return res
 
     def _nuisance_est_partial_x(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        z = self._dml_data.z
+        if self._dml_data.n_instr == 1:
+            z = np.ravel(z)
+            instr_keys = ['ml_m']
+            instr_targets = [z]
+        else:
+            instr_keys = ['ml_m_' + z_col for z_col in self._dml_data.z_cols]
+            instr_targets = [z[:, i_instr] for i_instr in range(self._dml_data.n_instr)]
+
+        # the nuisance models l, m and r do not depend on each other and are fitted in one batch
+        cv_tasks = dict()
+        if external_predictions['ml_l'] is None:
+            cv_tasks['ml_l'] = {'estimator': self._learner['ml_l'], 'x': x, 'y': y, 'smpls': smpls,
+                                'est_params': self._get_params('ml_l'), 'method': self._predict_method['ml_l'],
+                                'return_models': return_models}
+        for key, this_z in zip(instr_keys, instr_targets):
+            if external_predictions[key] is None:
+                cv_tasks[key] = {'estimator': self._learner['ml_m'], 'x': x, 'y': this_z, 'smpls': smpls,
+                                 'est_params': self._get_params(key), 'method': self._predict_method['ml_m'],
+                                 'return_models': return_models}
+        if external_predictions['ml_r'] is None:
+            cv_tasks['ml_r'] = {'estimator': self._learner['ml_r'], 'x': x, 'y': d, 'smpls': smpls,
+                                'est_params': self._get_params('ml_r'), 'method': self._predict_method['ml_r'],
+                                'return_models': return_models}
+        cv_res = _dml_cv_predict_batch(cv_tasks, n_jobs=n_jobs_cv)
 
         # nuisance l
         if external_predictions['ml_l'] is not None:
@@ -298,9 +320,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+            l_hat = cv_res['ml_l']
         _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         predictions = {'ml_l': l_hat['preds']}
@@ -309,16 +329,12 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         # nuisance m
         if self._dml_data.n_instr == 1:
             # one instrument: just identified
-            x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                             force_all_finite=False)
             if external_predictions['ml_m'] is not None:
                 m_hat = {'preds': external_predictions['ml_m'],
                          'targets': None,
                          'models': None}
             else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                m_hat = cv_res['ml_m']
             predictions['ml_m'] = m_hat['preds']
             targets['ml_m'] = m_hat['targets']
             models['ml_m'] = m_hat['models']
@@ -328,9 +344,6 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                      'targets': [None] * self._dml_data.n_instr,
                      'models': [None] * self._dml_data.n_instr}
             for i_instr in range(self._dml_data.n_instr):
-                z = self._dml_data.z
-                x, this_z = check_X_y(x, z[:, i_instr],
-                                      force_all_finite=False)
                 if external_predictions['ml_m_' + self._dml_data.z_cols[i_instr]] is not None:
                     m_hat['preds'][:, i_instr] = external_predictions['ml_m_' + self._dml_data.z_cols[i_instr]]
                     predictions['ml_m_' + self._dml_data.z_cols[i_instr]] = external_predictions[
@@ -338,9 +351,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                     targets['ml_m_' + self._dml_data.z_cols[i_instr]] = None
                     models['ml_m_' + self._dml_data.z_cols[i_instr]] = None
                 else:
-                    res_cv_predict = _dml_cv_predict(self._learner['ml_m'], x, this_z, smpls=smpls, n_jobs=n_jobs_cv,
-                                                     est_params=self._get_params('ml_m_' + self._dml_data.z_cols[i_instr]),
-                                                     method=self._predict_method['ml_m'], return_models=return_models)
+                    res_cv_predict = cv_res['ml_m_' + self._dml_data.z_cols[i_instr]]
 
                     m_hat['preds'][:, i_instr] = res_cv_predict['preds']
 
@@ -356,9 +367,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            r_hat = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                    return_models=return_models)
+            r_hat = cv_res['ml_r']
         _check_finite_predictions(r_hat['preds'], self._learner['ml_r'], 'ml_r', smpls)
         predictions['ml_r'] = r_hat['preds']
         targets['ml_r'] = r_hat['targets']
@@ -437,9 +446,8 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
 
     def _nuisance_est_partial_z(self, smpls, n_jobs_cv, return_models=False):
         y = self._dml_data.y
-        xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
-                          self._dml_data.d,
-                          force_all_finite=False)
+        xz = np.hstack((self._dml_data.x, self._dml_data.z))
+        d = self._dml_data.d
 
         # nuisance m
         r_hat = _dml_cv_predict(self._learner['ml_r'], xz, d, smpls=smpls, n_jobs=n_jobs_cv,
@@ -464,24 +472,26 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return psi_elements, preds
 
     def _nuisance_est_partial_xz(self, smpls, n_jobs_cv, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
-                          self._dml_data.d,
-                          force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        xz = np.hstack((x, self._dml_data.z))
+
+        # the nuisance models l and m do not depend on each other and are fitted in one batch
+        cv_res = _dml_cv_predict_batch(
+            {'ml_l': {'estimator': self._learner['ml_l'], 'x': x, 'y': y, 'smpls': smpls,
+                      'est_params': self._get_params('ml_l'), 'method': self._predict_method['ml_l'],
+                      'return_models': return_models},
+             'ml_m': {'estimator': self._learner['ml_m'], 'x': xz, 'y': d, 'smpls': smpls,
+                      'est_params': self._get_params('ml_m'), 'return_train_preds': True,
+                      'method': self._predict_method['ml_m'], 'return_models': return_models}},
+            n_jobs=n_jobs_cv)
 
         # nuisance l
-        l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                return_models=return_models)
+        l_hat = cv_res['ml_l']
         _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         # nuisance m
-        m_hat = _dml_cv_predict(self._learner['ml_m'], xz, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                est_params=self._get_params('ml_m'), return_train_preds=True,
-                                method=self._predict_method['ml_m'], return_models=return_models)
+        m_hat = cv_res['ml_m']
         _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
         # nuisance r
@@ -519,10 +529,8 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning_partial_x(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                                    search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         if scoring_methods is None:
             scoring_methods = {'ml_l': None,
@@ -540,8 +548,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
             m_tune_res = {instr_var: list() for instr_var in self._dml_data.z_cols}
             z = self._dml_data.z
             for i_instr in range(self._dml_data.n_instr):
-                x, this_z = check_X_y(x, z[:, i_instr],
-                                      force_all_finite=False)
+                this_z = z[:, i_instr]
                 m_tune_res[self._dml_data.z_cols[i_instr]] = _dml_tune(this_z, x, train_inds,
                                                                        self._learner['ml_m'], param_grids['ml_m'],
                                                                        scoring_methods['ml_m'],
@@ -549,8 +556,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                                                                        n_iter_randomized_search)
         else:
             # one instrument: just identified
-            x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                             force_all_finite=False)
+            z = np.ravel(self._dml_data.z)
             m_tune_res = _dml_tune(z, x, train_inds,
                                    self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
                                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
@@ -612,9 +618,8 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning_partial_z(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                                    search_mode, n_iter_randomized_search):
-        xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
-                          self._dml_data.d,
-                          force_all_finite=False)
+        xz = np.hstack((self._dml_data.x, self._dml_data.z))
+        d = self._dml_data.d
 
         if scoring_methods is None:
             scoring_methods = {'ml_r': None}
@@ -637,13 +642,9 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning_partial_xz(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                                     search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
-                          self._dml_data.d,
-                          force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
+        xz = np.hstack((x, self._dml_data.z))
 
         if scoring_methods is None:
             scoring_methods = {'ml_l': None,
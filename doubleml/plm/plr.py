@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from sklearn.utils import check_X_y
 from sklearn.utils.multiclass import type_of_target
 from sklearn.base import clone
 
@@ -11,7 +10,7 @@ from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 from ..utils.blp import DoubleMLBLP
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune
+from ..utils._estimation import _dml_cv_predict, _dml_cv_predict_batch, _dml_tune
 from ..utils._checks import _check_score, _check_finite_predictions, _check_is_propensity
 
 
@@ -158,10 +157,8 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         return
 
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
         m_external = external_predictions['ml_m'] is not None
         l_external = external_predictions['ml_l'] is not None
         if 'ml_g' in self._learner:
@@ -169,6 +166,18 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         else:
             g_external = False
 
+        # the nuisance models l and m do not depend on each other and are fitted in one batch
+        cv_tasks = dict()
+        if not (l_external or (self._score == "IV-type" and g_external)):
+            cv_tasks['ml_l'] = {'estimator': self._learner['ml_l'], 'x': x, 'y': y, 'smpls': smpls,
+                                'est_params': self._get_params('ml_l'), 'method': self._predict_method['ml_l'],
+                                'return_models': return_models}
+        if not m_external:
+            cv_tasks['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m'],
+                                'return_models': return_models}
+        cv_res = _dml_cv_predict_batch(cv_tasks, n_jobs=n_jobs_cv)
+
         # nuisance l
         if l_external:
             l_hat = {'preds': external_predictions['ml_l'],
@@ -179,9 +188,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+            l_hat = cv_res['ml_l']
             _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         # nuisance m
@@ -190,9 +197,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = cv_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
         if self._check_learner(self._learner['ml_m'], 'ml_m', regressor=True, classifier=True):
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
@@ -290,10 +295,8 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
                          search_mode, n_iter_randomized_search):
-        x, y = check_X_y(self._dml_data.x, self._dml_data.y,
-                         force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        x, y = self._dml_data.x, self._dml_data.y
+        d = self._dml_data.d
 
         if scoring_methods is None:
             scoring_methods = {'ml_l': None,
@@ -368,6 +371,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         if self.n_rep != 1:
             raise NotImplementedError('Only implemented for one repetition. ' +
                                       f'Number of repetitions is {str(self.n_rep)}.')
+        self._check_not_lean('cate()')
 
         Y_tilde, D_tilde = self._partial_out()
 
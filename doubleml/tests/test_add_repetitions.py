@@ -0,0 +1,299 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=[None, 2])
+def n_jobs_models(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_add_rep_fixture(n_jobs_models):
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1'])
+
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=5)
+    dml_plr.fit(store_models=True)
+
+    dml_plr_add = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_add.set_sample_splitting(dml_plr.smpls[:2])
+    dml_plr_add.fit(store_models=True)
+    dml_plr_add.bootstrap(n_rep_boot=19)
+    dml_plr_add.add_repetitions(all_smpls=dml_plr.smpls[2:], fit_options={'n_jobs_models': n_jobs_models})
+
+    res_dict = {'dml': dml_plr,
+                'dml_add': dml_plr_add}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_add_rep_coef_se(dml_plr_add_rep_fixture):
+    dml_plr = dml_plr_add_rep_fixture['dml']
+    dml_plr_add = dml_plr_add_rep_fixture['dml_add']
+    assert dml_plr_add.n_rep == 5
+    assert np.array_equal(dml_plr.all_coef, dml_plr_add.all_coef)
+    assert np.array_equal(dml_plr.all_se, dml_plr_add.all_se)
+    assert np.array_equal(dml_plr.coef, dml_plr_add.coef)
+    assert np.array_equal(dml_plr.se, dml_plr_add.se)
+
+
+@pytest.mark.ci
+def test_dml_plr_add_rep_arrays(dml_plr_add_rep_fixture):
+    dml_plr = dml_plr_add_rep_fixture['dml']
+    dml_plr_add = dml_plr_add_rep_fixture['dml_add']
+    assert np.array_equal(dml_plr.psi, dml_plr_add.psi)
+    for learner in ['ml_l', 'ml_m']:
+        assert np.array_equal(dml_plr.predictions[learner], dml_plr_add.predictions[learner])
+        assert np.array_equal(dml_plr.rmses[learner], dml_plr_add.rmses[learner])
+        assert len(dml_plr_add.models[learner]['d']) == 5
+        assert all([models is not None for models in dml_plr_add.models[learner]['X1']])
+    for key in ['sigma2', 'nu2']:
+        assert np.array_equal(dml_plr.sensitivity_elements[key], dml_plr_add.sensitivity_elements[key])
+
+
+@pytest.mark.ci
+def test_dml_plr_add_rep_boot(dml_plr_add_rep_fixture):
+    dml_plr_add = dml_plr_add_rep_fixture['dml_add']
+    assert dml_plr_add.boot_method is None
+    dml_plr_add.bootstrap(n_rep_boot=19)
+    assert dml_plr_add.boot_t_stat.shape == (2, 19 * 5)
+
+
+@pytest.mark.ci
+def test_dml_irm_add_rep_draw():
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(theta=0.5, n_obs=200, dim_x=5)
+    dml_irm = dml.DoubleMLIRM(obj_dml_data, Lasso(alpha=0.05), LogisticRegression(), n_folds=2, n_rep=1)
+    dml_irm.set_ml_nuisance_params('ml_m', 'd', {'C': 0.5})
+    dml_irm.fit()
+    dml_irm.add_repetitions(n_rep_add=2)
+    assert dml_irm.n_rep == 3
+    assert len(dml_irm.smpls) == 3
+    assert not np.isnan(dml_irm.all_coef).any()
+    assert dml_irm.params['ml_m']['d'] == [[{'C': 0.5}] * 2] * 3
+
+
+@pytest.mark.ci
+def test_dml_plr_add_rep_fit_options_random_state():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=3,
+                              draw_sample_splitting=False)
+    dml_plr.draw_sample_splitting(random_state=42)
+    dml_plr.fit(fit_options={'dtype': np.float32, 'fold_contiguous': True})
+
+    # the options of the fit are reused and the new splits only depend on the random_state
+    dml_plr_add = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=1,
+                                  draw_sample_splitting=False)
+    dml_plr_add.draw_sample_splitting(random_state=42)
+    dml_plr_add.fit(fit_options={'dtype': np.float32, 'fold_contiguous': True})
+    np.random.seed(1)
+    dml_plr_add.add_repetitions(n_rep_add=2, random_state=7)
+    assert dml_plr_add.psi.dtype == np.float32
+    dml_plr_add_2 = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=1,
+                                    draw_sample_splitting=False)
+    dml_plr_add_2.draw_sample_splitting(random_state=42)
+    dml_plr_add_2.fit(fit_options={'dtype': np.float32, 'fold_contiguous': True})
+    np.random.seed(2)
+    dml_plr_add_2.add_repetitions(n_rep_add=2, random_state=7, fit_options={'n_jobs_models': 2})
+    assert np.array_equal(dml_plr_add.all_coef, dml_plr_add_2.all_coef)
+    assert np.array_equal(dml_plr.all_coef[:, :1], dml_plr_add.all_coef[:, :1])
+
+    msg = ('The storage options of the additional repetitions have to coincide with the fit. Got dtype=float64 and '
+           'lean=False for the fit with dtype=float32 and lean=False.')
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_add.add_repetitions(n_rep_add=1, fit_options={'dtype': np.float64})
+    msg = 'random_state cannot be combined with all_smpls.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_add.add_repetitions(all_smpls=dml_plr.smpls[1:], random_state=7)
+    assert dml_plr_add.n_rep == 3
+
+
+@pytest.mark.ci
+def test_dml_plr_add_rep_external_predictions(n_jobs_models):
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    ml_m_preds = np.random.normal(size=(200, 4))
+
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=4)
+    dml_plr.fit(external_predictions={'d': {'ml_m': ml_m_preds}})
+
+    dml_plr_add = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=1)
+    dml_plr_add.set_sample_splitting(dml_plr.smpls[:1])
+    dml_plr_add.fit(external_predictions={'d': {'ml_m': ml_m_preds[:, :1]}})
+    dml_plr_add.add_repetitions(all_smpls=dml_plr.smpls[1:], external_predictions={'d': {'ml_m': ml_m_preds[:, 1:]}},
+                                fit_options={'n_jobs_models': n_jobs_models})
+    assert np.array_equal(dml_plr.all_coef, dml_plr_add.all_coef)
+    assert np.array_equal(dml_plr.all_se, dml_plr_add.all_se)
+    assert np.array_equal(dml_plr.predictions['ml_m'], dml_plr_add.predictions['ml_m'])
+
+
+@pytest.mark.ci
+def test_dml_irm_add_rep_external_predictions(n_jobs_models):
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(theta=0.5, n_obs=200, dim_x=5)
+    ml_m_preds = np.random.uniform(low=0.2, high=0.8, size=(200, 3))
+
+    dml_irm = dml.DoubleMLIRM(obj_dml_data, Lasso(alpha=0.05), LogisticRegression(), n_folds=2, n_rep=3)
+    dml_irm.fit(external_predictions={'d': {'ml_m': ml_m_preds}})
+
+    dml_irm_add = dml.DoubleMLIRM(obj_dml_data, Lasso(alpha=0.05), LogisticRegression(), n_folds=2, n_rep=1)
+    dml_irm_add.set_sample_splitting(dml_irm.smpls[:1])
+    dml_irm_add.fit(external_predictions={'d': {'ml_m': ml_m_preds[:, :1]}})
+    dml_irm_add.add_repetitions(all_smpls=dml_irm.smpls[1:], external_predictions={'d': {'ml_m': ml_m_preds[:, 1:]}},
+                                fit_options={'n_jobs_models': n_jobs_models})
+    assert np.array_equal(dml_irm.all_coef, dml_irm_add.all_coef)
+    assert np.array_equal(dml_irm.all_se, dml_irm_add.all_se)
+    assert np.array_equal(dml_irm.predictions['ml_m'], dml_irm_add.predictions['ml_m'])
+
+
+@pytest.mark.ci
+def test_doubleml_exception_add_repetitions():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+
+    msg = r'Apply fit\(\) before add_repetitions\(\).'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions(n_rep_add=1)
+    dml_plr.fit()
+    msg = 'Exactly one of n_rep_add and all_smpls has to be specified.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions()
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions(n_rep_add=1, all_smpls=dml_plr.smpls)
+    msg = 'The number of additional repetitions must be larger or equal to 1. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions(n_rep_add=0)
+    msg = r'all_smpls must be a list of lists of tuples \(train_ind, test_ind\).'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.add_repetitions(all_smpls=dml_plr.smpls[0])
+    msg = 'Invalid partition provided. The number of folds of all additional repetitions has to be 2.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions(all_smpls=[dml_plr.smpls[0][:1]])
+
+    msg = (r"Invalid external_predictions. The additional repetitions require external predictions for the same "
+           r"treatments and learners as the fit \(\{\}\). External predictions for \{'d': \['ml_m'\]\} were passed.")
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions(n_rep_add=1, external_predictions={'d': {'ml_m': np.zeros((100, 1))}})
+    msg = (r'Invalid external_predictions. The supplied predictions have to be of shape \(100, 2\). Invalid predictions '
+           r'for treatment d and learner ml_m. Predictions of shape \(100, 1\) passed.')
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.add_repetitions(n_rep_add=2, external_predictions={'d': {'ml_m': np.zeros((100, 1))}})
+    dml_plr_ext = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+    dml_plr_ext.fit(external_predictions={'d': {'ml_m': np.zeros((100, 1))}})
+    msg = (r"Invalid external_predictions. The additional repetitions require external predictions for the same "
+           r"treatments and learners as the fit \(\{'d': \['ml_m'\]\}\). External predictions for \{\} were passed.")
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_ext.add_repetitions(n_rep_add=1)
+    assert dml_plr_ext.n_rep == 1
+
+    dml_plr_rep = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2, n_rep=2)
+    dml_plr_rep.set_ml_nuisance_params('ml_l', 'd', [[{'alpha': 0.05}] * 2, [{'alpha': 0.1}] * 2])
+    dml_plr_rep.fit()
+    msg = 'The hyperparameters of learner ml_l for treatment variable d differ between repetitions'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_rep.add_repetitions(n_rep_add=1)
+
+    weights_bar = np.ones((100, 1))
+    obj_irm_data = make_irm_data(theta=0.5, n_obs=100, dim_x=5)
+    dml_irm = dml.DoubleMLIRM(obj_irm_data, Lasso(), LogisticRegression(), n_folds=2,
+                              weights={'weights': np.ones(100), 'weights_bar': weights_bar})
+    dml_irm.fit()
+    msg = r'Additional repetitions are not implemented for weights_bar of shape \(n_obs, n_rep\).'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_irm.add_repetitions(n_rep_add=1)
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_adaptive():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=2, n_rep=2)
+    dml_plr.fit_adaptive(tol=0.05, max_n_rep=20, n_rep_step=2)
+
+    trace = dml_plr.adaptive_trace
+    assert list(trace.columns) == ['n_rep', 'time', 'treatment', 'coef', 'std err', 'change']
+    assert trace['n_rep'].iloc[-1] == dml_plr.n_rep
+    assert np.all(np.diff(trace['n_rep']) == 2)
+    assert np.isnan(trace['change'].iloc[0])
+    assert np.allclose(trace['coef'].iloc[-1], dml_plr.coef)
+    assert (dml_plr.n_rep == 20) or (trace['change'].iloc[-1] < 0.05)
+    assert np.all(trace['change'].iloc[1:-1] >= 0.05)
+
+    # budgets
+    dml_plr_rep = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=2, n_rep=2)
+    dml_plr_rep.fit_adaptive(tol=0., max_n_rep=3)
+    assert dml_plr_rep.n_rep == 3
+    assert dml_plr_rep.adaptive_trace['n_rep'].tolist() == [2, 3]
+    dml_plr_time = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=2)
+    dml_plr_time.fit_adaptive(tol=0., max_time=1e-6)
+    assert dml_plr_time.n_rep == 1
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_adaptive_random_state():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    res = list()
+    for global_seed in [1, 2]:
+        dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=2, n_rep=2,
+                                  draw_sample_splitting=False)
+        dml_plr.draw_sample_splitting(random_state=42)
+        # the added repetitions do not depend on the global random state
+        np.random.seed(global_seed)
+        dml_plr.fit_adaptive(tol=0.05, max_n_rep=10, n_rep_step=2, fit_options={'dtype': np.float32},
+                             random_state=7)
+        assert dml_plr.psi.dtype == np.float32
+        res.append(dml_plr)
+    assert res[0].n_rep == res[1].n_rep
+    assert np.array_equal(res[0].all_coef, res[1].all_coef)
+    assert np.array_equal(res[0].coef, res[1].coef)
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_adaptive_zero_se():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=2, n_rep=2)
+    dml_plr.fit()
+
+    # for a previous standard error of zero the absolute change is used
+    coef_prev = dml_plr.coef - 1e-3
+    se_prev = np.zeros(1)
+    trace_step = dml_plr._adaptive_trace_step(0., coef_prev, se_prev)
+    assert np.all(np.isfinite(trace_step['change']))
+    assert np.allclose(trace_step['change'], np.maximum(1e-3, dml_plr.se))
+    dml_plr.se = np.zeros(1)
+    trace_step = dml_plr._adaptive_trace_step(0., coef_prev, se_prev)
+    assert np.allclose(trace_step['change'], 1e-3)
+
+
+@pytest.mark.ci
+def test_doubleml_exception_fit_adaptive():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2, n_rep=2)
+
+    msg = 'tol must be of float type. 1 of type <class \'int\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit_adaptive(tol=1)
+    msg = 'max_n_rep must be larger or equal to 2. 1 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit_adaptive(max_n_rep=1)
+    msg = 'max_time must be None or a number. 1 of type <class \'str\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit_adaptive(max_time='1')
+    msg = 'max_time must be positive. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit_adaptive(max_time=0)
+    msg = 'n_rep_step must be larger or equal to 1. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit_adaptive(n_rep_step=0)
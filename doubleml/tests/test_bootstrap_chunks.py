@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018
+from doubleml.utils._estimation import _compute_boot_t_stats, _compute_qte_boot
+
+
+@pytest.fixture(scope='module',
+                params=['Bayes', 'normal', 'wild'])
+def boot_method(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[1, 7, 30])
+def chunk_size(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_fixture():
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1'])
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr.fit()
+    return dml_plr
+
+
+@pytest.fixture(scope='module')
+def dml_qte_fixture():
+    np.random.seed(3141)
+    n_obs = 300
+    x = np.random.uniform(0, 1, size=(n_obs, 5))
+    d = (np.random.normal(size=n_obs) > 0) * 1.0
+    y = 2 * d + np.random.normal(size=n_obs)
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), quantiles=[0.25, 0.5],
+                              n_folds=2, n_rep=2)
+    dml_qte.fit()
+    return dml_qte
+
+
+@pytest.mark.ci
+def test_doubleml_bootstrap_chunks(dml_plr_fixture, boot_method, chunk_size):
+    np.random.seed(3141)
+    dml_plr_fixture.bootstrap(method=boot_method, n_rep_boot=23)
+    boot_t_stat = dml_plr_fixture.boot_t_stat.copy()
+    state = np.random.get_state()[1].copy()
+
+    np.random.seed(3141)
+    dml_plr_fixture.bootstrap(method=boot_method, n_rep_boot=23, chunk_size=chunk_size)
+    assert np.allclose(boot_t_stat, dml_plr_fixture.boot_t_stat, rtol=1e-12, atol=1e-14)
+    # the random state is advanced in the same way
+    assert np.array_equal(state, np.random.get_state()[1])
+
+
+@pytest.mark.ci
+def test_doubleml_qte_bootstrap_chunks(dml_qte_fixture, boot_method, chunk_size):
+    np.random.seed(3141)
+    dml_qte_fixture.bootstrap(method=boot_method, n_rep_boot=23)
+    boot_coef = dml_qte_fixture._boot_coef.copy()
+    boot_t_stat = dml_qte_fixture._boot_t_stat.copy()
+
+    np.random.seed(3141)
+    dml_qte_fixture.bootstrap(method=boot_method, n_rep_boot=23, chunk_size=chunk_size)
+    assert np.allclose(boot_coef, dml_qte_fixture._boot_coef, rtol=1e-12, atol=1e-14)
+    assert np.allclose(boot_t_stat, dml_qte_fixture._boot_t_stat, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.ci
+def test_doubleml_exception_bootstrap_chunks(dml_plr_fixture, dml_qte_fixture):
+    msg = r'chunk_size must be an integer. 1.5 of type <class \'float\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr_fixture.bootstrap(chunk_size=1.5)
+    msg = 'chunk_size must be larger or equal to 1. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_fixture.bootstrap(chunk_size=0)
+    with pytest.raises(ValueError, match=msg):
+        dml_qte_fixture.bootstrap(chunk_size=0)
+
+
+@pytest.mark.ci
+def test_compute_boot_t_stats_stacked():
+    np.random.seed(3141)
+    n_obs, n_coefs = 100, 4
+    weights = np.random.normal(size=(11, n_obs))
+    psi = np.random.normal(size=(n_obs, n_coefs))
+    psi_deriv = -1. + np.random.normal(size=(n_obs, n_coefs)) * 0.1
+    se = np.random.uniform(0.5, 1., size=n_coefs)
+
+    boot_t_stat = _compute_boot_t_stats(weights, psi, psi_deriv, se, n_obs)
+    boot_coef_qte, boot_t_stat_qte = _compute_qte_boot(weights, psi, 2 * psi, psi_deriv, psi_deriv, se, n_obs)
+    for i_coef in range(n_coefs):
+        J = np.mean(psi_deriv[:, i_coef])
+        assert np.allclose(boot_t_stat[i_coef, :], np.matmul(weights, psi[:, i_coef]) / (n_obs * se[i_coef] * J),
+                           rtol=1e-12, atol=1e-14)
+        assert np.allclose(boot_coef_qte[i_coef, :], np.matmul(weights, psi[:, i_coef] / J) / n_obs,
+                           rtol=1e-12, atol=1e-14)
+        assert np.allclose(boot_t_stat_qte[i_coef, :], boot_coef_qte[i_coef, :] / se[i_coef], rtol=1e-12, atol=1e-14)
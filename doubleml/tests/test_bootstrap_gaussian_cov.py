@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018
+
+
+@pytest.fixture(scope='module')
+def dml_plr_gaussian_cov_fixture():
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1', 'X2'])
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr.fit()
+
+    np.random.seed(3141)
+    dml_plr.bootstrap(method='normal', n_rep_boot=20000)
+    boot_t_stat_normal = dml_plr.boot_t_stat.copy()
+    ci_normal = dml_plr.confint(joint=True)
+    p_adjust_normal = dml_plr.p_adjust('romano-wolf')
+
+    np.random.seed(3141)
+    dml_plr.bootstrap(method='gaussian-cov', n_rep_boot=20000)
+    res_dict = {'dml_plr': dml_plr,
+                'boot_t_stat_normal': boot_t_stat_normal,
+                'ci_normal': ci_normal,
+                'p_adjust_normal': p_adjust_normal}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_gaussian_cov_distribution(dml_plr_gaussian_cov_fixture):
+    dml_plr = dml_plr_gaussian_cov_fixture['dml_plr']
+    boot_t_stat_normal = dml_plr_gaussian_cov_fixture['boot_t_stat_normal']
+    assert dml_plr.boot_method == 'gaussian-cov'
+    assert dml_plr.boot_t_stat.shape == boot_t_stat_normal.shape
+
+    n_obs = dml_plr._dml_data.n_obs
+    n_rep_boot = dml_plr.n_rep_boot
+    for i_rep in range(dml_plr.n_rep):
+        J = np.mean(dml_plr.psi_deriv[:, i_rep, :], axis=0)
+        scaled_psi = dml_plr.psi[:, i_rep, :] / (n_obs * dml_plr.all_se[:, i_rep] * J)
+        cov = np.matmul(scaled_psi.T, scaled_psi)
+        this_boot_t_stat = dml_plr.boot_t_stat[:, (i_rep * n_rep_boot):((i_rep + 1) * n_rep_boot)]
+        this_boot_t_stat_normal = boot_t_stat_normal[:, (i_rep * n_rep_boot):((i_rep + 1) * n_rep_boot)]
+        # the t-statistics of the normal bootstrap and the draws have (approximately) the same covariance
+        assert np.allclose(np.cov(this_boot_t_stat, bias=True), cov, atol=0.05)
+        assert np.allclose(np.cov(this_boot_t_stat_normal, bias=True), cov, atol=0.05)
+
+
+@pytest.mark.ci
+def test_dml_plr_gaussian_cov_joint_inference(dml_plr_gaussian_cov_fixture):
+    dml_plr = dml_plr_gaussian_cov_fixture['dml_plr']
+    ci = dml_plr.confint(joint=True)
+    assert np.allclose(ci.values, dml_plr_gaussian_cov_fixture['ci_normal'].values, rtol=0.05)
+    p_adjust = dml_plr.p_adjust('romano-wolf')
+    assert np.allclose(p_adjust['pval'], dml_plr_gaussian_cov_fixture['p_adjust_normal']['pval'], atol=0.02)
+
+
+@pytest.mark.ci
+def test_dml_qte_gaussian_cov():
+    np.random.seed(3141)
+    n_obs = 300
+    x = np.random.uniform(0, 1, size=(n_obs, 5))
+    d = (np.random.normal(size=n_obs) > 0) * 1.0
+    y = 2 * d + np.random.normal(size=n_obs)
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), quantiles=[0.25, 0.5],
+                              n_folds=2)
+    dml_qte.fit()
+
+    dml_qte.bootstrap(method='gaussian-cov', n_rep_boot=20000)
+    J0 = np.mean(dml_qte._psi0_deriv[:, 0, :], axis=0)
+    J1 = np.mean(dml_qte._psi1_deriv[:, 0, :], axis=0)
+    scaled_score = (dml_qte._psi1[:, 0, :] / J1 - dml_qte._psi0[:, 0, :] / J0) / n_obs
+    cov = np.matmul(scaled_score.T, scaled_score)
+    assert np.allclose(np.cov(dml_qte._boot_coef, bias=True), cov, rtol=0.05, atol=1e-6)
+    assert np.allclose(dml_qte._boot_t_stat, dml_qte._boot_coef / dml_qte._all_se[:, [0]])
+    _ = dml_qte.confint(joint=True)
@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=[None, 2])
+def n_jobs_models(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_checkpoint_fixture(tmp_path_factory, n_jobs_models):
+    checkpoint_dir = str(tmp_path_factory.mktemp('checkpoint'))
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1'])
+
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr.fit(store_models=True)
+
+    dml_plr_cp = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_cp.set_sample_splitting(dml_plr.smpls)
+    dml_plr_cp.fit(store_models=True, fit_options={'n_jobs_models': n_jobs_models, 'checkpoint_dir': checkpoint_dir})
+    n_files = len(os.listdir(checkpoint_dir))
+
+    # simulate an interrupted fit and resume with a model with a different sample splitting
+    os.remove(os.path.join(checkpoint_dir, 'unit_rep1_treat0.pkl'))
+    dml_plr_resumed = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_resumed.fit(store_models=True,
+                        fit_options={'n_jobs_models': n_jobs_models, 'checkpoint_dir': checkpoint_dir, 'resume': True})
+
+    res_dict = {'dml': dml_plr,
+                'dml_cp': dml_plr_cp,
+                'dml_resumed': dml_plr_resumed,
+                'n_files': n_files,
+                'n_files_resumed': len(os.listdir(checkpoint_dir))}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_checkpoint_files(dml_plr_checkpoint_fixture):
+    # metadata and one file per repetition and treatment variable
+    assert dml_plr_checkpoint_fixture['n_files'] == 5
+    assert dml_plr_checkpoint_fixture['n_files_resumed'] == 5
+
+
+@pytest.mark.ci
+def test_dml_plr_checkpoint_coef_se(dml_plr_checkpoint_fixture):
+    for key in ['dml_cp', 'dml_resumed']:
+        assert np.array_equal(dml_plr_checkpoint_fixture['dml'].all_coef, dml_plr_checkpoint_fixture[key].all_coef)
+        assert np.array_equal(dml_plr_checkpoint_fixture['dml'].all_se, dml_plr_checkpoint_fixture[key].all_se)
+
+
+@pytest.mark.ci
+def test_dml_plr_checkpoint_predictions(dml_plr_checkpoint_fixture):
+    for key in ['dml_cp', 'dml_resumed']:
+        for learner in ['ml_l', 'ml_m']:
+            assert np.array_equal(dml_plr_checkpoint_fixture['dml'].predictions[learner],
+                                  dml_plr_checkpoint_fixture[key].predictions[learner])
+        assert len(dml_plr_checkpoint_fixture[key].models['ml_l']['d']) == 2
+
+
+@pytest.mark.ci
+def test_dml_plr_checkpoint_smpls(dml_plr_checkpoint_fixture):
+    smpls = dml_plr_checkpoint_fixture['dml'].smpls
+    smpls_resumed = dml_plr_checkpoint_fixture['dml_resumed'].smpls
+    for i_rep in range(2):
+        for (train, test), (train_resumed, test_resumed) in zip(smpls[i_rep], smpls_resumed[i_rep]):
+            assert np.array_equal(train, train_resumed)
+            assert np.array_equal(test, test_resumed)
+
+
+@pytest.mark.ci
+def test_dml_pq_checkpoint(tmp_path):
+    np.random.seed(3141)
+    data = make_irm_data(theta=0.5, n_obs=500, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', 'd')
+
+    np.random.seed(42)
+    dml_pq = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2,
+                            n_rep=2)
+    dml_pq.fit(fit_options={'checkpoint_dir': str(tmp_path)})
+
+    os.remove(os.path.join(str(tmp_path), 'unit_rep1_treat0.pkl'))
+    np.random.seed(42)
+    dml_pq_resumed = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5,
+                                    n_folds=2, n_rep=2)
+    dml_pq_resumed.fit(fit_options={'checkpoint_dir': str(tmp_path), 'resume': True})
+    assert np.allclose(dml_pq.all_coef, dml_pq_resumed.all_coef)
+    assert np.allclose(dml_pq.all_se, dml_pq_resumed.all_se)
+
+
+@pytest.mark.ci
+def test_doubleml_exception_checkpoint(tmp_path):
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+
+    msg = r'The checkpoint directory must be None, a string or a path-like object. 1 of type <class \'int\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'checkpoint_dir': 1})
+    msg = 'resume must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'checkpoint_dir': str(tmp_path), 'resume': 1})
+    msg = 'A fit can only be resumed from a checkpoint. Specify checkpoint_dir.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(fit_options={'resume': True})
+
+    dml_plr.fit(fit_options={'checkpoint_dir': str(tmp_path)})
+    dml_plr_other = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=3)
+    msg = 'The checkpoint in .* does not match the model. Got n_folds 3 but the checkpoint was created with n_folds 2.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_other.fit(fit_options={'checkpoint_dir': str(tmp_path), 'resume': True})
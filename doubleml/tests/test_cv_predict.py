@@ -6,7 +6,7 @@ from sklearn.model_selection import KFold, train_test_split
 from sklearn.linear_model import Lasso, LogisticRegression
 
 from ._utils_dml_cv_predict import _dml_cv_predict_ut_version
-from doubleml.utils._estimation import _dml_cv_predict
+from doubleml.utils._estimation import _dml_cv_predict, _dml_cv_predict_batch
 
 
 @pytest.fixture(scope='module',
@@ -61,16 +61,22 @@ def cv_predict_fixture(generate_data_cv_predict, cross_fit, params):
                 est_params = {'alpha': 1.}
 
     if method == 'predict_proba':
-        preds = _dml_cv_predict(LogisticRegression(), x, y, smpls,
+        learner = LogisticRegression()
+        preds = _dml_cv_predict(learner, x, y, smpls,
                                 est_params=est_params, method=method)
-        preds_ut = _dml_cv_predict_ut_version(LogisticRegression(), x, y, smpls,
+        preds_ut = _dml_cv_predict_ut_version(learner, x, y, smpls,
                                               est_params=est_params, method=method)[:, 1]
     else:
-        preds = _dml_cv_predict(Lasso(), x, y, smpls, est_params=est_params, method=method)
-        preds_ut = _dml_cv_predict_ut_version(Lasso(), x, y, smpls, est_params=est_params, method=method)
+        learner = Lasso()
+        preds = _dml_cv_predict(learner, x, y, smpls, est_params=est_params, method=method)
+        preds_ut = _dml_cv_predict_ut_version(learner, x, y, smpls, est_params=est_params, method=method)
+
+    task = {'estimator': learner, 'x': x, 'y': y, 'smpls': smpls, 'est_params': est_params, 'method': method}
+    preds_batch = _dml_cv_predict_batch({'a': task, 'b': task}, n_jobs=2)
 
     res_dict = {'preds': preds['preds'],
-                'preds_ut': preds_ut}
+                'preds_ut': preds_ut,
+                'preds_batch': [preds_batch['a']['preds'], preds_batch['b']['preds']]}
 
     return res_dict
 
@@ -83,3 +89,13 @@ def test_cv_predict(cv_predict_fixture):
     assert np.allclose(cv_predict_fixture['preds'][~ind_nan_preds],
                        cv_predict_fixture['preds_ut'][~ind_nan_preds],
                        rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_cv_predict_batch(cv_predict_fixture):
+    ind_nan_preds = np.isnan(cv_predict_fixture['preds'])
+    for preds_batch in cv_predict_fixture['preds_batch']:
+        assert np.array_equal(ind_nan_preds, np.isnan(preds_batch))
+        assert np.allclose(cv_predict_fixture['preds'][~ind_nan_preds],
+                           preds_batch[~ind_nan_preds],
+                           rtol=1e-9, atol=1e-4)
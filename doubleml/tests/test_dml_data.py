@@ -649,3 +649,67 @@ def test_dml_data_w_missings(generate_data_irm_w_missings):
     assert dml_data.force_all_x_finite is False
     dml_data.force_all_x_finite = 'allow-nan'
     assert dml_data.force_all_x_finite == 'allow-nan'
+
+
+@pytest.mark.ci
+def test_dml_data_cached_arrays():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100)
+    df = dml_data.data.copy().iloc[:, :10]
+    df.columns = [f'X{i + 1}' for i in np.arange(7)] + ['y', 'd1', 'd2']
+    x_cols = [f'X{i + 1}' for i in np.arange(7)]
+
+    dml_data = DoubleMLData(df, 'y', ['d1', 'd2'], x_cols, use_other_treat_as_covariate=False)
+    x_d1 = dml_data.x
+    dml_data.set_x_d('d2')
+    # without the other treatment variables as covariates, the same validated array is used for all treatments
+    assert dml_data.x is x_d1
+    assert dml_data.x.flags.c_contiguous
+
+    dml_data.use_other_treat_as_covariate = True
+    dml_data.set_x_d('d2')
+    assert np.array_equal(dml_data.x, df[x_cols + ['d1']].values)
+    assert dml_data.x.flags.c_contiguous
+
+    # the arrays are updated if the roles change
+    dml_data.x_cols = x_cols[:3]
+    assert np.array_equal(dml_data.x, df[x_cols[:3] + ['d2']].values)
+
+    # covariates of mixed types are converted to floats once, as by check_array
+    df['X1'] = df['X1'] > 0
+    dml_data = DoubleMLData(df, 'y', ['d1', 'd2'], x_cols)
+    assert dml_data.x.dtype == np.float64
+    assert np.array_equal(dml_data.x[:, 0], df['X1'].values.astype(np.float64))
+
+    # the stacked covariates of a treatment variable are built once and the cached arrays are read-only
+    x_d1 = dml_data.x
+    dml_data.set_x_d('d2')
+    dml_data.set_x_d('d1')
+    assert dml_data.x is x_d1
+    with pytest.raises(ValueError, match='read-only'):
+        dml_data.x[0, 0] = 1.
+
+    # in-place changes of the data are picked up when the arrays are refreshed (at the beginning of every fit)
+    df.loc[0, 'X2'] = 100.
+    dml_data._refresh_role_arrays()
+    assert dml_data.x[0, 1] == 100.
+    df.loc[0, 'X2'] = np.nan
+    with pytest.raises(ValueError, match='Input contains NaN'):
+        dml_data._refresh_role_arrays()
+
+    # covariates which cannot be converted to floats raise an error
+    df['X2'] = 'a'
+    msg = r"Invalid data. The columns \['X1', 'X2', .*\] cannot be converted to float"
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLData(df, 'y', ['d1', 'd2'], x_cols)
+
+
+@pytest.mark.ci
+def test_dml_data_refresh_at_fit():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100)
+    dml_plr = DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    dml_plr.fit()
+    dml_data.data.loc[:, 'X1'] = np.random.normal(size=100)
+    dml_plr.fit()
+    assert np.array_equal(dml_data.x[:, 0], dml_data.data['X1'].values)
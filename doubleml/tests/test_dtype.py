@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_dtype_fixture(model):
+    np.random.seed(3141)
+    if model == 'plr':
+        obj_dml_data = make_plr_CCDDHNR2018(n_obs=500, dim_x=5)
+        dml_64 = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+        dml_32 = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    else:
+        obj_dml_data = make_irm_data(theta=0.5, n_obs=500, dim_x=5)
+        dml_64 = dml.DoubleMLIRM(obj_dml_data, Lasso(alpha=0.05), LogisticRegression(), n_folds=3, n_rep=2)
+        dml_32 = dml.DoubleMLIRM(obj_dml_data, Lasso(alpha=0.05), LogisticRegression(), n_folds=3, n_rep=2)
+    dml_32.set_sample_splitting(dml_64.smpls)
+
+    dml_64.fit()
+    dml_32.fit(fit_options={'dtype': np.float32})
+
+    np.random.seed(3141)
+    dml_64.bootstrap(n_rep_boot=99)
+    np.random.seed(3141)
+    dml_32.bootstrap(n_rep_boot=99)
+
+    dml_64.sensitivity_analysis(cf_y=0.03, cf_d=0.03)
+    dml_32.sensitivity_analysis(cf_y=0.03, cf_d=0.03)
+
+    res_dict = {'dml_64': dml_64,
+                'dml_32': dml_32}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_dtype_arrays(dml_dtype_fixture):
+    dml_64 = dml_dtype_fixture['dml_64']
+    dml_32 = dml_dtype_fixture['dml_32']
+    assert dml_64.psi.dtype == np.float64
+    assert dml_32.psi.dtype == np.float32
+    assert dml_32.psi_deriv.dtype == np.float32
+    assert all([value.dtype == np.float32 for value in dml_32.psi_elements.values()])
+    assert all([value.dtype == np.float32 for value in dml_32.predictions.values()])
+    assert all([value.dtype == np.float32 for value in dml_32.nuisance_targets.values()])
+    assert dml_32.sensitivity_elements['psi_sigma2'].dtype == np.float32
+    assert dml_32.all_coef.dtype == np.float64
+
+
+@pytest.mark.ci
+def test_dml_dtype_coef_se(dml_dtype_fixture):
+    dml_64 = dml_dtype_fixture['dml_64']
+    dml_32 = dml_dtype_fixture['dml_32']
+    assert np.allclose(dml_64.coef, dml_32.coef, rtol=1e-5, atol=1e-6)
+    assert np.allclose(dml_64.se, dml_32.se, rtol=1e-5, atol=1e-6)
+    assert np.allclose(dml_64.boot_t_stat, dml_32.boot_t_stat, rtol=1e-4, atol=1e-5)
+    for key in ['theta', 'se', 'ci']:
+        for bound in ['lower', 'upper']:
+            assert np.allclose(dml_64.sensitivity_params[key][bound], dml_32.sensitivity_params[key][bound],
+                               rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.ci
+def test_dml_dtype_accuracy_report(dml_dtype_fixture):
+    dml_64 = dml_dtype_fixture['dml_64']
+    dml_32 = dml_dtype_fixture['dml_32']
+    assert dml_64.dtype_accuracy_report is None
+
+    report = dml_32.dtype_accuracy_report
+    assert list(report.columns) == ['coef', 'coef float64', 'abs diff coef', 'std err', 'std err float64',
+                                    'abs diff std err']
+    # the reference estimates coincide with the estimates of the double precision fit
+    assert np.allclose(report['coef float64'], dml_64.coef, rtol=1e-9, atol=1e-12)
+    assert np.allclose(report['std err float64'], dml_64.se, rtol=1e-9, atol=1e-12)
+    assert np.all(report['abs diff coef'] < 1e-5)
+
+
+@pytest.mark.ci
+def test_doubleml_exception_dtype():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+    msg = 'Invalid dtype int64. Valid dtypes are float64 and float32.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(fit_options={'dtype': 'int64'})
+    msg = 'Invalid dtype foo. Valid dtypes are float64 and float32.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(fit_options={'dtype': 'foo'})
@@ -679,7 +679,7 @@ def test_doubleml_exception_bootstrap():
 
     dml_plr_boot.fit()
     dml_qte_boot.fit()
-    msg = 'Method must be "Bayes", "normal" or "wild". Got Gaussian.'
+    msg = 'Method must be "Bayes", "normal", "wild" or "gaussian-cov". Got Gaussian.'
     with pytest.raises(ValueError, match=msg):
         dml_plr_boot.bootstrap(method='Gaussian')
     with pytest.raises(ValueError, match=msg):
@@ -1164,6 +1164,19 @@ def test_doubleml_sensitivity_benchmark():
     with pytest.raises(ValueError, match=msg):
         _ = dml_irm.sensitivity_benchmark(benchmarking_set=['test_var'])
 
+    msg = "benchmarking_sets must be a list or a dictionary. X1 of type <class 'str'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_irm.sensitivity_benchmarks(benchmarking_sets='X1')
+    msg = "benchmarking_sets must not be empty."
+    with pytest.raises(ValueError, match=msg):
+        _ = dml_irm.sensitivity_benchmarks(benchmarking_sets={})
+    msg = "benchmarking_set must be a list. X1 of type <class 'str'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_irm.sensitivity_benchmarks(benchmarking_sets=[['X1'], 'X1'])
+    msg = "The number of CPUs used to fit the short models must be of int type. 1.0 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_irm.sensitivity_benchmarks(benchmarking_sets=[['X1']], n_jobs=1.0)
+
 
 @pytest.mark.ci
 def test_doubleml_sensitivity_plot_input():
@@ -0,0 +1,204 @@
+import weakref
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from sklearn.linear_model import Lasso, LogisticRegression, LinearRegression
+
+import doubleml as dml
+from doubleml import double_ml
+from doubleml.utils import _parallel
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=['threading', 'thread_pool'])
+def executor(request):
+    if request.param == 'thread_pool':
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            yield pool
+    else:
+        yield request.param
+
+
+@pytest.fixture(scope='module',
+                params=['normal', 'wild'])
+def boot_method(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_executor_fixture(executor, boot_method):
+    n_rep_boot = 99
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1'])
+
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_ex = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_ex.set_sample_splitting(dml_plr.smpls)
+
+    dml_plr.fit()
+    dml_plr_ex.fit(n_jobs_cv=2, fit_options={'executor': executor})
+
+    np.random.seed(3141)
+    dml_plr.bootstrap(method=boot_method, n_rep_boot=n_rep_boot)
+    np.random.seed(3141)
+    dml_plr_ex.bootstrap(method=boot_method, n_rep_boot=n_rep_boot, executor=executor)
+
+    res_dict = {'dml': dml_plr,
+                'dml_ex': dml_plr_ex}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_executor_coef_se(dml_plr_executor_fixture):
+    assert np.array_equal(dml_plr_executor_fixture['dml'].all_coef, dml_plr_executor_fixture['dml_ex'].all_coef)
+    assert np.array_equal(dml_plr_executor_fixture['dml'].all_se, dml_plr_executor_fixture['dml_ex'].all_se)
+
+
+@pytest.mark.ci
+def test_dml_plr_executor_boot(dml_plr_executor_fixture):
+    assert np.array_equal(dml_plr_executor_fixture['dml'].boot_t_stat, dml_plr_executor_fixture['dml_ex'].boot_t_stat)
+
+
+@pytest.mark.ci
+def test_dml_plr_executor_tune(executor):
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+    param_grids = {'ml_l': {'alpha': [0.05, 0.1]}, 'ml_m': {'alpha': [0.05, 0.1]}}
+    tune_res = dml_plr.tune(param_grids, tune_on_folds=True, n_folds_tune=2, executor=executor, return_tune_res=True)
+    assert len(tune_res[0][0]['tune_res']['l_tune']) == 2
+    for params in dml_plr.params['ml_l']['d'][0]:
+        assert params['alpha'] in [0.05, 0.1]
+
+
+@pytest.mark.ci
+def test_dml_qte_executor(executor):
+    np.random.seed(3141)
+    data = make_irm_data(theta=0.5, n_obs=500, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', 'd')
+    quantiles = [0.25, 0.75]
+
+    np.random.seed(42)
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), quantiles=quantiles,
+                              n_folds=2)
+    np.random.seed(42)
+    dml_qte_ex = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), quantiles=quantiles,
+                                 n_folds=2)
+
+    dml_qte.fit()
+    dml_qte_ex.fit(n_jobs_models=2, fit_options={'executor': executor})
+    assert np.array_equal(dml_qte.coef, dml_qte_ex.coef)
+    assert np.array_equal(dml_qte.se, dml_qte_ex.se)
+
+    np.random.seed(42)
+    dml_qte.bootstrap(n_rep_boot=49)
+    np.random.seed(42)
+    dml_qte_ex.bootstrap(n_rep_boot=49, executor=executor)
+    assert np.array_equal(dml_qte.boot_t_stat, dml_qte_ex.boot_t_stat)
+
+
+@pytest.mark.ci
+def test_dml_plr_executor_boot_live_chunks(dml_plr_executor_fixture, monkeypatch):
+    dml_plr = dml_plr_executor_fixture['dml']
+    n_live = [0]
+    max_live = [0]
+
+    def _release():
+        n_live[0] -= 1
+
+    def _draw_weight_chunks(*args, **kwargs):
+        for weights in draw_weight_chunks(*args, **kwargs):
+            n_live[0] += 1
+            max_live[0] = max(max_live[0], n_live[0])
+            weakref.finalize(weights, _release)
+            yield weights
+
+    draw_weight_chunks = double_ml._draw_weight_chunks
+    monkeypatch.setattr(double_ml, '_draw_weight_chunks', _draw_weight_chunks)
+    # at most 2 * n_jobs tasks (here with one CPU) are submitted to the executor at once
+    monkeypatch.setattr(_parallel, 'cpu_count', lambda: 1)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        dml_plr.bootstrap(n_rep_boot=100, chunk_size=5, executor=pool)
+    assert dml_plr.boot_t_stat.shape == (2, 200)
+    assert max_live[0] <= 3
+
+    # seeded weights are dispatched in the same blocks
+    max_live[0] = 0
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        dml_plr.bootstrap(n_rep_boot=100, chunk_size=5, executor=pool, random_state=42)
+    assert dml_plr.boot_t_stat.shape == (2, 200)
+    assert max_live[0] <= 3
+
+
+def _quantile_data(score):
+    np.random.seed(3141)
+    n_obs = 500
+    x = np.random.normal(size=(n_obs, 3))
+    z = (np.random.normal(size=n_obs) > 0) * 1.0
+    d = (x[:, 0] + z + np.random.normal(size=n_obs) > 0.5) * 1.0
+    y = d + x[:, 1] + np.random.normal(size=n_obs)
+    if score == 'LPQ':
+        return dml.DoubleMLData.from_arrays(x, y, d, z)
+    return dml.DoubleMLData.from_arrays(x, y, d)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('score', ['PQ', 'LPQ', 'CVaR'])
+def test_dml_qte_n_jobs_cv_executor(executor, score):
+    obj_dml_data = _quantile_data(score)
+    ml_g = LinearRegression() if score == 'CVaR' else LogisticRegression()
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, ml_g, LogisticRegression(), quantiles=[0.25, 0.75], score=score,
+                              n_folds=3, n_rep=2, draw_sample_splitting=False)
+    dml_qte_ex = dml.DoubleMLQTE(obj_dml_data, ml_g, LogisticRegression(), quantiles=[0.25, 0.75], score=score,
+                                 n_folds=3, n_rep=2, draw_sample_splitting=False)
+    dml_qte.draw_sample_splitting(random_state=42)
+    dml_qte_ex.draw_sample_splitting(random_state=42)
+
+    # the folds of the quantile models are estimated in parallel and combined in the order of the folds
+    dml_qte.fit()
+    dml_qte_ex.fit(n_jobs_cv=3, fit_options={'executor': executor})
+    assert np.array_equal(dml_qte.all_coef, dml_qte_ex.all_coef)
+    assert np.array_equal(dml_qte.se, dml_qte_ex.se)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('model_class', [dml.DoubleMLPQ, dml.DoubleMLLPQ, dml.DoubleMLCVAR])
+def test_dml_quantile_models_n_jobs_cv(model_class):
+    score = {dml.DoubleMLPQ: 'PQ', dml.DoubleMLLPQ: 'LPQ', dml.DoubleMLCVAR: 'CVaR'}[model_class]
+    obj_dml_data = _quantile_data(score)
+    ml_g = LinearRegression() if score == 'CVaR' else LogisticRegression()
+    dml_obj = model_class(obj_dml_data, ml_g, LogisticRegression(), quantile=0.25, n_folds=3)
+    dml_obj_parallel = model_class(obj_dml_data, ml_g, LogisticRegression(), quantile=0.25, n_folds=3,
+                                   draw_sample_splitting=False)
+    dml_obj_parallel.set_sample_splitting(dml_obj.smpls)
+
+    # the folds are estimated in separate processes (joblib's default backend)
+    dml_obj.fit(store_models=True)
+    dml_obj_parallel.fit(n_jobs_cv=3, store_models=True)
+    assert np.array_equal(dml_obj.all_coef, dml_obj_parallel.all_coef)
+    assert np.array_equal(dml_obj.all_se, dml_obj_parallel.all_se)
+    for learner in dml_obj.params_names:
+        assert np.array_equal(dml_obj.predictions[learner], dml_obj_parallel.predictions[learner], equal_nan=True)
+        assert len(dml_obj_parallel.models[learner]['d'][0]) == 3
+
+
+@pytest.mark.ci
+def test_doubleml_exception_executor():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso())
+    msg = 'Invalid executor dask_cluster. Valid backend names are '
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(fit_options={'executor': 'dask_cluster'})
+    msg = ('The executor must be None, the name of a registered joblib backend or an object with a submit method '
+           r'\(e.g. a concurrent.futures.Executor\). 2 of type <class \'int\'> was passed.')
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'executor': 2})
+    dml_plr.fit()
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.bootstrap(executor=2)
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.tune({'ml_l': {'alpha': [0.05, 0.1]}, 'ml_m': {'alpha': [0.05, 0.1]}}, executor=2)
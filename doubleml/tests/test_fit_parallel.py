@@ -0,0 +1,239 @@
+import gc
+import os
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LinearRegression, LogisticRegression
+from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils._shared_memory import _shared_arrays
+
+
+@pytest.fixture(scope='module',
+                params=[1, 2])
+def n_jobs_models(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_parallel_fixture(n_jobs_models):
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=300, dim_x=10, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1', 'X2'])
+
+    dml_plr_seq = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_par = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_par.set_sample_splitting(dml_plr_seq.smpls)
+
+    dml_plr_seq.fit(store_models=True)
+    dml_plr_par.fit(store_models=True, fit_options={'n_jobs_models': n_jobs_models})
+
+    res_dict = {'seq': dml_plr_seq,
+                'par': dml_plr_par}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_parallel_coef_se(dml_plr_parallel_fixture):
+    assert np.allclose(dml_plr_parallel_fixture['seq'].all_coef, dml_plr_parallel_fixture['par'].all_coef,
+                       rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_plr_parallel_fixture['seq'].all_se, dml_plr_parallel_fixture['par'].all_se,
+                       rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_dml_plr_parallel_arrays(dml_plr_parallel_fixture):
+    dml_seq = dml_plr_parallel_fixture['seq']
+    dml_par = dml_plr_parallel_fixture['par']
+    assert np.allclose(dml_seq.psi, dml_par.psi, rtol=1e-9, atol=1e-12)
+    for key in dml_seq.psi_elements.keys():
+        assert np.allclose(dml_seq.psi_elements[key], dml_par.psi_elements[key], rtol=1e-9, atol=1e-12)
+    for key in dml_seq.sensitivity_elements.keys():
+        assert np.allclose(dml_seq.sensitivity_elements[key], dml_par.sensitivity_elements[key],
+                           rtol=1e-9, atol=1e-12)
+    for learner in dml_seq.params_names:
+        assert np.allclose(dml_seq.predictions[learner], dml_par.predictions[learner], rtol=1e-9, atol=1e-12)
+        for treat_var in dml_seq._dml_data.d_cols:
+            assert len(dml_par.models[learner][treat_var]) == dml_par.n_rep
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('model_class', [dml.DoubleMLPQ, dml.DoubleMLCVAR])
+def test_dml_quantile_models_parallel(n_jobs_models, model_class):
+    # the root search of every parallel task starts from the initial value, i.e., every repetition is estimated as
+    # in a sequential fit with a single repetition
+    np.random.seed(3141)
+    data = make_irm_data(n_obs=300, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', 'd')
+    ml_g = LogisticRegression() if model_class == dml.DoubleMLPQ else LinearRegression()
+    ml_m = LogisticRegression()
+
+    dml_par = model_class(obj_dml_data, ml_g, ml_m, n_folds=2, n_rep=3)
+    dml_par.fit(fit_options={'n_jobs_models': n_jobs_models})
+    for i_rep in range(3):
+        dml_seq = model_class(obj_dml_data, ml_g, ml_m, n_folds=2, n_rep=1)
+        dml_seq.set_sample_splitting(dml_par.smpls[i_rep])
+        dml_seq.fit()
+        assert np.array_equal(dml_seq.all_coef[:, 0], dml_par.all_coef[:, i_rep])
+        assert np.array_equal(dml_seq.all_se[:, 0], dml_par.all_se[:, i_rep])
+
+
+@pytest.mark.ci
+def test_doubleml_exception_n_jobs_models():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso())
+    msg = "The number of CPUs used to fit the models must be of int type. 1.5 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'n_jobs_models': 1.5})
+    msg = 'shared_memory must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'shared_memory': 1})
+
+
+@pytest.mark.ci
+def test_dml_plr_shared_memory(dml_plr_parallel_fixture, n_jobs_models):
+    dml_seq = dml_plr_parallel_fixture['seq']
+    dml_shared = dml.DoubleMLPLR(dml_seq._dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_shared.set_sample_splitting(dml_seq.smpls)
+    dml_shared.fit(n_jobs_cv=2, fit_options={'n_jobs_models': n_jobs_models, 'shared_memory': True})
+
+    assert np.allclose(dml_seq.all_coef, dml_shared.all_coef, rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_seq.all_se, dml_shared.all_se, rtol=1e-9, atol=1e-12)
+    for learner in dml_seq.params_names:
+        assert np.allclose(dml_seq.predictions[learner], dml_shared.predictions[learner], rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_shared_arrays():
+    x = np.random.normal(size=(100, 5))
+    with _shared_arrays(True) as shared_arrays:
+        temp_folder = shared_arrays.temp_folder
+        x_shared = shared_arrays.share(x)
+        assert isinstance(x_shared, np.memmap)
+        assert np.array_equal(x, x_shared)
+        # the same array is only written once
+        assert shared_arrays.share(x) is x_shared
+        assert shared_arrays.share(x_shared) is x_shared
+        assert shared_arrays.n_arrays == 1
+
+        # views of the same memory are shared as long as the memory is not freed
+        y = x[:, 0]
+        y_shared = shared_arrays.share(y)
+        del y
+        assert shared_arrays.share(x[:, 0]) is y_shared
+        assert shared_arrays.n_arrays == 2
+        del x, y_shared
+        gc.collect()
+        assert shared_arrays.n_arrays == 0
+        assert len(os.listdir(temp_folder)) == 0
+    assert not os.path.exists(temp_folder)
+
+
+@pytest.mark.ci
+def test_shared_arrays_multiple_treatments():
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1', 'X2'])
+    with _shared_arrays(True) as shared_arrays:
+        # the covariates of a treatment variable are released when the next treatment variable is set
+        for treatment_var in obj_dml_data.d_cols:
+            obj_dml_data.set_x_d(treatment_var)
+            x_shared = shared_arrays.share(obj_dml_data.x)
+            assert np.array_equal(x_shared, obj_dml_data.x)
+            assert shared_arrays.n_arrays == 1
+            del x_shared
+
+    with _shared_arrays(False) as shared_arrays:
+        assert shared_arrays is None
+
+
+@pytest.mark.ci
+def test_dml_plr_n_jobs_budget():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    ml = RandomForestRegressor(n_estimators=10, max_depth=3, n_jobs=8, random_state=42)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, ml, ml, n_folds=2)
+    dml_plr_budget = dml.DoubleMLPLR(obj_dml_data, ml, ml, n_folds=2)
+    dml_plr_budget.set_sample_splitting(dml_plr.smpls)
+
+    dml_plr.fit()
+    dml_plr_budget.fit(store_models=True, fit_options={'n_jobs_budget': 5})
+    assert dml_plr_budget.thread_budget['fit'] == {'n_jobs_budget': 5, 'n_jobs_outer': 2, 'n_jobs_inner': 2}
+    for model in dml_plr_budget.models['ml_l']['d'][0]:
+        assert model.n_jobs == 2
+    # the learners of the model are not altered
+    assert dml_plr_budget.learner['ml_l'].n_jobs == 8
+    assert np.allclose(dml_plr.all_coef, dml_plr_budget.all_coef, rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_plr.all_se, dml_plr_budget.all_se, rtol=1e-9, atol=1e-12)
+
+    param_grids = {'ml_l': {'max_depth': [2, 3]}, 'ml_m': {'max_depth': [2, 3]}}
+    tune_res = dml_plr_budget.tune(param_grids, n_folds_tune=3, n_jobs_budget=2, return_tune_res=True)
+    assert dml_plr_budget.thread_budget['tune'] == {'n_jobs_budget': 2, 'n_jobs_outer': 2, 'n_jobs_inner': 1}
+    assert tune_res[0]['tune_res']['l_tune'][0].best_estimator_.n_jobs == 1
+
+
+@pytest.mark.ci
+def test_dml_qte_n_jobs_budget():
+    np.random.seed(3141)
+    data = make_irm_data(theta=0.5, n_obs=500, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', 'd')
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), quantiles=[0.25, 0.5, 0.75],
+                              n_folds=2)
+    dml_qte.fit(fit_options={'n_jobs_budget': 7})
+    assert dml_qte.thread_budget['fit'] == {'n_jobs_budget': 7, 'n_jobs_outer': 3, 'n_jobs_inner': 2}
+    assert dml_qte.modellist_0[0].thread_budget['fit'] == {'n_jobs_budget': 2, 'n_jobs_outer': 2, 'n_jobs_inner': 1}
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('score', ['PQ', 'LPQ', 'CVaR'])
+def test_dml_quantile_models_n_jobs_budget(score):
+    np.random.seed(3141)
+    n_obs = 500
+    x = np.random.normal(size=(n_obs, 3))
+    z = (np.random.normal(size=n_obs) > 0) * 1.0
+    d = (x[:, 0] + z + np.random.normal(size=n_obs) > 0.5) * 1.0
+    y = d + x[:, 1] + np.random.normal(size=n_obs)
+    z = z if score == 'LPQ' else None
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d, z)
+    ml_m = RandomForestClassifier(n_estimators=10, max_depth=3, n_jobs=8, random_state=42)
+    ml_g = RandomForestRegressor(n_estimators=10, max_depth=3, n_jobs=8, random_state=42) if score == 'CVaR' else ml_m
+    model_class = {'PQ': dml.DoubleMLPQ, 'LPQ': dml.DoubleMLLPQ, 'CVaR': dml.DoubleMLCVAR}[score]
+
+    # the learners of the folds (incl. the preliminary ones) get the threads per fold
+    dml_obj = model_class(obj_dml_data, ml_g, ml_m, n_folds=2)
+    dml_obj.fit(store_models=True, fit_options={'n_jobs_budget': 5})
+    assert dml_obj.thread_budget['fit'] == {'n_jobs_budget': 5, 'n_jobs_outer': 2, 'n_jobs_inner': 2}
+    for learner in dml_obj.params_names:
+        for model in dml_obj.models[learner]['d'][0]:
+            assert model.n_jobs == 2
+        assert dml_obj.learner[learner].n_jobs == 8
+
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, ml_g, ml_m, quantiles=[0.25, 0.75], score=score, n_folds=2)
+    dml_qte.fit(store_models=True, fit_options={'n_jobs_budget': 4})
+    assert dml_qte.modellist_0[0].thread_budget['fit'] == {'n_jobs_budget': 2, 'n_jobs_outer': 2, 'n_jobs_inner': 1}
+    for model_0, model_1 in zip(dml_qte.modellist_0, dml_qte.modellist_1):
+        for learner in model_0.params_names:
+            for model in model_0.models[learner]['d'][0] + model_1.models[learner]['d'][0]:
+                assert model.n_jobs == 1
+
+
+@pytest.mark.ci
+def test_doubleml_exception_n_jobs_budget():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso())
+    msg = "The CPU budget must be of int type. 1.5 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'n_jobs_budget': 1.5})
+    msg = r'The CPU budget must be positive or -1 \(all CPUs\). 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(fit_options={'n_jobs_budget': 0})
+    msg = 'n_jobs_budget cannot be combined with n_jobs_cv or n_jobs_models.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(n_jobs_cv=2, fit_options={'n_jobs_budget': 2})
+    msg = 'n_jobs_budget cannot be combined with n_jobs_cv.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.tune({'ml_l': {'alpha': [0.05, 0.1]}, 'ml_m': {'alpha': [0.05, 0.1]}}, n_jobs_budget=2, n_jobs_cv=2)
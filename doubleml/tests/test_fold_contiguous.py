@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LinearRegression, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data, make_iivm_data, make_pliv_CHS2015, make_did_SZ2020
+from doubleml.utils import DoubleMLFolds
+from doubleml.utils._config import _fit_config
+from doubleml.utils._estimation import _dml_cv_predict, _get_cond_smpls, _FoldContiguousLayout, _take_rows
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm', 'iivm', 'did_cs', 'pliv'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[None, 2])
+def n_jobs_models(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_fold_contiguous_fixture(model, n_jobs_models):
+    np.random.seed(3141)
+    if model == 'plr':
+        obj_dml_data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5)
+        dml_args = (obj_dml_data, LinearRegression(), LinearRegression())
+        dml_class = dml.DoubleMLPLR
+    elif model == 'irm':
+        obj_dml_data = make_irm_data(theta=0.5, n_obs=300, dim_x=5)
+        dml_args = (obj_dml_data, LinearRegression(), LogisticRegression())
+        dml_class = dml.DoubleMLIRM
+    elif model == 'iivm':
+        # conditional sample splittings for the outcome and treatment regressions
+        obj_dml_data = make_iivm_data(n_obs=300, dim_x=5)
+        dml_args = (obj_dml_data, LinearRegression(), LogisticRegression(), LogisticRegression())
+        dml_class = dml.DoubleMLIIVM
+    elif model == 'did_cs':
+        # conditional sample splittings for four groups
+        obj_dml_data = make_did_SZ2020(n_obs=300, cross_sectional_data=True)
+        dml_args = (obj_dml_data, LinearRegression(), LogisticRegression())
+        dml_class = dml.DoubleMLDIDCS
+    else:
+        # fold-specific targets and train predictions for the partialling out of X and Z
+        obj_dml_data = make_pliv_CHS2015(n_obs=300, dim_x=5, dim_z=2)
+        dml_args = (obj_dml_data, LinearRegression(), LinearRegression(), LinearRegression())
+        dml_class = dml.DoubleMLPLIV._partialXZ
+
+    dml_obj = dml_class(*dml_args, n_folds=3, n_rep=2)
+    dml_obj_contiguous = dml_class(*dml_args, n_folds=3, n_rep=2)
+    dml_obj_contiguous.set_sample_splitting(dml_obj.smpls)
+
+    dml_obj.fit()
+    dml_obj_contiguous.fit(fit_options={'fold_contiguous': True, 'n_jobs_models': n_jobs_models})
+
+    res_dict = {'dml': dml_obj,
+                'dml_contiguous': dml_obj_contiguous}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_fold_contiguous_coef_se(dml_fold_contiguous_fixture):
+    dml_obj = dml_fold_contiguous_fixture['dml']
+    dml_obj_contiguous = dml_fold_contiguous_fixture['dml_contiguous']
+    assert np.allclose(dml_obj.all_coef, dml_obj_contiguous.all_coef, rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_obj.all_se, dml_obj_contiguous.all_se, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_dml_fold_contiguous_predictions(dml_fold_contiguous_fixture):
+    dml_obj = dml_fold_contiguous_fixture['dml']
+    dml_obj_contiguous = dml_fold_contiguous_fixture['dml_contiguous']
+    for learner in dml_obj.predictions.keys():
+        assert np.allclose(dml_obj.predictions[learner], dml_obj_contiguous.predictions[learner],
+                           rtol=1e-9, atol=1e-12, equal_nan=True)
+        assert np.array_equal(dml_obj.nuisance_targets[learner], dml_obj_contiguous.nuisance_targets[learner],
+                              equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_cv_predict_fold_contiguous():
+    np.random.seed(3141)
+    n_obs = 103
+    x = np.random.normal(size=(n_obs, 3))
+    y = x @ np.array([1., -1., 0.5]) + np.random.normal(size=n_obs)
+    folds = DoubleMLFolds(np.random.permutation(np.arange(n_obs) % 4))
+
+    res = _dml_cv_predict(Lasso(alpha=0.1), x, y, folds, return_models=True)
+    with _fit_config(fold_contiguous=True):
+        res_contiguous = _dml_cv_predict(Lasso(alpha=0.1), x, y, folds, return_models=True)
+    assert np.allclose(res['preds'], res_contiguous['preds'], rtol=1e-9, atol=1e-12)
+    assert np.array_equal(res['targets'], res_contiguous['targets'])
+    for model, model_contiguous in zip(res['models'], res_contiguous['models']):
+        assert np.allclose(model.coef_, model_contiguous.coef_, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_fold_contiguous_layout_cond_smpls():
+    np.random.seed(3141)
+    n_obs = 103
+    x = np.random.normal(size=(n_obs, 3))
+    d = np.random.binomial(1, 0.4, size=n_obs)
+    y = x @ np.array([1., -1., 0.5]) + d + np.random.normal(size=n_obs)
+    folds = DoubleMLFolds(np.random.permutation(np.arange(n_obs) % 4))
+    smpls_d0, smpls_d1 = _get_cond_smpls(folds, d)
+
+    # the conditional train sets are slices of the layout sorted by fold and group
+    layout = _FoldContiguousLayout(folds, smpls_d0.groups)
+    for cond_smpls in [smpls_d0, smpls_d1]:
+        for (train_index, test_index), (train_slices, test_slice) in zip(cond_smpls, layout.splits(cond_smpls)):
+            assert np.array_equal(np.sort(_take_rows(layout.order, train_slices)), train_index)
+            assert np.array_equal(np.sort(layout.order[test_slice]), test_index)
+    for (train_index, _), (train_slices, _) in zip(folds, layout.splits(folds)):
+        assert np.array_equal(np.sort(_take_rows(layout.order, train_slices)), train_index)
+
+    res = _dml_cv_predict(Lasso(alpha=0.1), x, y, smpls_d1, return_models=True)
+    with _fit_config(fold_contiguous=True):
+        res_contiguous = _dml_cv_predict(Lasso(alpha=0.1), x, y, smpls_d1, return_models=True)
+    assert np.allclose(res['preds'], res_contiguous['preds'], rtol=1e-9, atol=1e-12)
+    assert np.array_equal(res['targets'], res_contiguous['targets'])
+
+
+@pytest.mark.ci
+def test_doubleml_exception_fold_contiguous():
+    np.random.seed(3141)
+    dml_plr = dml.DoubleMLPLR(make_plr_CCDDHNR2018(n_obs=100, dim_x=5), Lasso(), Lasso(), n_folds=2)
+    msg = 'fold_contiguous must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options={'fold_contiguous': 1})
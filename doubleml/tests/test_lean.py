@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=[None, 2])
+def n_jobs_models(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_lean_fixture(n_jobs_models):
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1'])
+
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_lean = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_lean.set_sample_splitting(dml_plr.smpls)
+
+    dml_plr.fit()
+    dml_plr_lean.fit(store_models=True, fit_options={'lean': True, 'n_jobs_models': n_jobs_models})
+
+    res_dict = {'dml': dml_plr,
+                'dml_lean': dml_plr_lean}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_lean_coef_se(dml_plr_lean_fixture):
+    dml_plr = dml_plr_lean_fixture['dml']
+    dml_plr_lean = dml_plr_lean_fixture['dml_lean']
+    assert np.array_equal(dml_plr.all_coef, dml_plr_lean.all_coef)
+    assert np.array_equal(dml_plr.all_se, dml_plr_lean.all_se)
+    assert np.array_equal(dml_plr.coef, dml_plr_lean.coef)
+    assert np.array_equal(dml_plr.se, dml_plr_lean.se)
+    pd.testing.assert_frame_equal(dml_plr.confint(), dml_plr_lean.confint())
+    for learner in ['ml_l', 'ml_m']:
+        assert np.array_equal(dml_plr.rmses[learner], dml_plr_lean.rmses[learner])
+
+
+@pytest.mark.ci
+def test_dml_plr_lean_arrays(dml_plr_lean_fixture):
+    dml_plr_lean = dml_plr_lean_fixture['dml_lean']
+    assert dml_plr_lean.psi is None
+    assert dml_plr_lean.psi_deriv is None
+    assert dml_plr_lean.psi_elements is None
+    assert dml_plr_lean.predictions is None
+    assert dml_plr_lean.nuisance_targets is None
+    assert dml_plr_lean.sensitivity_elements is None
+    assert all([model is not None for model in dml_plr_lean.models['ml_l']['X1']])
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    # records the results of all tasks submitted by the fit
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.results = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self.results.append(f.result()))
+        return future
+
+
+def _per_obs_arrays(obj, n_obs):
+    if isinstance(obj, np.ndarray):
+        return [obj] if (obj.ndim > 0) and (obj.shape[0] == n_obs) else []
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, (list, tuple)):
+        return [arr for item in obj for arr in _per_obs_arrays(item, n_obs)]
+    return []
+
+
+@pytest.mark.ci
+def test_dml_plr_lean_n_jobs_models(dml_plr_lean_fixture):
+    # in lean mode the workers solve the score and only return the estimates of their unit
+    dml_plr = dml_plr_lean_fixture['dml']
+    dml_plr_lean = dml.DoubleMLPLR(dml_plr._dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_lean.set_sample_splitting(dml_plr.smpls)
+
+    with _RecordingExecutor() as executor:
+        dml_plr_lean.fit(fit_options={'lean': True, 'n_jobs_models': 2, 'executor': executor})
+    assert len(executor.results) == 4
+    assert _per_obs_arrays(executor.results, dml_plr._dml_data.n_obs) == []
+
+    assert np.array_equal(dml_plr.all_coef, dml_plr_lean.all_coef)
+    assert np.array_equal(dml_plr.all_se, dml_plr_lean.all_se)
+    for learner in ['ml_l', 'ml_m']:
+        assert np.array_equal(dml_plr.rmses[learner], dml_plr_lean.rmses[learner])
+    assert dml_plr_lean.psi is None
+    assert dml_plr_lean.psi_elements is None
+    assert dml_plr_lean.predictions is None
+    assert dml_plr_lean.nuisance_targets is None
+
+
+@pytest.mark.ci
+def test_dml_plr_lean_refit(dml_plr_lean_fixture):
+    dml_plr = dml_plr_lean_fixture['dml']
+    dml_plr_refit = dml.DoubleMLPLR(dml_plr._dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=2)
+    dml_plr_refit.set_sample_splitting(dml_plr.smpls)
+    dml_plr_refit.fit(fit_options={'lean': True})
+    dml_plr_refit.add_repetitions(n_rep_add=1)
+    assert dml_plr_refit.psi is None
+    assert not np.isnan(dml_plr_refit.all_coef).any()
+
+    dml_plr_refit.fit()
+    assert np.array_equal(dml_plr.psi, dml_plr_refit.psi[:, :2, :])
+    dml_plr_refit.bootstrap(n_rep_boot=19)
+
+
+@pytest.mark.ci
+def test_doubleml_exception_lean():
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(theta=0.5, n_obs=200, dim_x=5)
+    dml_irm = dml.DoubleMLIRM(obj_dml_data, Lasso(), LogisticRegression(), n_folds=2)
+
+    msg = 'lean must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_irm.fit(fit_options={'lean': 1})
+
+    dml_irm.fit(fit_options={'lean': True})
+    msg = (r'bootstrap\(\) is not available for models fitted with lean=True, as the scores and predictions are not '
+           r'stored. Apply fit\(\) with lean=False.')
+    with pytest.raises(ValueError, match=msg):
+        dml_irm.bootstrap()
+    msg = 'The sensitivity analysis is not available for models fitted with lean=True'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm.sensitivity_analysis()
+    msg = r'sensitivity_benchmark\(\) is not available for models fitted with lean=True'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm.sensitivity_benchmark(['X1'])
+    msg = r'evaluate_learners\(\) is not available for models fitted with lean=True'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm.evaluate_learners()
+    msg = r'cate\(\) is not available for models fitted with lean=True'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm.gate(pd.DataFrame(np.random.choice(['a', 'b'], 200)))
+    msg = r'policy_tree\(\) is not available for models fitted with lean=True'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm.policy_tree(pd.DataFrame(np.random.normal(size=(200, 2))))
+
+    dml_plr = dml.DoubleMLPLR(make_plr_CCDDHNR2018(n_obs=100, dim_x=5), Lasso(), Lasso(), n_folds=2)
+    dml_plr.fit(fit_options={'lean': True})
+    msg = r'cate\(\) is not available for models fitted with lean=True'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.cate(pd.DataFrame(np.ones((100, 1))))
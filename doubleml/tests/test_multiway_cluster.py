@@ -12,6 +12,7 @@ from ._utils import _clone
 from ._utils_cluster import var_one_way_cluster, est_one_way_cluster_dml2, \
     est_two_way_cluster_dml2, var_two_way_cluster
 from ..plm.tests._utils_pliv_manual import fit_pliv, compute_pliv_residuals
+from ..utils._estimation import _var_est
 
 np.random.seed(1234)
 # Set the simulation parameters
@@ -281,3 +282,32 @@ def test_dml_plr_cluster_with_index_se(dml_plr_cluster_with_index):
     assert math.isclose(dml_plr_cluster_with_index['se'][0],
                         dml_plr_cluster_with_index['se_manual'][0],
                         rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.mark.ci
+def test_var_est_cluster():
+    np.random.seed(3141)
+    # unsorted, non-integer cluster labels and several observations per (one-way) cluster
+    n_first, n_second = 12, 9
+    cluster_var1 = np.repeat(np.random.permutation(n_first) * 1.5 + 0.25, n_second)
+    cluster_var2 = np.tile(np.random.permutation(n_second) - 4, n_first)
+    cluster_vars = np.column_stack((cluster_var1, cluster_var2))
+    n_obs = cluster_vars.shape[0]
+    psi = np.random.normal(size=n_obs)
+    psi_a = -1. + np.random.normal(size=n_obs) * 0.1
+
+    for n_cluster_vars in [1, 2]:
+        resampling = dml.utils.resampling.DoubleMLClusterResampling(n_folds=3, n_rep=1, n_obs=n_obs,
+                                                                    n_cluster_vars=n_cluster_vars,
+                                                                    cluster_vars=cluster_vars[:, :n_cluster_vars])
+        smpls, smpls_cluster = resampling.split_samples()
+        sigma2_hat, var_scaling_factor = _var_est(psi, psi_a, smpls[0], is_cluster_data=True,
+                                                  cluster_vars=cluster_vars[:, :n_cluster_vars],
+                                                  smpls_cluster=smpls_cluster[0], n_folds_per_cluster=3)
+        if n_cluster_vars == 1:
+            var = var_one_way_cluster(psi, psi_a, cluster_var1, smpls[0])
+            assert var_scaling_factor == n_first
+        else:
+            var = var_two_way_cluster(psi, psi_a, cluster_var1, cluster_var2, smpls[0])
+            assert var_scaling_factor == n_second
+        assert math.isclose(sigma2_hat, np.squeeze(var), rel_tol=1e-9, abs_tol=1e-12)
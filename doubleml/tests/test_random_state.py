@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_pliv_multiway_cluster_CKMS2021
+
+
+@pytest.fixture(scope='module',
+                params=['Bayes', 'normal', 'wild', 'gaussian-cov'])
+def boot_method(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_random_state_fixture():
+    np.random.seed(3141)
+    data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d', 'X1'])
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_folds=3, n_rep=3)
+    dml_plr.draw_sample_splitting(random_state=42)
+    dml_plr.fit()
+    return dml_plr
+
+
+@pytest.mark.ci
+def test_dml_random_state_sample_splitting(dml_plr_random_state_fixture):
+    dml_plr = dml_plr_random_state_fixture
+    smpls = dml_plr.smpls_folds
+    dml_plr_2 = dml.DoubleMLPLR(dml_plr._dml_data, Lasso(), Lasso(), n_folds=3, n_rep=2,
+                                draw_sample_splitting=False)
+
+    # the splits of every repetition only depend on its own random stream
+    dml_plr_2.draw_sample_splitting(random_state=42)
+    for i_rep in range(2):
+        assert np.array_equal(dml_plr_2.smpls_folds[i_rep].fold_ids, smpls[i_rep].fold_ids)
+    dml_plr_2.draw_sample_splitting(random_state=43)
+    assert not np.array_equal(dml_plr_2.smpls_folds[0].fold_ids, smpls[0].fold_ids)
+
+    # the global random state is not used
+    np.random.seed(1)
+    state = np.random.get_state()[1].copy()
+    dml_plr_2.draw_sample_splitting(random_state=np.random.SeedSequence(42))
+    assert np.array_equal(dml_plr_2.smpls_folds[1].fold_ids, smpls[1].fold_ids)
+    assert np.array_equal(state, np.random.get_state()[1])
+
+
+@pytest.mark.ci
+def test_dml_random_state_cluster_sample_splitting():
+    np.random.seed(3141)
+    (x, y, d, cluster_vars, z) = make_pliv_multiway_cluster_CKMS2021(10, 10, 5, return_type='array')
+    obj_dml_data = dml.DoubleMLClusterData.from_arrays(x, y, d, cluster_vars, z)
+    dml_pliv = dml.DoubleMLPLIV(obj_dml_data, Lasso(), Lasso(), Lasso(), n_folds=2, n_rep=2,
+                                draw_sample_splitting=False)
+    dml_pliv.draw_sample_splitting(random_state=42)
+    smpls, smpls_cluster = dml_pliv.smpls, dml_pliv.smpls_cluster
+    dml_pliv.draw_sample_splitting(random_state=42)
+    for i_rep in range(2):
+        for (train, test), (train_2, test_2) in zip(smpls[i_rep], dml_pliv.smpls[i_rep]):
+            assert np.array_equal(train, train_2)
+            assert np.array_equal(test, test_2)
+    assert str(smpls_cluster) == str(dml_pliv.smpls_cluster)
+
+
+@pytest.mark.ci
+def test_dml_random_state_bootstrap(dml_plr_random_state_fixture, boot_method):
+    dml_plr = dml_plr_random_state_fixture
+    np.random.seed(1)
+    state = np.random.get_state()[1].copy()
+    dml_plr.bootstrap(method=boot_method, n_rep_boot=47, random_state=7)
+    boot_t_stat = dml_plr.boot_t_stat.copy()
+    assert np.array_equal(state, np.random.get_state()[1])
+
+    # the weights do not depend on the blocks (up to the rounding of the matrix products) and the parallel
+    # bootstrap is bit-identical to the serial one
+    dml_plr.bootstrap(method=boot_method, n_rep_boot=47, random_state=7, chunk_size=10)
+    boot_t_stat_chunks = dml_plr.boot_t_stat.copy()
+    assert np.allclose(boot_t_stat, boot_t_stat_chunks, rtol=1e-9, atol=1e-12)
+    dml_plr.bootstrap(method=boot_method, n_rep_boot=47, random_state=7, chunk_size=10, executor='threading')
+    assert np.array_equal(boot_t_stat_chunks, dml_plr.boot_t_stat)
+    dml_plr.bootstrap(method=boot_method, n_rep_boot=47, random_state=8)
+    assert not np.array_equal(boot_t_stat, dml_plr.boot_t_stat)
+
+
+@pytest.mark.ci
+def test_dml_random_state_tune(dml_plr_random_state_fixture):
+    dml_plr = dml_plr_random_state_fixture
+    param_grids = {'ml_l': {'alpha': np.linspace(0.01, 0.5, 50)}, 'ml_m': {'alpha': np.linspace(0.01, 0.5, 50)}}
+    tuned_params = list()
+    for _ in range(2):
+        dml_plr_tune = dml.DoubleMLPLR(dml_plr._dml_data, Lasso(), Lasso(), n_folds=3, n_rep=3,
+                                       draw_sample_splitting=False)
+        dml_plr_tune.set_sample_splitting(dml_plr.smpls)
+        dml_plr_tune.tune(param_grids, tune_on_folds=True, n_folds_tune=3, search_mode='randomized_search',
+                          n_iter_randomized_search=5, random_state=11)
+        tuned_params.append(dml_plr_tune.params)
+    assert tuned_params[0] == tuned_params[1]
+
+    # the folds for tuning and the randomized search only depend on the random_state
+    tune_res = [dml_plr.tune(param_grids, n_folds_tune=3, search_mode='randomized_search', n_iter_randomized_search=5,
+                             return_tune_res=True, random_state=11, set_as_params=False)
+                for _ in range(2)]
+    for i_d in range(dml_plr._dml_data.n_treat):
+        for learner in ['ml_l', 'ml_m']:
+            for search, search_2 in zip(tune_res[0][i_d]['tune_res'][learner.replace('ml_', '') + '_tune'],
+                                        tune_res[1][i_d]['tune_res'][learner.replace('ml_', '') + '_tune']):
+                assert np.array_equal(search.cv_results_['param_alpha'], search_2.cv_results_['param_alpha'])
+                assert np.array_equal(search.cv_results_['mean_test_score'], search_2.cv_results_['mean_test_score'])
+
+
+@pytest.mark.ci
+def test_dml_qte_random_state():
+    np.random.seed(3141)
+    n_obs = 300
+    x = np.random.uniform(0, 1, size=(n_obs, 5))
+    d = (np.random.normal(size=n_obs) > 0) * 1.0
+    y = 2 * d + np.random.normal(size=n_obs)
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_qte = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), quantiles=[0.25, 0.5],
+                              n_folds=2, n_rep=2, draw_sample_splitting=False)
+    dml_qte.draw_sample_splitting(random_state=5)
+    dml_qte.fit()
+
+    dml_qte.bootstrap(n_rep_boot=31, random_state=3)
+    boot_coef = dml_qte._boot_coef.copy()
+    dml_qte.bootstrap(n_rep_boot=31, random_state=3, chunk_size=4)
+    assert np.allclose(boot_coef, dml_qte._boot_coef, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_doubleml_exception_random_state(dml_plr_random_state_fixture):
+    dml_plr = dml_plr_random_state_fixture
+    msg = ("random_state must be None, an integer or a numpy.random.SeedSequence. "
+           "a of type <class 'str'> was passed.")
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.draw_sample_splitting(random_state='a')
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.bootstrap(random_state='a')
+    msg = 'random_state must be non-negative. -1 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.tune({'ml_l': {'alpha': [0.05, 0.1]}, 'ml_m': {'alpha': [0.05, 0.1]}}, random_state=-1)
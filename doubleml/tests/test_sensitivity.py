@@ -4,6 +4,8 @@ import numpy as np
 import doubleml as dml
 from sklearn.linear_model import LinearRegression
 
+from doubleml.utils._estimation import _confounding_strength
+
 from ._utils_doubleml_sensitivity_manual import doubleml_sensitivity_manual, \
     doubleml_sensitivity_benchmark_manual
 
@@ -71,13 +73,40 @@ def dml_sensitivity_multitreat_fixture(generate_data_bivariate, n_rep, cf_y, cf_
                                              level=level)
     benchmark = dml_plr_obj.sensitivity_benchmark(benchmarking_set=["X1"])
 
+    # evaluation of the bounds on a grid of sensitivity parameters (as in sensitivity_plot)
+    cf_d_grid, cf_y_grid = np.meshgrid([0.0, cf_d, 0.2], [0.0, cf_y, 0.15], indexing='ij')
+    confounding_strength = _confounding_strength(cf_y_grid, cf_d_grid, rho)
+    res_grid = dml_plr_obj._sensitivity_bounds(dml_plr_obj._sensitivity_moments(),
+                                               confounding_strength[:, :, np.newaxis, np.newaxis], level)
+    res_grid_manual = [[doubleml_sensitivity_manual(sensitivity_elements=dml_plr_obj.sensitivity_elements,
+                                                    all_coefs=dml_plr_obj.all_coef,
+                                                    psi=dml_plr_obj.psi,
+                                                    psi_deriv=dml_plr_obj.psi_deriv,
+                                                    cf_y=cf_y_grid[i, j],
+                                                    cf_d=cf_d_grid[i, j],
+                                                    rho=rho,
+                                                    level=level)
+                        for j in range(cf_d_grid.shape[1])]
+                       for i in range(cf_d_grid.shape[0])]
+
     benchmark_manual = doubleml_sensitivity_benchmark_manual(dml_obj=dml_plr_obj,
                                                              benchmarking_set=["X1"])
+    # the relevant bounds at the robustness values equal the null hypothesis
+    res_rv = [dml_plr_obj._calc_sensitivity_analysis(cf_y=rv, cf_d=rv, rho=rho, level=level)
+              for rv in dml_plr_obj.sensitivity_params['rv']]
+    res_rva = [dml_plr_obj._calc_sensitivity_analysis(cf_y=rva, cf_d=rva, rho=rho, level=level)
+               for rva in dml_plr_obj.sensitivity_params['rva']]
+
     res_dict = {'sensitivity_params': dml_plr_obj.sensitivity_params,
                 'sensitivity_params_manual': res_manual,
                 'benchmark': benchmark,
                 'benchmark_manual': benchmark_manual,
                 'd_cols': d_cols,
+                'sensitivity_grid': res_grid,
+                'sensitivity_grid_manual': res_grid_manual,
+                'sensitivity_rv': res_rv,
+                'sensitivity_rva': res_rva,
+                'coef': dml_plr_obj.coef,
                 }
 
     return res_dict
@@ -92,6 +121,33 @@ def test_dml_sensitivity_params(dml_sensitivity_multitreat_fixture):
                                dml_sensitivity_multitreat_fixture['sensitivity_params_manual'][sensitivity_param][bound])
 
 
+@pytest.mark.ci
+def test_dml_sensitivity_grid(dml_sensitivity_multitreat_fixture):
+    res_grid = dml_sensitivity_multitreat_fixture['sensitivity_grid']
+    res_grid_manual = dml_sensitivity_multitreat_fixture['sensitivity_grid_manual']
+    for sensitivity_param in ['theta', 'se', 'ci']:
+        for bound in ['lower', 'upper']:
+            assert res_grid[sensitivity_param][bound].shape == (3, 3, 2)
+            for i in range(3):
+                for j in range(3):
+                    assert np.allclose(res_grid[sensitivity_param][bound][i, j],
+                                       res_grid_manual[i][j][sensitivity_param][bound])
+
+
+@pytest.mark.ci
+def test_dml_sensitivity_rv(dml_sensitivity_multitreat_fixture):
+    sensitivity_params = dml_sensitivity_multitreat_fixture['sensitivity_params']
+    for i_treat, coef in enumerate(dml_sensitivity_multitreat_fixture['coef']):
+        bound = 'upper' if sensitivity_params['input']['null_hypothesis'][i_treat] > coef else 'lower'
+        for param, rv_name in zip(['theta', 'ci'], ['rv', 'rva']):
+            rv = sensitivity_params[rv_name][i_treat]
+            assert 0.0 <= rv <= 0.9999
+            # without a root, the robustness value is at the boundary
+            if 0.0 < rv < 0.9999:
+                res_rv = dml_sensitivity_multitreat_fixture['sensitivity_' + rv_name][i_treat]
+                assert np.isclose(res_rv[param][bound][i_treat], 0.0, atol=1e-8)
+
+
 @pytest.mark.ci
 def test_dml_sensitivity_benchmark(dml_sensitivity_multitreat_fixture):
     expected_columns = ["cf_y", "cf_d", "rho", "delta_theta"]
@@ -99,3 +155,32 @@ def test_dml_sensitivity_benchmark(dml_sensitivity_multitreat_fixture):
     assert all(dml_sensitivity_multitreat_fixture['benchmark'].index ==
                dml_sensitivity_multitreat_fixture['d_cols'])
     assert dml_sensitivity_multitreat_fixture['benchmark'].equals(dml_sensitivity_multitreat_fixture['benchmark_manual'])
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('executor', [None, 'threading'])
+def test_dml_sensitivity_benchmarks(generate_data_bivariate, executor):
+    data = generate_data_bivariate
+    x_cols = data.columns[data.columns.str.startswith('X')].tolist()
+    d_cols = data.columns[data.columns.str.startswith('d')].tolist()
+
+    np.random.seed(3141)
+    obj_dml_data = dml.DoubleMLData(data, 'y', d_cols, x_cols)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression(), n_folds=5, n_rep=2)
+    dml_plr_obj.fit()
+    psi = dml_plr_obj.psi.copy()
+
+    benchmarking_sets = {'first': ['X1'], 'second': ['X2', 'X3']}
+    benchmarks = dml_plr_obj.sensitivity_benchmarks(benchmarking_sets, n_jobs=2, executor=executor)
+    assert benchmarks.index.names == ['benchmarking_set', 'treatment']
+    for name, benchmarking_set in benchmarking_sets.items():
+        benchmark_manual = doubleml_sensitivity_benchmark_manual(dml_obj=dml_plr_obj, benchmarking_set=benchmarking_set)
+        assert benchmarks.loc[name].equals(benchmark_manual)
+
+    # the long model is not altered
+    assert dml_plr_obj._dml_data.x_cols == x_cols
+    assert np.array_equal(dml_plr_obj.psi, psi)
+
+    benchmarks_list = dml_plr_obj.sensitivity_benchmarks(list(benchmarking_sets.values()))
+    assert list(benchmarks_list.index.get_level_values(0).unique()) == ['X1', 'X2, X3']
+    assert np.array_equal(benchmarks_list.values, benchmarks.values)
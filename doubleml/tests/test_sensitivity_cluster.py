@@ -6,6 +6,7 @@ from sklearn.linear_model import LinearRegression
 
 import doubleml as dml
 from doubleml.datasets import make_pliv_multiway_cluster_CKMS2021
+from doubleml.utils._estimation import _var_est, _confounding_strength
 from ._utils_doubleml_sensitivity_manual import doubleml_sensitivity_benchmark_manual
 
 np.random.seed(1234)
@@ -133,3 +134,25 @@ def test_dml_pliv_multiway_cluster_sensitivity_se(dml_plr_multiway_cluster_sensi
     assert math.isclose(dml_plr_multiway_cluster_sensitivity_rho0_se['se'][0],
                         dml_plr_multiway_cluster_sensitivity_rho0_se['sensitivity_params']['se']['upper'][0],
                         rel_tol=1e-9, abs_tol=1e-3)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('obj_dml_data', [obj_dml_cluster_data, obj_dml_oneway_cluster_data])
+def test_dml_plr_cluster_sensitivity_se(obj_dml_data):
+    cf_y, cf_d, rho, level = 0.03, 0.04, 0.5, 0.95
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression(), n_folds=3)
+    dml_plr_obj.fit()
+    res = dml_plr_obj._calc_sensitivity_analysis(cf_y=cf_y, cf_d=cf_d, rho=rho, level=level)
+
+    # cluster robust variances of the bias-adjusted scores
+    elements = dml_plr_obj.sensitivity_elements
+    S = np.sqrt(elements['sigma2'] * elements['nu2'])
+    psi_bias = _confounding_strength(cf_y, cf_d, rho) * (elements['sigma2'] * elements['psi_nu2'] +
+                                                         elements['nu2'] * elements['psi_sigma2']) / (2.0 * S)
+    psi_scaled = dml_plr_obj.psi / np.mean(dml_plr_obj.psi_deriv, axis=0)
+    for psi, bound in zip([psi_scaled - psi_bias, psi_scaled + psi_bias], ['lower', 'upper']):
+        sigma2, _ = _var_est(psi=psi[:, 0, 0], psi_deriv=np.ones(psi.shape[0]), smpls=dml_plr_obj.smpls[0],
+                             is_cluster_data=True, cluster_vars=obj_dml_data.cluster_vars,
+                             smpls_cluster=dml_plr_obj.smpls_cluster[0], n_folds_per_cluster=3)
+        assert math.isclose(res['se'][bound][0], np.sqrt(sigma2), rel_tol=1e-9, abs_tol=1e-12)
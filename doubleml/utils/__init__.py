@@ -4,7 +4,8 @@ The :mod:`doubleml.utils` module includes various utilities.
 
 from .dummy_learners import DMLDummyRegressor
 from .dummy_learners import DMLDummyClassifier
-from .resampling import DoubleMLResampling, DoubleMLClusterResampling
+from .resampling import DoubleMLResampling, DoubleMLClusterResampling, DoubleMLFolds
+from .fit_options import DoubleMLFitOptions
 from .blp import DoubleMLBLP
 from .policytree import DoubleMLPolicyTree
 from .gain_statistics import gain_statistics
@@ -14,6 +15,8 @@ __all__ = [
     "DMLDummyClassifier",
     "DoubleMLResampling",
     "DoubleMLClusterResampling",
+    "DoubleMLFolds",
+    "DoubleMLFitOptions",
     "DoubleMLBLP",
     "DoubleMLPolicyTree",
     "gain_statistics"
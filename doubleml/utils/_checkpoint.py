@@ -0,0 +1,68 @@
+import os
+import glob
+
+from joblib import dump, load
+
+
+class _FitCheckpoint:
+    """
+    Folder with the completed units (combinations of repetition and treatment variable) of a fit.
+
+    The folder contains the metadata of the fit (including the sample splitting) and one file per completed unit with
+    the score elements, the predictions (and models) of the nuisance functions. Files are written to a temporary file
+    first and renamed afterwards, such that an interrupted write never leaves a corrupt unit.
+    """
+    def __init__(self, checkpoint_dir, metadata, resume):
+        self._checkpoint_dir = checkpoint_dir
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+        metadata_file = os.path.join(checkpoint_dir, 'metadata.pkl')
+        if resume and os.path.isfile(metadata_file):
+            stored_metadata = load(metadata_file)
+            for key, value in metadata.items():
+                if key in ['smpls', 'smpls_cluster']:
+                    continue
+                if stored_metadata.get(key) != value:
+                    raise ValueError(f'The checkpoint in {checkpoint_dir} does not match the model. '
+                                     f'Got {key} {str(value)} but the checkpoint was created with '
+                                     f'{key} {str(stored_metadata.get(key))}.')
+            self._metadata = stored_metadata
+        else:
+            # a new fit invalidates all units of previous fits
+            for filename in glob.glob(os.path.join(checkpoint_dir, 'unit_*.pkl')):
+                os.remove(filename)
+            self._metadata = metadata
+            self._dump(metadata, metadata_file)
+
+    def __getstate__(self):
+        # the workers only need the folder to write their units
+        return {'_checkpoint_dir': self._checkpoint_dir, '_metadata': None}
+
+    @property
+    def checkpoint_dir(self):
+        return self._checkpoint_dir
+
+    @property
+    def metadata(self):
+        return self._metadata
+
+    def _unit_file(self, i_rep, i_treat):
+        return os.path.join(self._checkpoint_dir, f'unit_rep{i_rep}_treat{i_treat}.pkl')
+
+    def _dump(self, obj, filename):
+        tmp_filename = filename + '.tmp'
+        dump(obj, tmp_filename)
+        os.replace(tmp_filename, filename)
+
+    def is_completed(self, i_rep, i_treat):
+        return os.path.isfile(self._unit_file(i_rep, i_treat))
+
+    def save_unit(self, i_rep, i_treat, score_elements, preds, coef_start_val=None):
+        self._dump({'score_elements': score_elements,
+                    'preds': preds,
+                    'coef_start_val': coef_start_val},
+                   self._unit_file(i_rep, i_treat))
+
+    def load_unit(self, i_rep, i_treat):
+        unit = load(self._unit_file(i_rep, i_treat))
+        return unit['score_elements'], unit['preds'], unit['coef_start_val']
@@ -3,6 +3,8 @@ import warnings
 
 from sklearn.utils.multiclass import type_of_target
 
+from .resampling import DoubleMLFolds, _DoubleMLCondFolds
+
 
 def _check_in_zero_one(value, name, include_zero=True, include_one=True):
     if not isinstance(value, float):
@@ -63,6 +65,9 @@ def _check_bool(value, name):
 
 
 def _check_is_partition(smpls, n_obs):
+    if isinstance(smpls, (DoubleMLFolds, _DoubleMLCondFolds)):
+        # fold ids always form a partition
+        return smpls.n_obs == n_obs
     test_indices = np.concatenate([test_index for _, test_index in smpls])
     if len(test_indices) != n_obs:
         return False
@@ -81,6 +86,12 @@ def _check_all_smpls(all_smpls, n_obs, check_intersect=False):
 
 
 def _check_smpl_split(smpl, n_obs, check_intersect=False):
+    if isinstance(smpl, DoubleMLFolds):
+        # validated during construction
+        if smpl.n_obs != n_obs:
+            raise ValueError(f'Invalid sample split. The fold ids are defined for {smpl.n_obs} observations but the '
+                             f'data has {n_obs} observations.')
+        return smpl
     smpl_checked = list()
     for tpl in smpl:
         smpl_checked.append(_check_smpl_split_tpl(tpl, n_obs, check_intersect))
@@ -96,13 +107,14 @@ def _check_smpl_split_tpl(tpl, n_obs, check_intersect=False):
     if not issubclass(test_index.dtype.type, np.integer):
         raise TypeError('Invalid sample split. Test indices must be of type integer.')
 
+    # the indices are sorted, i.e., duplicates are adjacent and all checks are vectorized
     if check_intersect:
-        if set(train_index) & set(test_index):
+        if np.intersect1d(train_index, test_index).shape[0] > 0:
             raise ValueError('Invalid sample split. Intersection of train and test indices is not empty.')
 
-    if len(np.unique(train_index)) != len(train_index):
+    if np.any(train_index[1:] == train_index[:-1]):
         raise ValueError('Invalid sample split. Train indices contain non-unique entries.')
-    if len(np.unique(test_index)) != len(test_index):
+    if np.any(test_index[1:] == test_index[:-1]):
         raise ValueError('Invalid sample split. Test indices contain non-unique entries.')
 
     # we sort the indices above
@@ -111,16 +123,20 @@ def _check_smpl_split_tpl(tpl, n_obs, check_intersect=False):
     # if not np.all(np.diff(test_index) > 0):
     #     raise NotImplementedError('Invalid sample split. Only sorted test indices are supported.')
 
-    if not set(train_index).issubset(range(n_obs)):
+    if (len(train_index) > 0) and ((train_index[0] < 0) or (train_index[-1] >= n_obs)):
         raise ValueError('Invalid sample split. Train indices must be in [0, n_obs).')
-    if not set(test_index).issubset(range(n_obs)):
+    if (len(test_index) > 0) and ((test_index[0] < 0) or (test_index[-1] >= n_obs)):
         raise ValueError('Invalid sample split. Test indices must be in [0, n_obs).')
 
     return train_index, test_index
 
 
 def _check_finite_predictions(preds, learner, learner_name, smpls):
-    test_indices = np.concatenate([test_index for _, test_index in smpls])
+    if isinstance(smpls, DoubleMLFolds):
+        # the test sets cover all observations
+        test_indices = slice(None)
+    else:
+        test_indices = np.concatenate([test_index for _, test_index in smpls])
     if not np.all(np.isfinite(preds[test_indices])):
         raise ValueError(f'Predictions from learner {str(learner)} for {learner_name} are not finite.')
     return
@@ -0,0 +1,33 @@
+import threading
+from contextlib import contextmanager
+
+
+_default_fit_config = {'shared_arrays': None,
+                       'executor': None,
+                       'n_jobs_learner': None,
+                       'fold_contiguous': False,
+                       'random_state': None}
+_thread_local = threading.local()
+
+
+def _get_fit_config():
+    # the configuration is thread-local, such that several models can be fitted concurrently in one process
+    if not hasattr(_thread_local, 'fit_config'):
+        _thread_local.fit_config = _default_fit_config.copy()
+    return _thread_local.fit_config
+
+
+@contextmanager
+def _fit_config(**kwargs):
+    invalid_keys = set(kwargs.keys()) - set(_default_fit_config.keys())
+    if len(invalid_keys) > 0:
+        raise ValueError('Invalid fit configuration ' + ', '.join(sorted(invalid_keys)) + '. '
+                         'Valid keys are ' + ', '.join(sorted(_default_fit_config.keys())) + '.')
+    fit_config = _get_fit_config()
+    old_fit_config = fit_config.copy()
+    fit_config.update(kwargs)
+    try:
+        yield fit_config
+    finally:
+        fit_config.clear()
+        fit_config.update(old_fit_config)
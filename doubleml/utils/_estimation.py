@@ -8,11 +8,13 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV
 from sklearn.metrics import mean_squared_error
 
-from statsmodels.nonparametric.kde import KDEUnivariate
-
-from joblib import Parallel, delayed
 
 from ._checks import _check_is_partition
+from .resampling import DoubleMLFolds, _DoubleMLCondFolds
+from ._config import _get_fit_config
+from ._parallel import _parallel_map, _set_n_jobs, _thread_limits
+from ._shared_memory import _share_array
+from ._random import _spawn_seeds, _sklearn_seed
 
 
 def _assure_2d_array(x):
@@ -24,12 +26,21 @@ def _assure_2d_array(x):
 
 
 def _get_cond_smpls(smpls, bin_var):
+    if isinstance(smpls, DoubleMLFolds):
+        # both conditional splittings share one array of groups (-1 for observations in neither group)
+        groups = np.select([bin_var == 0, bin_var == 1], [0, 1], default=-1)
+        return _DoubleMLCondFolds(smpls, groups, 0), _DoubleMLCondFolds(smpls, groups, 1)
     smpls_0 = [(np.intersect1d(np.where(bin_var == 0)[0], train), test) for train, test in smpls]
     smpls_1 = [(np.intersect1d(np.where(bin_var == 1)[0], train), test) for train, test in smpls]
     return smpls_0, smpls_1
 
 
 def _get_cond_smpls_2d(smpls, bin_var1, bin_var2):
+    if isinstance(smpls, DoubleMLFolds):
+        val_pairs = [(0, 0), (0, 1), (1, 0), (1, 1)]
+        groups = np.select([(bin_var1 == val1) & (bin_var2 == val2) for val1, val2 in val_pairs],
+                           list(range(len(val_pairs))), default=-1)
+        return tuple(_DoubleMLCondFolds(smpls, groups, group) for group in range(len(val_pairs)))
     subset_00 = (bin_var1 == 0) & (bin_var2 == 0)
     smpls_00 = [(np.intersect1d(np.where(subset_00)[0], train), test) for train, test in smpls]
     subset_01 = (bin_var1 == 0) & (bin_var2 == 1)
@@ -41,8 +52,100 @@ def _get_cond_smpls_2d(smpls, bin_var1, bin_var2):
     return smpls_00, smpls_01, smpls_10, smpls_11
 
 
-def _fit(estimator, x, y, train_index, idx=None):
-    estimator.fit(x[train_index, :], y[train_index])
+def _take_rows(x, index):
+    # a tuple of slices (train set of a fold-contiguous layout) is concatenated, slices are zero-copy views
+    if isinstance(index, tuple):
+        return np.concatenate([x[this_slice] for this_slice in index])
+    return x[index]
+
+
+class _FoldContiguousLayout:
+    # permutation of the observations such that every fold is a contiguous block: test sets are slices and train
+    # sets are one slice (first and last fold) or a tuple of two slices; with groups the observations of every fold are
+    # additionally sorted by group, such that the conditional train sets of a group are (a tuple of) slices as well
+    def __init__(self, folds, groups=None):
+        self.folds = folds
+        self.groups = groups
+        if groups is None:
+            self.order = np.argsort(folds.fold_ids, kind='stable')
+        else:
+            self.order = np.lexsort((groups, folds.fold_ids))
+        bounds = np.concatenate(([0], np.cumsum(folds._fold_sizes)))
+        self.test_indices = [slice(bounds[i_fold], bounds[i_fold + 1]) for i_fold in range(folds.n_folds)]
+        self.train_indices = self._train_indices(self.test_indices)
+        self._cond_train_indices = dict()
+        self._permuted = dict()
+
+    @staticmethod
+    def _train_indices(blocks):
+        # the train set of a fold consists of the blocks of all other folds (adjacent blocks are merged)
+        train_indices = list()
+        for i_fold in range(len(blocks)):
+            train_slices = list()
+            for j_fold, this_slice in enumerate(blocks):
+                if (j_fold == i_fold) or (this_slice.stop == this_slice.start):
+                    continue
+                if train_slices and (train_slices[-1].stop == this_slice.start):
+                    train_slices[-1] = slice(train_slices[-1].start, this_slice.stop)
+                else:
+                    train_slices.append(this_slice)
+            if len(train_slices) == 0:
+                train_slices = [slice(0, 0)]
+            train_indices.append(train_slices[0] if len(train_slices) == 1 else tuple(train_slices))
+        return train_indices
+
+    def splits(self, smpls):
+        # the (train, test) indices of all folds for a sample splitting with these fold ids (and groups)
+        if not isinstance(smpls, _DoubleMLCondFolds):
+            return list(zip(self.train_indices, self.test_indices))
+        group = smpls.group
+        if group not in self._cond_train_indices:
+            sorted_groups = self.groups[self.order]
+            group_blocks = list()
+            for test_slice in self.test_indices:
+                fold_groups = sorted_groups[test_slice]
+                group_blocks.append(slice(test_slice.start + int(np.searchsorted(fold_groups, group, side='left')),
+                                          test_slice.start + int(np.searchsorted(fold_groups, group, side='right'))))
+            self._cond_train_indices[group] = self._train_indices(group_blocks)
+        return list(zip(self._cond_train_indices[group], self.test_indices))
+
+    def permute(self, arr):
+        # arrays used by several nuisance models (e.g. the covariates) are only permuted once
+        key = id(arr)
+        if key not in self._permuted:
+            self._permuted[key] = (arr, arr[self.order])
+        return self._permuted[key][1]
+
+    def restore(self, arr):
+        res = np.empty_like(arr)
+        res[self.order] = arr
+        return res
+
+
+def _get_fold_contiguous_layout(smpls, n_obs, return_train_preds, layouts=None):
+    if not _get_fit_config()['fold_contiguous'] or return_train_preds:
+        return None
+    groups = None
+    if isinstance(smpls, _DoubleMLCondFolds):
+        smpls, groups = smpls.folds, smpls.groups
+    if not isinstance(smpls, DoubleMLFolds) or smpls.n_obs != n_obs:
+        return None
+    if layouts is None:
+        return _FoldContiguousLayout(smpls, groups)
+    # the layout is shared by all nuisance models of a batch with the same fold ids; a layout sorted by groups also
+    # serves the unconditional sample splitting
+    for layout in layouts:
+        if (layout.folds is smpls) and ((groups is None) or (layout.groups is groups)):
+            return layout
+    layout = _FoldContiguousLayout(smpls, groups)
+    layouts.append(layout)
+    return layout
+
+
+def _fit(estimator, x, y, train_index, idx=None, n_threads=None):
+    # limit the threads of the native thread pools (BLAS, OpenMP) in the worker
+    with _thread_limits(n_threads):
+        estimator.fit(_take_rows(x, train_index), _take_rows(y, train_index))
     return estimator, idx
 
 
@@ -53,8 +156,12 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
     smpls_is_partition = _check_is_partition(smpls, n_obs)
     fold_specific_params = (est_params is not None) & (not isinstance(est_params, dict))
     fold_specific_target = isinstance(y, list)
+    # with shared memory, a custom executor or a fold-contiguous layout the fold-wise fits are always dispatched manually
+    fit_config = _get_fit_config()
+    custom_dispatch = (fit_config['shared_arrays'] is not None) | (fit_config['executor'] is not None) \
+        | fit_config['fold_contiguous']
     manual_cv_predict = (not smpls_is_partition) | return_train_preds | fold_specific_params | fold_specific_target \
-        | return_models
+        | return_models | custom_dispatch
 
     res = {'models': None}
     if not manual_cv_predict:
@@ -73,75 +180,150 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
             res['preds'] = preds
         res['targets'] = np.copy(y)
     else:
-        if not smpls_is_partition:
-            assert not fold_specific_target, 'combination of fold-specific y and no cross-fitting not implemented yet'
-            assert len(smpls) == 1
+        layout = _get_fold_contiguous_layout(smpls, n_obs, return_train_preds)
+        y, fit_args = _prepare_cv_fits(estimator, x, y, smpls, est_params, method, layout)
+        fitted_models = _parallel_map(_fit, fit_args, n_jobs=n_jobs)
 
-        if method == 'predict_proba':
-            assert not fold_specific_target  # fold_specific_target only needed for PLIV.partialXZ
-            y = np.asarray(y)
-            le = LabelEncoder()
-            y = le.fit_transform(y)
+        res = _assemble_cv_predictions(fitted_models, x, y, smpls, method, return_train_preds, return_models, layout)
 
-        parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    return res
 
-        if fold_specific_target:
-            y_list = list()
-            for idx, (train_index, _) in enumerate(smpls):
-                xx = np.full(n_obs, np.nan)
-                xx[train_index] = y[idx]
-                y_list.append(xx)
-        else:
-            # just replicate the y in a list
-            y_list = [y] * len(smpls)
 
-        if est_params is None:
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
-        elif isinstance(est_params, dict):
-            # warnings.warn("Using the same (hyper-)parameters for all folds")
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator).set_params(**est_params), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
-        else:
-            assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator).set_params(**est_params[idx]), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
-
-        preds = np.full(n_obs, np.nan)
-        targets = np.full(n_obs, np.nan)
-        train_preds = list()
-        train_targets = list()
-        for idx, (train_index, test_index) in enumerate(smpls):
-            assert idx == fitted_models[idx][1]
-            pred_fun = getattr(fitted_models[idx][0], method)
-            if method == 'predict_proba':
-                preds[test_index] = pred_fun(x[test_index, :])[:, 1]
-            else:
-                preds[test_index] = pred_fun(x[test_index, :])
+def _dml_cv_predict_batch(tasks, n_jobs=None):
+    # cross-fitted predictions for several nuisance models which do not depend on each other; tasks is a dict with
+    # the keyword arguments of _dml_cv_predict per nuisance model and all fold-wise fits are dispatched to one pool of
+    # workers (in the same order as for consecutive calls of _dml_cv_predict)
+    prepared_tasks = dict()
+    fit_args = list()
+    # the layouts of the conditional sample splittings are created first, such that the unconditional ones with the
+    # same fold ids are fitted on the same permutation of the data
+    layouts = list()
+    task_layouts = dict()
+    for key in sorted(tasks, key=lambda key: not isinstance(tasks[key]['smpls'], _DoubleMLCondFolds)):
+        task = tasks[key]
+        task_layouts[key] = _get_fold_contiguous_layout(task['smpls'], task['x'].shape[0],
+                                                        task.get('return_train_preds', False), layouts)
+    for key, task in tasks.items():
+        layout = task_layouts[key]
+        y, task_fit_args = _prepare_cv_fits(task['estimator'], task['x'], task['y'], task['smpls'],
+                                            task.get('est_params'), task.get('method', 'predict'), layout)
+        prepared_tasks[key] = (y, len(fit_args), len(task_fit_args), layout)
+        fit_args.extend(task_fit_args)
+
+    fitted_models = _parallel_map(_fit, fit_args, n_jobs=n_jobs)
+
+    res = dict()
+    for key, task in tasks.items():
+        y, i_start, n_fits, layout = prepared_tasks[key]
+        res[key] = _assemble_cv_predictions(fitted_models[i_start:(i_start + n_fits)], task['x'], y, task['smpls'],
+                                            task.get('method', 'predict'),
+                                            task.get('return_train_preds', False),
+                                            task.get('return_models', False), layout)
+    return res
 
-            if fold_specific_target:
-                # targets not available for fold specific target
-                targets = None
-            else:
-                targets[test_index] = y[test_index]
 
-            if return_train_preds:
-                train_preds.append(pred_fun(x[train_index, :]))
-                train_targets.append(y[train_index])
+def _prepare_cv_fits(estimator, x, y, smpls, est_params, method, layout=None):
+    n_obs = x.shape[0]
+    fold_specific_target = isinstance(y, list)
+
+    if not _check_is_partition(smpls, n_obs):
+        assert not fold_specific_target, 'combination of fold-specific y and no cross-fitting not implemented yet'
+        assert len(smpls) == 1
+
+    if method == 'predict_proba':
+        assert not fold_specific_target  # fold_specific_target only needed for PLIV.partialXZ
+        y = np.asarray(y)
+        le = LabelEncoder()
+        y = le.fit_transform(y)
+
+    if fold_specific_target:
+        y_list = list()
+        for idx, (train_index, _) in enumerate(smpls):
+            xx = np.full(n_obs, np.nan)
+            xx[train_index] = y[idx]
+            y_list.append(xx)
+    else:
+        # just replicate the y in a list
+        y_list = [y] * len(smpls)
+
+    if layout is not None:
+        # the data is permuted once and the folds are fitted on slices of the permuted data
+        x = layout.permute(x)
+        y_list = [layout.permute(this_y) for this_y in y_list]
+        smpls = layout.splits(smpls)
+
+    # attach the arrays to the shared memory of the fit (if available)
+    shared_arrays = _get_fit_config()['shared_arrays']
+    x = _share_array(x, shared_arrays)
+    y_list = [_share_array(this_y, shared_arrays) for this_y in y_list]
+
+    n_jobs_learner = _get_fit_config()['n_jobs_learner']
+    if est_params is None:
+        fit_args = [(_set_n_jobs(clone(estimator), n_jobs_learner), x, y_list[idx], train_index, idx, n_jobs_learner)
+                    for idx, (train_index, test_index) in enumerate(smpls)]
+    elif isinstance(est_params, dict):
+        # warnings.warn("Using the same (hyper-)parameters for all folds")
+        fit_args = [(_set_n_jobs(clone(estimator).set_params(**est_params), n_jobs_learner),
+                     x, y_list[idx], train_index, idx, n_jobs_learner)
+                    for idx, (train_index, test_index) in enumerate(smpls)]
+    else:
+        assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
+        fit_args = [(_set_n_jobs(clone(estimator).set_params(**est_params[idx]), n_jobs_learner),
+                     x, y_list[idx], train_index, idx, n_jobs_learner)
+                    for idx, (train_index, test_index) in enumerate(smpls)]
+
+    return y, fit_args
+
+
+def _assemble_cv_predictions(fitted_models, x, y, smpls, method, return_train_preds, return_models, layout=None):
+    n_obs = x.shape[0]
+    fold_specific_target = isinstance(y, list)
+    if layout is not None:
+        assert not return_train_preds
+        x = layout.permute(x)
+        if not fold_specific_target:
+            y = layout.permute(y)
+        smpls = layout.splits(smpls)
+
+    preds = np.full(n_obs, np.nan)
+    targets = np.full(n_obs, np.nan)
+    train_preds = list()
+    train_targets = list()
+    for idx, (train_index, test_index) in enumerate(smpls):
+        assert idx == fitted_models[idx][1]
+        pred_fun = getattr(fitted_models[idx][0], method)
+        if method == 'predict_proba':
+            preds[test_index] = pred_fun(x[test_index, :])[:, 1]
+        else:
+            preds[test_index] = pred_fun(x[test_index, :])
+
+        if fold_specific_target:
+            # targets not available for fold specific target
+            targets = None
+        else:
+            targets[test_index] = y[test_index]
 
-        res['preds'] = preds
-        res['targets'] = targets
         if return_train_preds:
-            res['train_preds'] = train_preds
-            res['train_targets'] = train_targets
-        if return_models:
-            fold_ids = [xx[1] for xx in fitted_models]
-            if not np.all(fold_ids == np.arange(len(smpls))):
-                raise RuntimeError('export of fitted models failed')
-            res['models'] = [xx[0] for xx in fitted_models]
+            train_preds.append(pred_fun(x[train_index, :]))
+            train_targets.append(y[train_index])
+
+    if layout is not None:
+        # scatter the predictions back to the original order of the observations
+        preds = layout.restore(preds)
+        if targets is not None:
+            targets = layout.restore(targets)
+
+    res = {'models': None,
+           'preds': preds,
+           'targets': targets}
+    if return_train_preds:
+        res['train_preds'] = train_preds
+        res['train_targets'] = train_targets
+    if return_models:
+        fold_ids = [xx[1] for xx in fitted_models]
+        if not np.all(fold_ids == np.arange(len(smpls))):
+            raise RuntimeError('export of fitted models failed')
+        res['models'] = [xx[0] for xx in fitted_models]
 
     return res
 
@@ -149,9 +331,20 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
 def _dml_tune(y, x, train_inds,
               learner, param_grid, scoring_method,
               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
-    tune_res = list()
-    for train_index in train_inds:
-        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
+    fit_config = _get_fit_config()
+    learner = _set_n_jobs(learner, fit_config['n_jobs_learner'])
+    # with a custom executor the folds for tuning are drawn before the searches are dispatched
+    custom_executor = fit_config['executor'] is not None
+    # with a random_state every fold gets its own seed for the folds for tuning and the randomized search
+    if fit_config['random_state'] is None:
+        fold_seeds = [None] * len(train_inds)
+    else:
+        fold_seeds = [_sklearn_seed(seed) for seed in _spawn_seeds(fit_config['random_state'], len(train_inds))]
+    tune_args = list()
+    for train_index, fold_seed in zip(train_inds, fold_seeds):
+        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True, random_state=fold_seed)
+        if custom_executor:
+            tune_resampling = list(tune_resampling.split(x[train_index, :]))
         if search_mode == 'grid_search':
             g_grid_search = GridSearchCV(learner, param_grid,
                                          scoring=scoring_method,
@@ -161,20 +354,29 @@ def _dml_tune(y, x, train_inds,
             g_grid_search = RandomizedSearchCV(learner, param_grid,
                                                scoring=scoring_method,
                                                cv=tune_resampling, n_jobs=n_jobs_cv,
-                                               n_iter=n_iter_randomized_search)
-        tune_res.append(g_grid_search.fit(x[train_index, :], y[train_index]))
+                                               n_iter=n_iter_randomized_search, random_state=fold_seed)
+        tune_args.append((g_grid_search, x, y, train_index, fit_config['n_jobs_learner']))
+    tune_res = _parallel_map(_tune, tune_args)
 
     return tune_res
 
 
-def _draw_weights(method, n_rep_boot, n_obs):
+def _tune(search, x, y, train_index, n_threads=None):
+    with _thread_limits(n_threads):
+        return search.fit(x[train_index, :], y[train_index])
+
+
+def _draw_weights(method, n_rep_boot, n_obs, rng=None):
+    # the weights are drawn from the global random state if no random number generator is passed
+    if rng is None:
+        rng = np.random
     if method == 'Bayes':
-        weights = np.random.exponential(scale=1.0, size=(n_rep_boot, n_obs)) - 1.
+        weights = rng.exponential(scale=1.0, size=(n_rep_boot, n_obs)) - 1.
     elif method == 'normal':
-        weights = np.random.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
+        weights = rng.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
     elif method == 'wild':
-        xx = np.random.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
-        yy = np.random.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
+        xx = rng.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
+        yy = rng.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
         weights = xx / np.sqrt(2) + (np.power(yy, 2) - 1) / 2
     else:
         raise ValueError('invalid boot method')
@@ -182,6 +384,95 @@ def _draw_weights(method, n_rep_boot, n_obs):
     return weights
 
 
+def _draw_weight_chunks(method, n_rep_boot, n_obs, chunk_size=None, random_state=None):
+    # the weights in blocks of at most chunk_size bootstrap replications (rows), drawn lazily from the global random
+    # state such that the stacked blocks coincide with _draw_weights(method, n_rep_boot, n_obs); with a random_state
+    # (a seed sequence) the weights are drawn from generators of independent random streams instead
+    if random_state is not None:
+        chunk_sizes = [n_rep_boot] if chunk_size is None else \
+            [min(chunk_size, n_rep_boot - i_start) for i_start in range(0, n_rep_boot, chunk_size)]
+        if method == 'wild':
+            # one stream per normal sample, such that the weights do not depend on chunk_size
+            first_rng, second_rng = [np.random.default_rng(seed) for seed in random_state.spawn(2)]
+            for this_chunk_size in chunk_sizes:
+                xx = first_rng.normal(loc=0.0, scale=1.0, size=(this_chunk_size, n_obs))
+                yy = second_rng.normal(loc=0.0, scale=1.0, size=(this_chunk_size, n_obs))
+                yield xx / np.sqrt(2) + (np.power(yy, 2) - 1) / 2
+        else:
+            rng = np.random.default_rng(random_state)
+            for this_chunk_size in chunk_sizes:
+                yield _draw_weights(method, this_chunk_size, n_obs, rng)
+        return
+    if (chunk_size is None) or (chunk_size >= n_rep_boot):
+        yield _draw_weights(method, n_rep_boot, n_obs)
+        return
+    chunk_sizes = [min(chunk_size, n_rep_boot - i_start) for i_start in range(0, n_rep_boot, chunk_size)]
+    if method == 'wild':
+        # the first normal sample is drawn from a copy of the random state, which is then skipped in the global random
+        # state (block by block) to continue with the second normal sample
+        first_random_state = np.random.RandomState()
+        first_random_state.set_state(np.random.get_state())
+        for this_chunk_size in chunk_sizes:
+            np.random.normal(loc=0.0, scale=1.0, size=(this_chunk_size, n_obs))
+        for this_chunk_size in chunk_sizes:
+            xx = first_random_state.normal(loc=0.0, scale=1.0, size=(this_chunk_size, n_obs))
+            yy = np.random.normal(loc=0.0, scale=1.0, size=(this_chunk_size, n_obs))
+            yield xx / np.sqrt(2) + (np.power(yy, 2) - 1) / 2
+    else:
+        for this_chunk_size in chunk_sizes:
+            yield _draw_weights(method, this_chunk_size, n_obs)
+
+
+def _compute_boot_t_stats(weights, psi, psi_deriv, se, n_obs):
+    # bootstrapped t-statistics for all coefficients of one repetition (psi and psi_deriv of shape (n_obs, n_coefs));
+    # the scaled scores of all coefficients are stacked such that one matrix-matrix product is needed
+    J = np.mean(psi_deriv, axis=0, dtype=np.float64)
+    scaled_psi = psi / (n_obs * se * J)
+    boot_t_stat = np.matmul(weights, scaled_psi).T
+    return boot_t_stat
+
+
+def _gaussian_cov_draws(draws, scaled_scores):
+    # transforms standard normal draws of shape (n_rep_boot, k) into draws from the Gaussian distribution with
+    # covariance scaled_scores.T @ scaled_scores, i.e., the distribution of weights @ scaled_scores for normal weights
+    cov = np.matmul(scaled_scores.T, scaled_scores)
+    eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    cov_root = eigenvectors * np.sqrt(np.clip(eigenvalues, 0., None))
+    return np.matmul(draws, cov_root.T)
+
+
+def _compute_gaussian_cov_boot_t_stats(draws, psi, psi_deriv, se, n_obs):
+    # bootstrapped t-statistics for all coefficients of one repetition drawn directly from their Gaussian distribution
+    J = np.mean(psi_deriv, axis=0, dtype=np.float64)
+    scaled_psi = psi / (n_obs * se * J)
+    boot_t_stat = _gaussian_cov_draws(draws, scaled_psi).T
+    return boot_t_stat
+
+
+def _compute_qte_boot(weights, psi0, psi1, psi0_deriv, psi1_deriv, se, n_obs):
+    # bootstrapped coefficients and t-statistics for all quantiles of one repetition (scores of shape
+    # (n_obs, n_quantiles)) with one matrix-matrix product for all quantiles
+    J0 = np.mean(psi0_deriv, axis=0)
+    J1 = np.mean(psi1_deriv, axis=0)
+    scaled_score = psi1 / J1 - psi0 / J0
+
+    boot_coef = np.matmul(weights, scaled_score).T / n_obs
+    boot_t_stat = boot_coef / se.reshape(-1, 1)
+    return boot_coef, boot_t_stat
+
+
+def _compute_qte_gaussian_cov_boot(draws, psi0, psi1, psi0_deriv, psi1_deriv, se, n_obs):
+    # bootstrapped coefficients and t-statistics for all quantiles of one repetition drawn directly from their
+    # Gaussian distribution
+    J0 = np.mean(psi0_deriv, axis=0)
+    J1 = np.mean(psi1_deriv, axis=0)
+    scaled_score = psi1 / J1 - psi0 / J0
+
+    boot_coef = _gaussian_cov_draws(draws, scaled_score / n_obs).T
+    boot_t_stat = boot_coef / se.reshape(-1, 1)
+    return boot_coef, boot_t_stat
+
+
 def _trimm(preds, trimming_rule, trimming_threshold):
     if trimming_rule == 'truncate':
         preds[preds < trimming_threshold] = trimming_threshold
@@ -230,11 +521,32 @@ def _get_bracket_guess(score, coef_start, coef_bounds):
     return s_different, b_guess
 
 
+def _silverman_bandwidth(u):
+    # Silverman's rule of thumb 0.9 * min(std, IQR / 1.349) * n^(-1/5) (as in statsmodels, the weights are not used)
+    n_obs = u.shape[0]
+    q75, q25 = np.percentile(u, [75, 25])
+    iqr = (q75 - q25) / 1.349
+    std_dev = np.std(u, ddof=1)
+    sigma = min(std_dev, iqr) if iqr > 0 else std_dev
+    bw = 0.9 * sigma * n_obs ** (-0.2)
+    if bw == 0:
+        raise RuntimeError('Selected KDE bandwidth is 0. Cannot estimate density. '
+                           'Either provide the bandwidth during initialization or use an alternative method.')
+    return bw
+
+
 def _default_kde(u, weights):
-    dens = KDEUnivariate(u)
-    dens.fit(kernel='gau', bw='silverman', weights=weights, fft=False)
+    # weighted Gaussian kernel density estimate at zero with Silverman's bandwidth; equal to
+    # statsmodels.nonparametric.kde.KDEUnivariate(u).fit(kernel='gau', bw='silverman', weights=weights).evaluate(0),
+    # but evaluated directly at the point in O(n_obs) instead of on a grid of size n_obs
+    u = np.asarray(u, dtype=np.float64).reshape(-1)
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+    bw = _silverman_bandwidth(u)
+
+    kernel_values = np.exp(-0.5 * np.square(u / bw))
+    dens = np.dot(kernel_values, weights) / (np.sqrt(2.0 * np.pi) * bw * np.sum(weights))
 
-    return dens.evaluate(0)
+    return np.array([dens])
 
 
 def _solve_ipw_score(ipw_score, bracket_guess):
@@ -249,17 +561,22 @@ def _solve_ipw_score(ipw_score, bracket_guess):
 
 
 def _aggregate_coefs_and_ses(all_coefs, all_ses, var_scaling_factor):
-    # aggregation is done over dimension 1, such that the coefs and ses have to be of shape (n_coefs, n_rep)
-    n_rep = all_coefs.shape[1]
-    coefs = np.median(all_coefs, 1)
+    # aggregation is done over the last dimension, such that the coefs and ses have to be of shape (n_coefs, n_rep)
+    # (or (..., n_coefs, n_rep) to aggregate several sets of coefs and ses at once)
+    coefs = np.median(all_coefs, -1)
 
-    xx = np.tile(coefs.reshape(-1, 1), n_rep)
+    xx = np.expand_dims(coefs, -1)
     ses = np.sqrt(np.divide(np.median(np.multiply(np.power(all_ses, 2), var_scaling_factor) +
-                                      np.power(all_coefs - xx, 2), 1), var_scaling_factor))
+                                      np.power(all_coefs - xx, 2), -1), var_scaling_factor))
 
     return coefs, ses
 
 
+def _confounding_strength(cf_y, cf_d, rho):
+    # the factor of the bias bound (elementwise in cf_y and cf_d)
+    return np.multiply(np.abs(rho), np.sqrt(np.multiply(cf_y, np.divide(cf_d, 1.0-cf_d))))
+
+
 def _var_est(psi, psi_deriv, smpls, is_cluster_data,
              cluster_vars=None, smpls_cluster=None, n_folds_per_cluster=None):
 
@@ -276,10 +593,12 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
         assert n_folds_per_cluster is not None
         n_folds = len(smpls)
 
+        # the double sum over all pairs of observations in a cluster equals the square of the cluster sum, i.e.,
+        # the cluster sums are computed with np.bincount over the factorized cluster variables
         # one cluster
         if cluster_vars.shape[1] == 1:
-            first_cluster_var = cluster_vars[:, 0]
-            clusters = np.unique(first_cluster_var)
+            clusters, cluster_codes = np.unique(cluster_vars[:, 0], return_inverse=True)
+            cluster_sums = np.bincount(cluster_codes, weights=psi, minlength=len(clusters))
             gamma_hat = 0
             j_hat = 0
             for i_fold in range(n_folds):
@@ -287,9 +606,7 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
                 test_cluster_inds = smpls_cluster[i_fold][1]
                 I_k = test_cluster_inds[0]
                 const = 1 / len(I_k)
-                for cluster_value in I_k:
-                    ind_cluster = (first_cluster_var == cluster_value)
-                    gamma_hat += const * np.sum(np.outer(psi[ind_cluster], psi[ind_cluster]))
+                gamma_hat += const * np.sum(np.square(cluster_sums[np.searchsorted(clusters, I_k)]))
                 j_hat += np.sum(psi_deriv[test_inds]) / len(I_k)
 
             var_scaling_factor = len(clusters)
@@ -298,8 +615,8 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
 
         else:
             assert cluster_vars.shape[1] == 2
-            first_cluster_var = cluster_vars[:, 0]
-            second_cluster_var = cluster_vars[:, 1]
+            first_clusters, first_cluster_codes = np.unique(cluster_vars[:, 0], return_inverse=True)
+            second_clusters, second_cluster_codes = np.unique(cluster_vars[:, 1], return_inverse=True)
             gamma_hat = 0
             j_hat = 0
             for i_fold in range(n_folds):
@@ -307,18 +624,21 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
                 test_cluster_inds = smpls_cluster[i_fold][1]
                 I_k = test_cluster_inds[0]
                 J_l = test_cluster_inds[1]
+                I_k_codes = np.searchsorted(first_clusters, I_k)
+                J_l_codes = np.searchsorted(second_clusters, J_l)
                 const = np.divide(min(len(I_k), len(J_l)), (np.square(len(I_k) * len(J_l))))
-                for cluster_value in I_k:
-                    ind_cluster = (first_cluster_var == cluster_value) & np.in1d(second_cluster_var, J_l)
-                    gamma_hat += const * np.sum(np.outer(psi[ind_cluster], psi[ind_cluster]))
-                for cluster_value in J_l:
-                    ind_cluster = (second_cluster_var == cluster_value) & np.in1d(first_cluster_var, I_k)
-                    gamma_hat += const * np.sum(np.outer(psi[ind_cluster], psi[ind_cluster]))
+                # sums over the clusters in I_k restricted to the observations with second cluster in J_l (and vice versa)
+                in_J_l = np.isin(second_cluster_codes, J_l_codes)
+                first_cluster_sums = np.bincount(first_cluster_codes[in_J_l], weights=psi[in_J_l],
+                                                 minlength=len(first_clusters))
+                gamma_hat += const * np.sum(np.square(first_cluster_sums[I_k_codes]))
+                in_I_k = np.isin(first_cluster_codes, I_k_codes)
+                second_cluster_sums = np.bincount(second_cluster_codes[in_I_k], weights=psi[in_I_k],
+                                                  minlength=len(second_clusters))
+                gamma_hat += const * np.sum(np.square(second_cluster_sums[J_l_codes]))
                 j_hat += np.sum(psi_deriv[test_inds]) / (len(I_k) * len(J_l))
 
-            n_first_clusters = len(np.unique(first_cluster_var))
-            n_second_clusters = len(np.unique(second_cluster_var))
-            var_scaling_factor = min(n_first_clusters, n_second_clusters)
+            var_scaling_factor = min(len(first_clusters), len(second_clusters))
             J = np.divide(j_hat, np.square(n_folds_per_cluster))
             gamma_hat = np.divide(gamma_hat, np.square(n_folds_per_cluster))
 
@@ -334,6 +654,28 @@ def _cond_targets(target, cond_sample):
     return cond_target
 
 
+def _cached_nuisance(cache, key, fit_func):
+    # nuisance estimates which do not depend on the model (e.g. the propensity scores of the quantile models of
+    # DoubleMLQTE) are computed once per key if a cache is shared between the models; the cache may only be shared
+    # between models with the same sample splitting and learners, and the cached values (incl. fitted models) are
+    # shared and must not be modified in place
+    if cache is None:
+        return fit_func()
+    if key not in cache:
+        cache[key] = fit_func()
+    return cache[key]
+
+
+def _external_learners(external_predictions):
+    # the learners with external predictions per treatment variable
+    if external_predictions is None:
+        return dict()
+    ext_learners = {treatment: sorted(learner for learner, preds in learner_preds.items()
+                                      if isinstance(preds, np.ndarray))
+                    for treatment, learner_preds in external_predictions.items()}
+    return {treatment: learners for treatment, learners in ext_learners.items() if len(learners) > 0}
+
+
 def _set_external_predictions(external_predictions, learners, treatment, i_rep):
     ext_prediction_dict = {}
     for learner in learners:
@@ -0,0 +1,85 @@
+from collections import deque
+from contextlib import nullcontext
+
+from sklearn.base import clone
+
+from joblib import Parallel, delayed, parallel_backend, cpu_count
+from joblib.parallel import BACKENDS
+from threadpoolctl import threadpool_limits
+
+from ._config import _get_fit_config
+
+
+def _check_executor(executor):
+    if executor is None:
+        return
+    if isinstance(executor, str):
+        if executor not in BACKENDS:
+            raise ValueError(f'Invalid executor {executor}. '
+                             'Valid backend names are ' + ', '.join(sorted(BACKENDS.keys())) + '.')
+    elif not callable(getattr(executor, 'submit', None)):
+        raise TypeError('The executor must be None, the name of a registered joblib backend or an object with a '
+                        'submit method (e.g. a concurrent.futures.Executor). '
+                        f'{str(executor)} of type {str(type(executor))} was passed.')
+    return
+
+
+def _parallel_map(func, args_list, n_jobs=None):
+    # evaluate func for all argument tuples with the executor of the fit configuration; the results are returned in
+    # the order of args_list
+    executor = _get_fit_config()['executor']
+    if (executor is None) or isinstance(executor, str):
+        # for a backend name n_jobs=None refers to all CPUs (as in joblib.parallel_backend)
+        backend = parallel_backend(executor) if isinstance(executor, str) else nullcontext()
+        with backend:
+            parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+            res = parallel(delayed(func)(*args) for args in args_list)
+    else:
+        # as joblib's pre_dispatch, at most 2 * n_jobs tasks are submitted at once, such that lazily generated
+        # arguments (e.g. chunks of bootstrap weights) are only created when a worker is about to become available
+        n_jobs = cpu_count() if (n_jobs is None) or (n_jobs == -1) else n_jobs
+        max_pending = 2 * max(1, n_jobs)
+        pending = deque()
+        res = []
+        for args in args_list:
+            if len(pending) == max_pending:
+                res.append(pending.popleft().result())
+            pending.append(executor.submit(func, *args))
+        while pending:
+            res.append(pending.popleft().result())
+    return res
+
+
+def _check_n_jobs_budget(n_jobs_budget):
+    if n_jobs_budget is not None:
+        if not isinstance(n_jobs_budget, int):
+            raise TypeError('The CPU budget must be of int type. '
+                            f'{str(n_jobs_budget)} of type {str(type(n_jobs_budget))} was passed.')
+        if (n_jobs_budget < 1) and (n_jobs_budget != -1):
+            raise ValueError('The CPU budget must be positive or -1 (all CPUs). '
+                             f'{str(n_jobs_budget)} was passed.')
+    return
+
+
+def _split_n_jobs_budget(n_jobs_budget, n_tasks):
+    # split the CPU budget into the number of parallel tasks and the number of threads per task
+    if n_jobs_budget == -1:
+        n_jobs_budget = cpu_count()
+    n_jobs_outer = int(max(1, min(n_jobs_budget, n_tasks)))
+    n_jobs_inner = int(max(1, n_jobs_budget // n_jobs_outer))
+    return {'n_jobs_budget': n_jobs_budget,
+            'n_jobs_outer': n_jobs_outer,
+            'n_jobs_inner': n_jobs_inner}
+
+
+def _set_n_jobs(estimator, n_jobs):
+    # overwrite the number of jobs of learners with built-in parallelism (e.g. random forests)
+    if (n_jobs is not None) and ('n_jobs' in estimator.get_params(deep=False)):
+        estimator = clone(estimator).set_params(n_jobs=n_jobs)
+    return estimator
+
+
+def _thread_limits(n_threads):
+    if n_threads is None:
+        return nullcontext()
+    return threadpool_limits(limits=n_threads)
@@ -0,0 +1,28 @@
+import numpy as np
+
+
+def _check_random_state(random_state):
+    if random_state is None:
+        return
+    if isinstance(random_state, bool) or not isinstance(random_state, (int, np.integer, np.random.SeedSequence)):
+        raise TypeError('random_state must be None, an integer or a numpy.random.SeedSequence. '
+                        f'{str(random_state)} of type {str(type(random_state))} was passed.')
+    if not isinstance(random_state, np.random.SeedSequence) and random_state < 0:
+        raise ValueError('random_state must be non-negative. '
+                         f'{str(random_state)} was passed.')
+    return
+
+
+def _spawn_seeds(random_state, n_children):
+    # independent child seed sequences (e.g. one per repetition); the random streams of the children do not depend
+    # on the order in which they are used, such that they can be consumed in parallel
+    if isinstance(random_state, np.random.SeedSequence):
+        seed_seq = random_state
+    else:
+        seed_seq = np.random.SeedSequence(random_state)
+    return seed_seq.spawn(n_children)
+
+
+def _sklearn_seed(seed_seq):
+    # an integer seed for the random_state parameter of scikit-learn objects
+    return int(seed_seq.generate_state(1)[0])
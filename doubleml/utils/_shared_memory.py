@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+
+import numpy as np
+from joblib import dump, load
+
+
+def _shared_memory_folder():
+    # same convention as joblib: an explicitly set temporary folder is preferred, otherwise use the RAM disk if
+    # available
+    temp_folder = os.environ.get('JOBLIB_TEMP_FOLDER', None)
+    if temp_folder is None:
+        if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+            temp_folder = '/dev/shm'
+        else:
+            temp_folder = tempfile.gettempdir()
+    return tempfile.mkdtemp(prefix='doubleml_', dir=temp_folder)
+
+
+def _is_memmap_backed(arr):
+    while isinstance(arr, np.ndarray):
+        if isinstance(arr, np.memmap):
+            return True
+        arr = arr.base
+    return False
+
+
+def _memory_owner(arr):
+    # the array which owns the memory of a (chain of) view(s)
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+class _SharedArrays:
+    """
+    Fit-scoped store of read-only memory-mapped arrays.
+
+    Every array is dumped once to a temporary folder and all later requests for the same array (same buffer, shape,
+    strides and dtype) return the memory map. Memory-mapped arrays are passed to joblib workers by reference, such
+    that the workers attach to the data without copies. An entry (and its file) is released as soon as the memory
+    of the original array is freed, e.g., the covariates of a treatment variable in the multiple-treatment case are
+    only kept until the next treatment variable is set.
+    """
+    def __init__(self):
+        self._temp_folder = _shared_memory_folder()
+        self._arrays = dict()
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        # memory addresses are process-specific, i.e., only the temporary folder is passed to other processes
+        return {'_temp_folder': self._temp_folder}
+
+    def __setstate__(self, state):
+        self._temp_folder = state['_temp_folder']
+        self._arrays = dict()
+        self._lock = threading.RLock()
+
+    @property
+    def temp_folder(self):
+        return self._temp_folder
+
+    @property
+    def n_arrays(self):
+        return len(self._arrays)
+
+    def share(self, arr):
+        if (not isinstance(arr, np.ndarray)) or arr.dtype.hasobject or _is_memmap_backed(arr):
+            return arr
+        key = (arr.__array_interface__['data'][0], arr.shape, arr.strides, arr.dtype.str)
+        with self._lock:
+            if key not in self._arrays:
+                filename = os.path.join(self._temp_folder, f'array_{uuid.uuid4().hex}.pkl')
+                dump(arr, filename)
+                # the entry is released when the array owning the memory is freed (before its memory address can be
+                # reused by another array)
+                finalizer = weakref.finalize(_memory_owner(arr), self._release, key, filename)
+                self._arrays[key] = (load(filename, mmap_mode='r'), finalizer)
+            return self._arrays[key][0]
+
+    def _release(self, key, filename):
+        with self._lock:
+            self._arrays.pop(key, None)
+        try:
+            # workers which already attached to the memory map keep their mapping
+            os.remove(filename)
+        except OSError:
+            pass
+
+    def close(self):
+        with self._lock:
+            for _, finalizer in self._arrays.values():
+                finalizer.detach()
+            self._arrays = dict()
+        shutil.rmtree(self._temp_folder, ignore_errors=True)
+
+
+@contextmanager
+def _shared_arrays(shared_memory):
+    if not shared_memory:
+        yield None
+    else:
+        shared_arrays = _SharedArrays()
+        try:
+            yield shared_arrays
+        finally:
+            shared_arrays.close()
+
+
+def _share_array(arr, shared_arrays):
+    if shared_arrays is None:
+        return arr
+    return shared_arrays.share(arr)
@@ -0,0 +1,263 @@
+import os
+
+import numpy as np
+
+from ._parallel import _check_executor, _check_n_jobs_budget
+
+
+class DoubleMLFitOptions:
+    """Execution and storage options for :meth:`doubleml.DoubleML.fit`.
+
+    The options are validated once at construction and cannot be changed afterwards; use :meth:`replace` to derive
+    options with some of the values changed.
+
+    Parameters
+    ----------
+    n_jobs_models : None or int
+        The number of CPUs to use to fit the nuisance models for the different repetitions and treatment variables
+        in parallel. Each combination of repetition and treatment variable is fitted as a separate task and the
+        results are combined afterwards. ``None`` means that the combinations are fitted sequentially. For models
+        with nonlinear scores, the root search of every parallel task starts from the same initial value (and not
+        from the value of the previous repetition as in the sequential fit), such that the estimates for
+        ``n_rep > 1`` can differ slightly from the sequential ones.
+        Default is ``None``.
+
+    shared_memory : bool
+        Indicates whether the data arrays should be placed in a shared memory (a temporary folder of memory-mapped
+        files, ``JOBLIB_TEMP_FOLDER`` or ``/dev/shm`` if available) for the duration of the fit. Each array is
+        written once and the parallel workers attach to it without copying the data.
+        Default is ``False``.
+
+    executor : None, str or executor
+        The executor for the parallel tasks, where a task is the fit of one learner on one fold (or the fit of one
+        combination of repetition and treatment variable if ``n_jobs_models`` is not ``None``). Either ``None``
+        (:class:`joblib.Parallel` with the default backend), the name of a registered joblib backend (e.g.
+        ``'loky'`` or ``'threading'``; ``None`` for the number of CPUs then means all CPUs) or an object with a
+        ``submit`` method like a :class:`concurrent.futures.Executor`. The results are always combined in the order
+        of the tasks.
+        Default is ``None``.
+
+    n_jobs_budget : None or int
+        The total number of CPUs (``-1`` means all CPUs). The budget is split between the folds fitted in parallel
+        (replaces ``n_jobs_cv`` of :meth:`doubleml.DoubleML.fit`) and the threads of the learners: the ``n_jobs``
+        parameter of the learners is overwritten and the native thread pools (BLAS, OpenMP) are limited via
+        ``threadpoolctl``. The chosen split is available in ``thread_budget``. Cannot be combined with
+        ``n_jobs_models`` or ``n_jobs_cv``.
+        Default is ``None``.
+
+    checkpoint_dir : None or str
+        A folder to which every completed combination of repetition and treatment variable is written (score
+        elements, predictions of the nuisance functions, fitted models if ``store_models=True`` and the sample
+        splitting). ``None`` means that no checkpoints are written. Without ``resume`` existing checkpoints in the
+        folder are overwritten.
+        Default is ``None``.
+
+    resume : bool
+        Indicates whether a fit should be resumed from ``checkpoint_dir``. Completed combinations of repetition and
+        treatment variable are loaded instead of fitted and the sample splitting of the checkpoint is used. The
+        learners are not compared with the checkpoint, i.e., the model has to be initialized with the same
+        learners as the interrupted fit.
+        Default is ``False``.
+
+    dtype : numpy dtype
+        The storage precision (``np.float64`` or ``np.float32``) of the arrays of shape ``(n_obs, n_rep, n_coefs)``,
+        i.e., the scores, score elements, predictions, targets and sensitivity elements. Means and variances are
+        always accumulated in double precision. For ``np.float32`` the estimates for the score elements in double
+        precision are available in ``dtype_accuracy_report``.
+        Default is ``np.float64``.
+
+    lean : bool
+        Indicates whether only the estimates and standard errors should be stored. The scores, score elements,
+        predictions (``store_predictions`` is ignored) and sensitivity elements are computed for one combination
+        of repetition and treatment variable at a time and released afterwards. With ``n_jobs_models``, every
+        worker solves the score of its combination and only returns the estimate, standard error and RMSEs (and
+        the models for ``store_models``). Methods which require these arrays (e.g. ``bootstrap()``,
+        ``sensitivity_analysis()`` or ``evaluate_learners()``) raise an error.
+        Default is ``False``.
+
+    fold_contiguous : bool
+        Indicates whether the data should be permuted once per repetition such that every fold is a contiguous
+        block. The test sets are then views of the permuted data (instead of copies) and the train sets consist of
+        at most two blocks. For nuisance models fitted on a subsample (e.g. the outcome regressions of the IRM model
+        on the treated and untreated), the observations of every fold are additionally sorted by subsample, such
+        that their train sets consist of one block per fold. The predictions are scattered back to the original
+        order of the observations. Only applies to sample splittings represented by :class:`DoubleMLFolds` (e.g.
+        drawn with ``draw_sample_splitting`` for data without clusters). As the order of the rows passed to the
+        learners changes, learners which depend on the row order (e.g. via random subsampling) can yield slightly
+        different predictions.
+        Default is ``False``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import doubleml as dml
+    >>> from doubleml.datasets import make_plr_CCDDHNR2018
+    >>> from doubleml.utils import DoubleMLFitOptions
+    >>> from sklearn.linear_model import Lasso
+    >>> np.random.seed(3141)
+    >>> obj_dml_data = make_plr_CCDDHNR2018(n_obs=100)
+    >>> dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_rep=2)
+    >>> dml_plr_obj = dml_plr_obj.fit(fit_options=DoubleMLFitOptions(n_jobs_models=2, dtype=np.float32))
+    """
+    _option_names = ('n_jobs_models', 'shared_memory', 'executor', 'n_jobs_budget', 'checkpoint_dir', 'resume',
+                     'dtype', 'lean', 'fold_contiguous')
+
+    def __init__(self, n_jobs_models=None, shared_memory=False, executor=None, n_jobs_budget=None, checkpoint_dir=None,
+                 resume=False, dtype=np.float64, lean=False, fold_contiguous=False):
+        if n_jobs_models is not None:
+            if not isinstance(n_jobs_models, int):
+                raise TypeError('The number of CPUs used to fit the models must be of int type. '
+                                f'{str(n_jobs_models)} of type {str(type(n_jobs_models))} was passed.')
+
+        if not isinstance(shared_memory, bool):
+            raise TypeError('shared_memory must be True or False. '
+                            f'Got {str(shared_memory)}.')
+
+        _check_executor(executor)
+        _check_n_jobs_budget(n_jobs_budget)
+        if (n_jobs_budget is not None) and (n_jobs_models is not None):
+            raise ValueError('n_jobs_budget cannot be combined with n_jobs_cv or n_jobs_models.')
+
+        if checkpoint_dir is not None:
+            if not isinstance(checkpoint_dir, (str, os.PathLike)):
+                raise TypeError('The checkpoint directory must be None, a string or a path-like object. '
+                                f'{str(checkpoint_dir)} of type {str(type(checkpoint_dir))} was passed.')
+        if not isinstance(resume, bool):
+            raise TypeError('resume must be True or False. '
+                            f'Got {str(resume)}.')
+        if resume and (checkpoint_dir is None):
+            raise ValueError('A fit can only be resumed from a checkpoint. Specify checkpoint_dir.')
+
+        valid_dtypes = [np.dtype(np.float64), np.dtype(np.float32)]
+        try:
+            dtype_is_valid = np.dtype(dtype) in valid_dtypes
+        except TypeError:
+            dtype_is_valid = False
+        if not dtype_is_valid:
+            raise ValueError(f'Invalid dtype {str(dtype)}. Valid dtypes are float64 and float32.')
+
+        if not isinstance(lean, bool):
+            raise TypeError('lean must be True or False. '
+                            f'Got {str(lean)}.')
+
+        if not isinstance(fold_contiguous, bool):
+            raise TypeError('fold_contiguous must be True or False. '
+                            f'Got {str(fold_contiguous)}.')
+
+        self._n_jobs_models = n_jobs_models
+        self._shared_memory = shared_memory
+        self._executor = executor
+        self._n_jobs_budget = n_jobs_budget
+        self._checkpoint_dir = checkpoint_dir
+        self._resume = resume
+        self._dtype = np.dtype(dtype)
+        self._lean = lean
+        self._fold_contiguous = fold_contiguous
+
+    def __repr__(self):
+        options = ', '.join([f'{name}={repr(getattr(self, name))}' for name in self._option_names])
+        return f'{self.__class__.__name__}({options})'
+
+    def __eq__(self, other):
+        if not isinstance(other, DoubleMLFitOptions):
+            return NotImplemented
+        return all([getattr(self, name) == getattr(other, name) for name in self._option_names])
+
+    # the options are compared by value and are not used as keys
+    __hash__ = None
+
+    @property
+    def n_jobs_models(self):
+        """
+        The number of CPUs to fit the repetitions and treatment variables in parallel.
+        """
+        return self._n_jobs_models
+
+    @property
+    def shared_memory(self):
+        """
+        Indicates whether the data arrays are placed in a shared memory.
+        """
+        return self._shared_memory
+
+    @property
+    def executor(self):
+        """
+        The executor for the parallel tasks.
+        """
+        return self._executor
+
+    @property
+    def n_jobs_budget(self):
+        """
+        The total number of CPUs.
+        """
+        return self._n_jobs_budget
+
+    @property
+    def checkpoint_dir(self):
+        """
+        The folder for the checkpoints.
+        """
+        return self._checkpoint_dir
+
+    @property
+    def resume(self):
+        """
+        Indicates whether a fit is resumed from ``checkpoint_dir``.
+        """
+        return self._resume
+
+    @property
+    def dtype(self):
+        """
+        The storage precision of the per-observation arrays.
+        """
+        return self._dtype
+
+    @property
+    def lean(self):
+        """
+        Indicates whether only the estimates and standard errors are stored.
+        """
+        return self._lean
+
+    @property
+    def fold_contiguous(self):
+        """
+        Indicates whether the data is permuted such that every fold is a contiguous block.
+        """
+        return self._fold_contiguous
+
+    def replace(self, **kwargs):
+        """
+        Options with some of the values replaced.
+
+        Parameters
+        ----------
+        **kwargs
+            The options to replace (see :class:`DoubleMLFitOptions`).
+
+        Returns
+        -------
+        fit_options : :class:`DoubleMLFitOptions`
+        """
+        invalid_names = set(kwargs.keys()) - set(self._option_names)
+        if len(invalid_names) > 0:
+            raise ValueError('Invalid fit options ' + ', '.join(sorted(invalid_names)) + '. '
+                             'Valid options are ' + ', '.join(self._option_names) + '.')
+        options = {name: getattr(self, name) for name in self._option_names}
+        options.update(kwargs)
+        return self.__class__(**options)
+
+
+def _check_fit_options(fit_options):
+    # fit options can be passed as DoubleMLFitOptions or as a dict of options
+    if fit_options is None:
+        return DoubleMLFitOptions()
+    if isinstance(fit_options, DoubleMLFitOptions):
+        return fit_options
+    if isinstance(fit_options, dict):
+        return DoubleMLFitOptions().replace(**fit_options)
+    raise TypeError('fit_options must be None, a dict or a DoubleMLFitOptions object. '
+                    f'{str(fit_options)} of type {str(type(fit_options))} was passed.')
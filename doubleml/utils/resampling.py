@@ -1,6 +1,221 @@
 import numpy as np
 
-from sklearn.model_selection import KFold, RepeatedKFold, RepeatedStratifiedKFold
+from sklearn.model_selection import KFold, StratifiedKFold, RepeatedKFold, RepeatedStratifiedKFold
+
+from ._random import _check_random_state, _spawn_seeds, _sklearn_seed
+
+
+def _check_index_range(index, n_obs):
+    index = np.asarray(index)
+    if not issubclass(index.dtype.type, np.integer):
+        raise TypeError('Invalid sample split. Indices must be of type integer.')
+    if (len(index) > 0) and ((index.min() < 0) or (index.max() >= n_obs)):
+        raise ValueError('Invalid sample split. Indices must be in [0, n_obs).')
+    return index
+
+
+class DoubleMLFolds:
+    """Sample splitting of one repetition represented by fold ids.
+
+    Every observation belongs to exactly one test set and the train set of a fold consists of all observations of the
+    other folds. Only one integer array of length ``n_obs`` is stored; the train and test indices of a fold are
+    derived on access. The object behaves like a list of ``(train_ind, test_ind)`` tuples and is a scikit-learn
+    cross-validation splitter.
+
+    Parameters
+    ----------
+    fold_ids : :class:`numpy.ndarray`
+        The fold of every observation. Has to be of shape ``(n_obs,)`` with integer values in ``[0, n_folds)``.
+
+    n_folds : int or None
+        The number of folds. ``None`` means ``max(fold_ids) + 1``. Every fold needs to contain at least one
+        observation.
+        Default is ``None``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from doubleml.utils import DoubleMLFolds
+    >>> folds = DoubleMLFolds(np.array([0, 1, 0, 1, 1]))
+    >>> train_ind, test_ind = folds[0]
+    >>> len(folds)
+    2
+    """
+    def __init__(self, fold_ids, n_folds=None):
+        fold_ids = np.asarray(fold_ids)
+        if (fold_ids.ndim != 1) or (not issubclass(fold_ids.dtype.type, np.integer)):
+            raise TypeError('fold_ids must be a one-dimensional array of integers. '
+                            f'Array of dtype {str(fold_ids.dtype)} and shape {str(fold_ids.shape)} was passed.')
+        if fold_ids.shape[0] == 0:
+            raise ValueError('fold_ids must not be empty.')
+        if n_folds is None:
+            n_folds = int(fold_ids.max()) + 1
+        if (not isinstance(n_folds, (int, np.integer))) or (n_folds < 1):
+            raise ValueError('The number of folds must be a positive integer. '
+                             f'{str(n_folds)} was passed.')
+        if (fold_ids.min() < 0) or (fold_ids.max() >= n_folds):
+            raise ValueError(f'Invalid fold ids. All fold ids must be in [0, {n_folds}).')
+        fold_sizes = np.bincount(fold_ids, minlength=n_folds)
+        if np.any(fold_sizes == 0):
+            raise ValueError('Invalid fold ids. Every fold must contain at least one observation.')
+
+        # the smallest integer type suffices to store the fold ids
+        self._fold_ids = fold_ids.astype(np.min_scalar_type(n_folds - 1))
+        self._fold_ids.setflags(write=False)
+        self._n_folds = int(n_folds)
+        self._fold_sizes = fold_sizes
+
+    @classmethod
+    def from_smpls(cls, smpls, n_obs):
+        """
+        Construct the fold ids from a list of ``(train_ind, test_ind)`` tuples.
+
+        Parameters
+        ----------
+        smpls : list
+            A list of tuples ``(train_ind, test_ind)``. The test sets need to form a partition of ``range(n_obs)``
+            and the train set of every fold has to be the complement of its test set.
+
+        n_obs : int
+            The number of observations.
+
+        Returns
+        -------
+        folds : :class:`DoubleMLFolds`
+        """
+        if isinstance(smpls, cls):
+            return smpls
+        fold_ids = np.full(n_obs, -1, dtype=np.int64)
+        for i_fold, (_, test_index) in enumerate(smpls):
+            test_index = _check_index_range(test_index, n_obs)
+            if np.any(fold_ids[test_index] != -1):
+                raise ValueError('Invalid sample split. The test sets do not form a partition.')
+            fold_ids[test_index] = i_fold
+        if np.any(fold_ids == -1):
+            raise ValueError('Invalid sample split. The test sets do not form a partition.')
+        folds = cls(fold_ids, n_folds=len(smpls))
+        for i_fold, (train_index, _) in enumerate(smpls):
+            train_index = _check_index_range(train_index, n_obs)
+            is_train = np.zeros(n_obs, dtype=bool)
+            is_train[train_index] = True
+            if (len(train_index) != n_obs - folds._fold_sizes[i_fold]) or \
+                    np.any(is_train == (folds._fold_ids == i_fold)):
+                raise ValueError('Invalid sample split. The train set of every fold has to be the complement of '
+                                 'its test set.')
+        return folds
+
+    @property
+    def fold_ids(self):
+        """
+        The fold of every observation (read-only).
+        """
+        return self._fold_ids
+
+    @property
+    def n_folds(self):
+        """
+        Number of folds.
+        """
+        return self._n_folds
+
+    @property
+    def n_obs(self):
+        """
+        Number of observations.
+        """
+        return self._fold_ids.shape[0]
+
+    def test_index(self, i_fold):
+        """
+        The (sorted) test indices of a fold.
+        """
+        return np.flatnonzero(self._fold_ids == i_fold)
+
+    def train_index(self, i_fold):
+        """
+        The (sorted) train indices of a fold.
+        """
+        return np.flatnonzero(self._fold_ids != i_fold)
+
+    def cond_train_index(self, i_fold, subset):
+        """
+        The (sorted) train indices of a fold restricted to a boolean subset of the observations.
+        """
+        return np.flatnonzero((self._fold_ids != i_fold) & subset)
+
+    def __len__(self):
+        return self._n_folds
+
+    def __getitem__(self, i_fold):
+        if isinstance(i_fold, slice):
+            return [self[i] for i in range(self._n_folds)[i_fold]]
+        i_fold = range(self._n_folds)[i_fold]
+        return self.train_index(i_fold), self.test_index(i_fold)
+
+    def __iter__(self):
+        for i_fold in range(self._n_folds):
+            yield self.train_index(i_fold), self.test_index(i_fold)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(n_obs={self.n_obs}, n_folds={self.n_folds})'
+
+    def split(self, X=None, y=None, groups=None):
+        """
+        Generate the train and test indices of all folds (scikit-learn splitter interface).
+        """
+        return iter(self)
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        """
+        Number of folds (scikit-learn splitter interface).
+        """
+        return self._n_folds
+
+
+def _as_folds(smpls, n_obs):
+    # validated partitions whose train sets are the complements of the test sets are stored as fold ids; other sample
+    # splittings (e.g. train sets which are subsets of the complements) keep the list representation
+    try:
+        return DoubleMLFolds.from_smpls(smpls, n_obs)
+    except ValueError:
+        return smpls
+
+
+class _DoubleMLCondFolds:
+    # sample splitting of one repetition where the train sets are restricted to the observations of one group (e.g.
+    # the treated for the outcome regression of the treated); the conditional splittings of all groups share the fold
+    # ids and the array of groups, such that they can be fitted on one fold-contiguous layout of the data
+    def __init__(self, folds, groups, group):
+        self.folds = folds
+        self.groups = groups
+        self.group = group
+
+    @property
+    def n_folds(self):
+        return self.folds.n_folds
+
+    @property
+    def n_obs(self):
+        return self.folds.n_obs
+
+    def train_index(self, i_fold):
+        return self.folds.cond_train_index(i_fold, self.groups == self.group)
+
+    def test_index(self, i_fold):
+        return self.folds.test_index(i_fold)
+
+    def __len__(self):
+        return self.folds.n_folds
+
+    def __getitem__(self, i_fold):
+        if isinstance(i_fold, slice):
+            return [self[i] for i in range(self.n_folds)[i_fold]]
+        i_fold = range(self.n_folds)[i_fold]
+        return self.train_index(i_fold), self.test_index(i_fold)
+
+    def __iter__(self):
+        for i_fold in range(self.n_folds):
+            yield self.train_index(i_fold), self.test_index(i_fold)
 
 
 class DoubleMLResampling:
@@ -8,11 +223,14 @@ class DoubleMLResampling:
                  n_folds,
                  n_rep,
                  n_obs,
-                 stratify=None):
+                 stratify=None,
+                 random_state=None):
         self.n_folds = n_folds
         self.n_rep = n_rep
         self.n_obs = n_obs
         self.stratify = stratify
+        _check_random_state(random_state)
+        self.random_state = random_state
 
         if n_folds < 2:
             raise ValueError('n_folds must be greater than 1. '
@@ -23,10 +241,24 @@ class DoubleMLResampling:
         else:
             self.resampling = RepeatedStratifiedKFold(n_splits=n_folds, n_repeats=n_rep)
 
+    def _split_repetitions(self):
+        # the splits of all repetitions; with a random_state every repetition is split with the seed of its own child
+        # random stream (independent of the other repetitions), otherwise the global random state is used
+        if self.random_state is None:
+            return self.resampling.split(X=np.zeros(self.n_obs), y=self.stratify)
+        resampling_class = KFold if self.stratify is None else StratifiedKFold
+        return (smpl
+                for seed in _spawn_seeds(self.random_state, self.n_rep)
+                for smpl in resampling_class(n_splits=self.n_folds, shuffle=True,
+                                             random_state=_sklearn_seed(seed)).split(X=np.zeros(self.n_obs),
+                                                                                     y=self.stratify))
+
     def split_samples(self):
-        all_smpls = [(train, test) for train, test in self.resampling.split(X=np.zeros(self.n_obs), y=self.stratify)]
-        smpls = [all_smpls[(i_repeat * self.n_folds):((i_repeat + 1) * self.n_folds)]
-                 for i_repeat in range(self.n_rep)]
+        # the test sets of every repetition form a partition and are stored as fold ids
+        fold_ids = np.zeros((self.n_rep, self.n_obs), dtype=np.int64)
+        for i_split, (_, test) in enumerate(self._split_repetitions()):
+            fold_ids[i_split // self.n_folds, test] = i_split % self.n_folds
+        smpls = [DoubleMLFolds(fold_ids[i_repeat], n_folds=self.n_folds) for i_repeat in range(self.n_rep)]
         return smpls
 
 
@@ -36,11 +268,14 @@ class DoubleMLClusterResampling:
                  n_rep,
                  n_obs,
                  n_cluster_vars,
-                 cluster_vars):
+                 cluster_vars,
+                 random_state=None):
 
         self.n_folds = n_folds
         self.n_rep = n_rep
         self.n_obs = n_obs
+        _check_random_state(random_state)
+        self.random_state = random_state
 
         assert cluster_vars.shape[0] == n_obs
         assert cluster_vars.shape[1] == n_cluster_vars
@@ -49,39 +284,61 @@ class DoubleMLClusterResampling:
         self.resampling = KFold(n_splits=n_folds, shuffle=True)
 
     def split_samples(self):
+        # the cluster variables are factorized once; the folds of the observations are then derived from integer
+        # fold codes of the clusters
+        clusters = list()
+        cluster_codes = list()
+        for i_var in range(self.n_cluster_vars):
+            this_clusters, this_cluster_codes = np.unique(self.cluster_vars[:, i_var], return_inverse=True)
+            clusters.append(this_clusters)
+            cluster_codes.append(this_cluster_codes.reshape(-1))
+        # the cartesian product of the folds
+        cart = np.array(np.meshgrid(*[np.arange(self.n_folds)
+                                      for i in range(self.n_cluster_vars)])).T.reshape(-1, self.n_cluster_vars)
+
+        # with a random_state every repetition and cluster variable has its own child random stream
+        if self.random_state is None:
+            var_resamplings = [[self.resampling] * self.n_cluster_vars] * self.n_rep
+        else:
+            var_resamplings = [[KFold(n_splits=self.n_folds, shuffle=True, random_state=_sklearn_seed(var_seed))
+                                for var_seed in rep_seed.spawn(self.n_cluster_vars)]
+                               for rep_seed in _spawn_seeds(self.random_state, self.n_rep)]
+
         all_smpls = []
         all_smpls_cluster = []
-        for _ in range(self.n_rep):
+        for i_rep in range(self.n_rep):
             smpls_cluster_vars = []
+            obs_fold_codes = []
             for i_var in range(self.n_cluster_vars):
-                this_cluster_var = self.cluster_vars[:, i_var]
-                clusters = np.unique(this_cluster_var)
-                n_clusters = len(clusters)
-                smpls_cluster_vars.append([(clusters[train], clusters[test])
-                                           for train, test in self.resampling.split(np.zeros(n_clusters))])
+                n_clusters = len(clusters[i_var])
+                this_smpls_cluster = list(var_resamplings[i_rep][i_var].split(np.zeros(n_clusters)))
+                cluster_fold_codes = np.empty(n_clusters, dtype=np.intp)
+                for i_fold, (_, test) in enumerate(this_smpls_cluster):
+                    cluster_fold_codes[test] = i_fold
+                smpls_cluster_vars.append([(clusters[i_var][train], clusters[i_var][test])
+                                           for train, test in this_smpls_cluster])
+                obs_fold_codes.append(cluster_fold_codes[cluster_codes[i_var]])
+
+            # the test sets are the observations with the same combination of fold codes
+            combined_fold_codes = np.ravel_multi_index(obs_fold_codes, (self.n_folds,) * self.n_cluster_vars)
+            obs_order = np.argsort(combined_fold_codes, kind='stable')
+            combination_bounds = np.searchsorted(combined_fold_codes[obs_order],
+                                                 np.arange(self.n_folds ** self.n_cluster_vars + 1))
 
             smpls = []
             smpls_cluster = []
-            # build the cartesian product
-            cart = np.array(np.meshgrid(*[np.arange(self.n_folds)
-                                          for i in range(self.n_cluster_vars)])).T.reshape(-1, self.n_cluster_vars)
             for i_smpl in range(cart.shape[0]):
                 ind_train = np.full(self.n_obs, True)
-                ind_test = np.full(self.n_obs, True)
-                this_cluster_smpl_train = []
-                this_cluster_smpl_test = []
                 for i_var in range(self.n_cluster_vars):
-                    i_fold = cart[i_smpl, i_var]
-                    train_clusters = smpls_cluster_vars[i_var][i_fold][0]
-                    test_clusters = smpls_cluster_vars[i_var][i_fold][1]
-                    this_cluster_smpl_train.append(train_clusters)
-                    this_cluster_smpl_test.append(test_clusters)
-                    ind_train = ind_train & np.in1d(self.cluster_vars[:, i_var], train_clusters)
-                    ind_test = ind_test & np.in1d(self.cluster_vars[:, i_var], test_clusters)
-                train_set = np.arange(self.n_obs)[ind_train]
-                test_set = np.arange(self.n_obs)[ind_test]
+                    ind_train &= obs_fold_codes[i_var] != cart[i_smpl, i_var]
+                i_combination = np.ravel_multi_index(tuple(cart[i_smpl, :]), (self.n_folds,) * self.n_cluster_vars)
+                train_set = np.flatnonzero(ind_train)
+                test_set = obs_order[combination_bounds[i_combination]:combination_bounds[i_combination + 1]]
                 smpls.append((train_set, test_set))
-                smpls_cluster.append((this_cluster_smpl_train, this_cluster_smpl_test))
+                smpls_cluster.append(([smpls_cluster_vars[i_var][cart[i_smpl, i_var]][0]
+                                       for i_var in range(self.n_cluster_vars)],
+                                      [smpls_cluster_vars[i_var][cart[i_smpl, i_var]][1]
+                                       for i_var in range(self.n_cluster_vars)]))
             all_smpls.append(smpls)
             all_smpls_cluster.append(smpls_cluster)
 
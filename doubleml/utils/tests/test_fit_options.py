@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils import DoubleMLFitOptions
+
+
+@pytest.mark.ci
+def test_fit_options_dict_and_object():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+
+    dml_plr_dict = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_rep=2)
+    assert dml_plr_dict.fit_options is None
+    dml_plr_dict.fit(fit_options={'n_jobs_models': 2, 'dtype': np.float32})
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, Lasso(alpha=0.05), Lasso(alpha=0.05), n_rep=2)
+    dml_plr_obj.set_sample_splitting(dml_plr_dict.smpls)
+    fit_options = DoubleMLFitOptions(n_jobs_models=2, dtype=np.float32)
+    dml_plr_obj.fit(fit_options=fit_options)
+
+    assert dml_plr_dict.fit_options == fit_options
+    assert dml_plr_obj.fit_options is fit_options
+    assert np.array_equal(dml_plr_dict.all_coef, dml_plr_obj.all_coef)
+
+    dml_plr_obj.fit()
+    assert dml_plr_obj.fit_options == DoubleMLFitOptions()
+
+
+@pytest.mark.ci
+def test_fit_options_replace():
+    fit_options = DoubleMLFitOptions(n_jobs_models=2, lean=True)
+    fit_options_replaced = fit_options.replace(n_jobs_models=None, n_jobs_budget=4)
+    assert fit_options_replaced == DoubleMLFitOptions(n_jobs_budget=4, lean=True)
+    assert fit_options.n_jobs_models == 2
+    assert fit_options.n_jobs_budget is None
+
+
+@pytest.mark.ci
+def test_fit_options_exceptions():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso())
+
+    msg = ("fit_options must be None, a dict or a DoubleMLFitOptions object. 2 of type <class 'int'> was passed.")
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(fit_options=2)
+    msg = 'Invalid fit options n_jobs. Valid options are n_jobs_models, shared_memory, executor'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(fit_options={'n_jobs': 2})
+    msg = 'n_jobs_budget cannot be combined with n_jobs_cv or n_jobs_models.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFitOptions(n_jobs_models=2, n_jobs_budget=2)
+
+    dml_data_irm = make_irm_data(theta=0.5, n_obs=200, dim_x=5)
+    dml_qte = dml.DoubleMLQTE(dml_data_irm, LogisticRegression(), LogisticRegression(), quantiles=[0.5])
+    msg = 'Only the fit options executor and n_jobs_budget are implemented for DoubleMLQTE.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_qte.fit(fit_options={'lean': True})
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso
+from sklearn.model_selection import RepeatedKFold, RepeatedStratifiedKFold
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018
+from doubleml.utils import DoubleMLResampling, DoubleMLClusterResampling, DoubleMLFolds
+from doubleml.utils._checks import _check_is_partition, _check_finite_predictions
+from doubleml.utils._estimation import _get_cond_smpls, _get_cond_smpls_2d
+
+
+@pytest.fixture(scope='module',
+                params=[False, True])
+def stratify(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_resampling_fold_ids(stratify):
+    n_obs, n_folds, n_rep = 101, 4, 3
+    strata = np.tile([0, 1], 51)[:n_obs] if stratify else None
+
+    np.random.seed(3141)
+    smpls = DoubleMLResampling(n_folds=n_folds, n_rep=n_rep, n_obs=n_obs, stratify=strata).split_samples()
+    np.random.seed(3141)
+    if stratify:
+        resampling = RepeatedStratifiedKFold(n_splits=n_folds, n_repeats=n_rep)
+    else:
+        resampling = RepeatedKFold(n_splits=n_folds, n_repeats=n_rep)
+    smpls_sklearn = list(resampling.split(X=np.zeros(n_obs), y=strata))
+
+    assert len(smpls) == n_rep
+    for i_rep in range(n_rep):
+        assert isinstance(smpls[i_rep], DoubleMLFolds)
+        assert smpls[i_rep].fold_ids.dtype == np.uint8
+        assert len(smpls[i_rep]) == n_folds
+        for i_fold, (train, test) in enumerate(smpls[i_rep]):
+            train_sklearn, test_sklearn = smpls_sklearn[i_rep * n_folds + i_fold]
+            assert np.array_equal(train, train_sklearn)
+            assert np.array_equal(test, test_sklearn)
+
+
+@pytest.mark.ci
+def test_doubleml_folds():
+    fold_ids = np.array([0, 1, 2, 0, 1, 2, 2])
+    folds = DoubleMLFolds(fold_ids)
+    assert folds.n_obs == 7
+    assert folds.n_folds == 3
+    assert np.array_equal(folds[1][0], [0, 2, 3, 5, 6])
+    assert np.array_equal(folds[-1][1], [2, 5, 6])
+    assert len(folds[:2]) == 2
+    assert isinstance(folds[0], tuple)
+    assert len(list(folds.split())) == 3
+    assert folds.get_n_splits() == 3
+    assert not folds.fold_ids.flags.writeable
+
+    folds_from_smpls = DoubleMLFolds.from_smpls(list(folds), n_obs=7)
+    assert np.array_equal(folds_from_smpls.fold_ids, fold_ids)
+
+    # fast paths of the checks and conditional samples
+    assert _check_is_partition(folds, 7)
+    assert not _check_is_partition(folds, 8)
+    bin_var1 = np.array([0, 1, 1, 0, 1, 0, 1])
+    bin_var2 = np.array([1, 1, 0, 0, 1, 0, 0])
+    for res_folds, res_list in zip(_get_cond_smpls(folds, bin_var1) + _get_cond_smpls_2d(folds, bin_var1, bin_var2),
+                                   _get_cond_smpls(list(folds), bin_var1) +
+                                   _get_cond_smpls_2d(list(folds), bin_var1, bin_var2)):
+        for (train, test), (train_list, test_list) in zip(res_folds, res_list):
+            assert np.array_equal(train, train_list)
+            assert np.array_equal(test, test_list)
+    msg = 'Predictions from learner a for ml_g are not finite.'
+    with pytest.raises(ValueError, match=msg):
+        _check_finite_predictions(np.array([0., 1., np.inf, 0., 1., 0., 1.]), 'a', 'ml_g', folds)
+
+
+@pytest.mark.ci
+def test_doubleml_folds_exceptions():
+    msg = 'fold_ids must be a one-dimensional array of integers.'
+    with pytest.raises(TypeError, match=msg):
+        DoubleMLFolds(np.array([0., 1.]))
+    with pytest.raises(TypeError, match=msg):
+        DoubleMLFolds(np.array([[0, 1]]))
+    msg = r'Invalid fold ids. All fold ids must be in \[0, 2\).'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFolds(np.array([0, 1, 2]), n_folds=2)
+    msg = 'Invalid fold ids. Every fold must contain at least one observation.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFolds(np.array([0, 2, 2]))
+
+    msg = 'Invalid sample split. The test sets do not form a partition.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFolds.from_smpls([(np.array([2, 3]), np.array([0, 1])), (np.array([0, 1]), np.array([1, 2]))], 4)
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFolds.from_smpls([(np.array([2, 3]), np.array([0, 1])), (np.array([0, 1]), np.array([2]))], 4)
+    msg = 'Invalid sample split. The train set of every fold has to be the complement of its test set.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFolds.from_smpls([(np.array([2]), np.array([0, 1])), (np.array([0, 1]), np.array([2, 3]))], 4)
+    msg = r'Invalid sample split. Indices must be in \[0, n_obs\).'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFolds.from_smpls([(np.array([2, 3]), np.array([0, -1])), (np.array([0, 1]), np.array([2, 3]))], 4)
+
+
+@pytest.mark.ci
+def test_set_sample_splitting_folds():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=3, n_rep=2)
+    dml_plr_folds = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), draw_sample_splitting=False)
+    # smpls returns the lists of (train_ind, test_ind) tuples, which are stored as fold ids again
+    assert all([isinstance(smpl, list) and isinstance(smpl[0], tuple) for smpl in dml_plr.smpls])
+    assert all([isinstance(smpl, DoubleMLFolds) for smpl in dml_plr.smpls_folds])
+    dml_plr_folds.set_sample_splitting(dml_plr.smpls)
+    assert (dml_plr_folds.n_rep, dml_plr_folds.n_folds) == (2, 3)
+    for smpl, smpl_folds in zip(dml_plr.smpls_folds, dml_plr_folds.smpls_folds):
+        assert isinstance(smpl_folds, DoubleMLFolds)
+        assert np.array_equal(smpl.fold_ids, smpl_folds.fold_ids)
+    dml_plr.fit()
+    dml_plr_folds.fit()
+    assert np.array_equal(dml_plr.all_coef, dml_plr_folds.all_coef)
+
+    dml_plr_folds.set_sample_splitting(DoubleMLFolds(np.arange(100) % 4))
+    assert (dml_plr_folds.n_rep, dml_plr_folds.n_folds) == (1, 4)
+    msg = 'Invalid sample split. The fold ids are defined for 10 observations but the data has 100 observations.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_folds.set_sample_splitting([DoubleMLFolds(np.arange(10) % 2)])
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('n_cluster_vars', [1, 2])
+def test_cluster_resampling(n_cluster_vars):
+    n_obs, n_folds = 300, 3
+    np.random.seed(3141)
+    cluster_vars = np.column_stack((np.random.randint(0, 20, size=n_obs) * 1.5,
+                                    np.random.randint(-5, 10, size=n_obs)))[:, :n_cluster_vars]
+    resampling = DoubleMLClusterResampling(n_folds=n_folds, n_rep=2, n_obs=n_obs, n_cluster_vars=n_cluster_vars,
+                                           cluster_vars=cluster_vars)
+    all_smpls, all_smpls_cluster = resampling.split_samples()
+
+    for smpls, smpls_cluster in zip(all_smpls, all_smpls_cluster):
+        assert len(smpls) == n_folds ** n_cluster_vars
+        for (train, test), (train_clusters, test_clusters) in zip(smpls, smpls_cluster):
+            ind_train = np.all([np.isin(cluster_vars[:, i_var], train_clusters[i_var])
+                                for i_var in range(n_cluster_vars)], axis=0)
+            ind_test = np.all([np.isin(cluster_vars[:, i_var], test_clusters[i_var])
+                               for i_var in range(n_cluster_vars)], axis=0)
+            assert np.array_equal(train, np.arange(n_obs)[ind_train])
+            assert np.array_equal(test, np.arange(n_obs)[ind_test])
+        # every observation is in exactly one test set
+        assert np.array_equal(np.sort(np.concatenate([test for _, test in smpls])), np.arange(n_obs))